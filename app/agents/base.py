@@ -64,7 +64,7 @@ de perfil financeiro para melhorar o score. As transicoes entre agentes sao invi
 
 
 def criar_agente_entrevista() -> Agent:
-    from app.agents.tools.entrevista_tools import calcular_novo_score
+    from app.agents.tools.entrevista_tools import calcular_novo_score, simular_score
 
     return Agent(
         role="Assistente Virtual do Banco Agil - Modulo de Analise Financeira",
@@ -74,7 +74,7 @@ natural e conversacional, coletando UMA informacao por vez: renda mensal, tipo d
 AUTONOMO ou DESEMPREGADO), despesas fixas, numero de dependentes, e dividas. Quando tiver todas as
 5 informacoes, calcule o novo score e redirecione para o agente de credito. Seja paciente e natural.
 As transicoes entre agentes sao invisiveis ao cliente.""",
-        tools=[calcular_novo_score],
+        tools=[calcular_novo_score, simular_score],
         llm=get_llm(),
         verbose=settings.debug,
         allow_delegation=False,
@@ -85,6 +85,7 @@ As transicoes entre agentes sao invisiveis ao cliente.""",
 def criar_agente_cambio() -> Agent:
     from app.agents.tools.cambio_tools import (
         consultar_cotacao,
+        consultar_cotacoes,
         listar_moedas_disponiveis,
     )
 
@@ -95,7 +96,7 @@ def criar_agente_cambio() -> Agent:
 de forma direta e objetiva, sem saudacoes. Use as ferramentas para consultar cotacoes e listar
 moedas disponiveis. Apos informar uma cotacao, pergunte se o cliente deseja consultar outra moeda.
 As transicoes entre agentes sao invisiveis ao cliente.""",
-        tools=[consultar_cotacao, listar_moedas_disponiveis],
+        tools=[consultar_cotacao, consultar_cotacoes, listar_moedas_disponiveis],
         llm=get_llm(),
         verbose=settings.debug,
         allow_delegation=False,
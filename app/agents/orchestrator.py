@@ -1,4 +1,4 @@
-import logging
+import asyncio
 import re
 import time
 from pathlib import Path
@@ -17,9 +17,10 @@ from app.agents.tools.context import (
     reset_contexto,
     set_contexto,
 )
+from app.eventos import obter_eventos
 from app.memory import ChatMemory, get_memory
 
-logger = logging.getLogger(__name__)
+eventos = obter_eventos("orquestrador")
 
 
 def carregar_prompt(tipo_agente: TipoAgente) -> str:
@@ -63,7 +64,7 @@ class AgentOrchestrator:
         if self.conversation_id:
             agent_id = self.agente_atual_tipo.value
             self.memory = get_memory(agent_id, self.conversation_id)
-            logger.debug(f"Memory initialized for conversation {self.conversation_id}")
+            eventos.debug("memoria.inicializada", conversa=self.conversation_id)
 
     def registrar_todos_agentes(self) -> None:
         self.agentes[TipoAgente.TRIAGEM] = criar_agente_triagem()
@@ -125,11 +126,10 @@ Tentativas de auth: {self.contexto.tentativas_auth}/3"""
     def _salvar_memoria(self, mensagem_user: str, resposta_ai: str) -> None:
         if self.memory:
             try:
-                self.memory.add_user_message(mensagem_user)
-                self.memory.add_ai_message(resposta_ai)
-                logger.debug(f"Messages saved for conversation {self.conversation_id}")
+                self.memory.add_turn(mensagem_user, resposta_ai)
+                eventos.debug("memoria.mensagens_salvas", conversa=self.conversation_id)
             except Exception as e:
-                logger.error(f"Error saving to memory: {e}")
+                eventos.error("memoria.erro_ao_salvar", conversa=self.conversation_id, erro=e)
 
     async def processar_mensagem(self, mensagem: str) -> str:
         if self.atendimento_encerrado:
@@ -141,15 +141,23 @@ Tentativas de auth: {self.contexto.tentativas_auth}/3"""
 
         agente = self._get_agente_atual()
 
-        logger.info(f"=" * 60)
-        logger.info(f"[ORQUESTRADOR] Agente atual: {self.agente_atual_tipo.value}")
-        logger.info(f"[ORQUESTRADOR] Mensagem recebida: {mensagem[:100]}...")
-        logger.info(f"[ORQUESTRADOR] Cliente: {self.contexto.nome_cliente} | Score: {self.contexto.score}")
-        logger.info(f"[ORQUESTRADOR] Dados extras: {self.contexto.dados_extras}")
+        eventos.info(
+            "turno.inicio",
+            conversa=self.conversation_id,
+            agente=self.agente_atual_tipo.value,
+            score=self.contexto.score,
+        )
+        eventos.debug(
+            "turno.contexto",
+            conversa=self.conversation_id,
+            mensagem=mensagem,
+            cliente=self.contexto.nome_cliente,
+            dados_extras=self.contexto.dados_extras,
+        )
 
         task_description = self._build_task_description(mensagem)
 
-        logger.debug(f"[ORQUESTRADOR] Task description:\n{task_description[:500]}...")
+        eventos.debug("turno.task", conversa=self.conversation_id, descricao=task_description)
 
         task = Task(
             description=task_description,
@@ -165,19 +173,25 @@ Tentativas de auth: {self.contexto.tentativas_auth}/3"""
         )
 
         try:
-            logger.info(f"[ORQUESTRADOR] Iniciando execucao do Crew...")
             inicio = time.time()
-            result = crew.kickoff()
+            # O kickoff é síncrono e chama as tools, que podem esperar buscas de
+            # câmbio conduzidas no event loop; por isso roda em outra thread.
+            result = await asyncio.to_thread(crew.kickoff)
             fim = time.time()
             resposta = str(result)
-            logger.info(f"[ORQUESTRADOR] Crew executado em {fim - inicio:.2f}s")
-            logger.info(f"[ORQUESTRADOR] Resposta bruta: {resposta[:200]}...")
+            eventos.info(
+                "crew.executado",
+                conversa=self.conversation_id,
+                agente=self.agente_atual_tipo.value,
+                segundos=fim - inicio,
+            )
+            eventos.debug("crew.resposta_bruta", conversa=self.conversation_id, resposta=resposta)
         except Exception as e:
-            logger.error(f"[ORQUESTRADOR] Erro ao executar crew: {e}")
+            eventos.error("crew.erro", conversa=self.conversation_id, erro=e)
             resposta = "Desculpe, ocorreu um erro no processamento. Por favor, tente novamente."
 
         if self._detectar_encerramento(resposta):
-            logger.info(f"[ORQUESTRADOR] Encerramento detectado")
+            eventos.info("turno.encerramento", conversa=self.conversation_id)
             self.atendimento_encerrado = True
             resposta = self._limpar_tags_resposta(resposta)
             self.contexto.adicionar_mensagem("assistant", resposta)
@@ -186,7 +200,12 @@ Tentativas de auth: {self.contexto.tentativas_auth}/3"""
 
         novo_agente = self._detectar_redirecionamento(resposta)
         if novo_agente:
-            logger.info(f"[ORQUESTRADOR] Redirecionamento detectado: {self.agente_atual_tipo.value} -> {novo_agente.value}")
+            eventos.info(
+                "turno.redirecionamento",
+                conversa=self.conversation_id,
+                de=self.agente_atual_tipo.value,
+                para=novo_agente.value,
+            )
             resposta_limpa = self._limpar_tags_resposta(resposta)
             agente_anterior = self.agente_atual_tipo
             self.agente_atual_tipo = novo_agente
@@ -197,13 +216,9 @@ Tentativas de auth: {self.contexto.tentativas_auth}/3"""
                 self.contexto.adicionar_mensagem("assistant", resposta_limpa)
                 self._salvar_memoria(mensagem, resposta_limpa)
 
-            logger.info(f"[ORQUESTRADOR] Reprocessando automaticamente com novo agente...")
             return await self._processar_com_novo_agente(mensagem)
-        else:
-            logger.info(f"[ORQUESTRADOR] Nenhum redirecionamento detectado")
 
-        logger.info(f"[ORQUESTRADOR] Resposta final: {resposta[:150]}...")
-        logger.info(f"=" * 60)
+        eventos.debug("turno.resposta_final", conversa=self.conversation_id, resposta=resposta)
 
         self.contexto.adicionar_mensagem("assistant", resposta)
         self._salvar_memoria(mensagem, resposta)
@@ -212,13 +227,17 @@ Tentativas de auth: {self.contexto.tentativas_auth}/3"""
     async def _processar_com_novo_agente(self, mensagem: str) -> str:
         set_contexto(self.contexto)
 
-        logger.info(f"[NOVO_AGENTE] Processando com agente: {self.agente_atual_tipo.value}")
-        logger.info(f"[NOVO_AGENTE] Dados extras: {self.contexto.dados_extras}")
+        eventos.info(
+            "turno.novo_agente", conversa=self.conversation_id, agente=self.agente_atual_tipo.value
+        )
+        eventos.debug(
+            "turno.contexto", conversa=self.conversation_id, dados_extras=self.contexto.dados_extras
+        )
 
         agente = self._get_agente_atual()
         task_description = self._build_task_description(mensagem)
 
-        logger.debug(f"[NOVO_AGENTE] Task description:\n{task_description[:500]}...")
+        eventos.debug("turno.task", conversa=self.conversation_id, descricao=task_description)
 
         task = Task(
             description=task_description,
@@ -234,20 +253,24 @@ Tentativas de auth: {self.contexto.tentativas_auth}/3"""
         )
 
         try:
-            logger.info(f"[NOVO_AGENTE] Iniciando execucao do Crew...")
             inicio = time.time()
-            result = crew.kickoff()
+            result = await asyncio.to_thread(crew.kickoff)
             fim = time.time()
             resposta = str(result)
-            logger.info(f"[NOVO_AGENTE] Crew executado em {fim - inicio:.2f}s")
-            logger.info(f"[NOVO_AGENTE] Resposta bruta: {resposta[:200]}...")
+            eventos.info(
+                "crew.executado",
+                conversa=self.conversation_id,
+                agente=self.agente_atual_tipo.value,
+                segundos=fim - inicio,
+            )
+            eventos.debug("crew.resposta_bruta", conversa=self.conversation_id, resposta=resposta)
         except Exception as e:
-            logger.error(f"[NOVO_AGENTE] Erro ao executar crew: {e}")
+            eventos.error("crew.erro", conversa=self.conversation_id, erro=e)
             resposta = "Desculpe, ocorreu um erro no processamento. Por favor, tente novamente."
 
         resposta = self._limpar_tags_resposta(resposta)
 
-        logger.info(f"[NOVO_AGENTE] Resposta final: {resposta[:150]}...")
+        eventos.debug("turno.resposta_final", conversa=self.conversation_id, resposta=resposta)
 
         self.contexto.adicionar_mensagem("assistant", resposta)
         self._salvar_memoria(mensagem, resposta)
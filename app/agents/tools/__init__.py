@@ -7,9 +7,10 @@ from app.agents.tools.credito_tools import (
     solicitar_aumento_limite,
     obter_limite_maximo,
 )
-from app.agents.tools.entrevista_tools import calcular_novo_score
+from app.agents.tools.entrevista_tools import calcular_novo_score, simular_score
 from app.agents.tools.cambio_tools import (
     consultar_cotacao,
+    consultar_cotacoes,
     listar_moedas_disponiveis,
 )
 
@@ -23,7 +24,9 @@ __all__ = [
     "obter_limite_maximo",
     # Entrevista
     "calcular_novo_score",
+    "simular_score",
     # Cambio
     "consultar_cotacao",
+    "consultar_cotacoes",
     "listar_moedas_disponiveis",
 ]
@@ -1,11 +1,42 @@
 """Tools para o Agente de Cambio."""
 
+import re
+
 from crewai.tools import tool
 
-from app.services.cambio_service import CambioAPIIndisponivelError, CambioService
+from app.services.cambio_service import (
+    MOEDAS_DISPONIVEIS,
+    CambioAPIIndisponivelError,
+    CambioService,
+)
 
 _cambio_service = CambioService()
 
+_MAPEAMENTO_MOEDAS = {
+    "dolar": "USD",
+    "dollar": "USD",
+    "dolar americano": "USD",
+    "euro": "EUR",
+    "libra": "GBP",
+    "pound": "GBP",
+    "libra esterlina": "GBP",
+    "peso argentino": "ARS",
+    "peso": "ARS",
+    "dolar canadense": "CAD",
+    "dolar australiano": "AUD",
+    "iene": "JPY",
+    "yen": "JPY",
+    "franco suico": "CHF",
+    "franco": "CHF",
+    "yuan": "CNY",
+    "bitcoin": "BTC",
+    "real": "BRL",
+}
+
+
+def _codigo_moeda(moeda: str) -> str:
+    return _MAPEAMENTO_MOEDAS.get(moeda.lower().strip(), moeda.upper().strip())
+
 
 @tool("consultar_cotacao")
 def consultar_cotacao(moeda: str) -> str:
@@ -15,50 +46,52 @@ def consultar_cotacao(moeda: str) -> str:
     Args:
         moeda: Codigo da moeda (USD, EUR, GBP, etc) ou nome (dolar, euro, libra)
     """
-    mapeamento = {
-        "dolar": "USD",
-        "dollar": "USD",
-        "dolar americano": "USD",
-        "euro": "EUR",
-        "libra": "GBP",
-        "pound": "GBP",
-        "libra esterlina": "GBP",
-        "peso argentino": "ARS",
-        "peso": "ARS",
-        "dolar canadense": "CAD",
-        "dolar australiano": "AUD",
-        "iene": "JPY",
-        "yen": "JPY",
-        "franco suico": "CHF",
-        "franco": "CHF",
-        "yuan": "CNY",
-        "bitcoin": "BTC",
-    }
-
-    codigo = mapeamento.get(moeda.lower().strip(), moeda.upper().strip())
+    codigo = _codigo_moeda(moeda)
 
     try:
         cotacao = _cambio_service.obter_cotacao_sync(codigo, "BRL")
-        return f"COTACAO|{codigo}|{cotacao.valor:.4f}|{cotacao.data_consulta.strftime('%H:%M')}"
+        resposta = f"COTACAO|{codigo}|{cotacao.valor:.4f}|{cotacao.data_consulta.strftime('%H:%M')}"
+        return resposta + "|DESATUALIZADA" if cotacao.desatualizada else resposta
     except CambioAPIIndisponivelError as e:
         return f"API_INDISPONIVEL|{str(e)}"
 
 
+@tool("consultar_cotacoes")
+def consultar_cotacoes(moedas: str, moeda_destino: str = "BRL") -> str:
+    """
+    Consulta de uma vez a cotacao de varias moedas. Use quando o cliente pedir
+    mais de uma moeda ou uma moeda em relacao a outra que nao o Real.
+
+    Args:
+        moedas: Codigos ou nomes separados por virgula (ex: "dolar, euro, libra")
+        moeda_destino: Moeda em que as cotacoes sao expressas (padrao BRL)
+    """
+    codigos = [_codigo_moeda(m) for m in re.split(r",|;|\se\s", moedas) if m.strip()]
+    destino = _codigo_moeda(moeda_destino)
+
+    cotacoes = _cambio_service.obter_cotacoes_sync(codigos, destino)
+    if not cotacoes:
+        return f"API_INDISPONIVEL|{CambioService.ERRO_API_INDISPONIVEL}"
+
+    partes = []
+    for codigo in dict.fromkeys(codigos):
+        if codigo == destino:
+            continue
+        cotacao = cotacoes.get(codigo)
+        if cotacao is None:
+            partes.append(f"{codigo}=INDISPONIVEL")
+        elif cotacao.desatualizada:
+            partes.append(f"{codigo}={cotacao.valor:.4f}(DESATUALIZADA)")
+        else:
+            partes.append(f"{codigo}={cotacao.valor:.4f}")
+    horario = min(c.data_consulta for c in cotacoes.values()).strftime("%H:%M")
+    return f"COTACOES|{destino}|" + "|".join(partes) + f"|{horario}"
+
+
 @tool("listar_moedas_disponiveis")
 def listar_moedas_disponiveis() -> str:
     """
     Lista todas as moedas disponiveis para consulta de cotacao.
     """
-    moedas = [
-        "USD (Dolar Americano)",
-        "EUR (Euro)",
-        "GBP (Libra Esterlina)",
-        "ARS (Peso Argentino)",
-        "CAD (Dolar Canadense)",
-        "AUD (Dolar Australiano)",
-        "JPY (Iene Japones)",
-        "CHF (Franco Suico)",
-        "CNY (Yuan Chines)",
-        "BTC (Bitcoin)",
-    ]
+    moedas = [f"{codigo} ({nome})" for codigo, nome in MOEDAS_DISPONIVEIS.items()]
     return "MOEDAS|" + "|".join(moedas)
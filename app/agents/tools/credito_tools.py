@@ -1,14 +1,13 @@
 """Tools para o Agente de Credito."""
 
-import logging
-
 from crewai.tools import tool
 
 from app.agents.tools.context import get_contexto
+from app.eventos import obter_eventos
 from app.services.cliente_service import ClienteService
 from app.services.credito_service import CreditoService
 
-logger = logging.getLogger(__name__)
+eventos = obter_eventos("tools")
 
 _cliente_service = ClienteService()
 _credito_service = CreditoService()
@@ -20,20 +19,22 @@ def consultar_limite() -> str:
     Consulta o limite de credito atual do cliente autenticado.
     Retorna limite atual, score e limite maximo permitido pelo score.
     """
-    logger.info("[TOOL] consultar_limite chamada")
+    eventos.debug("tool.chamada", tool="consultar_limite")
 
     contexto = get_contexto()
     if not contexto.cliente_autenticado:
-        logger.warning("[TOOL] Cliente nao autenticado")
+        eventos.warning("tool.cliente_nao_autenticado")
         return "ERRO|Cliente nao autenticado"
 
     limite_atual = contexto.limite_atual
     score = contexto.score
     limite_maximo = _credito_service.obter_limite_maximo_por_score(score)
 
-    logger.info(
-        f"[TOOL] Limite consultado: atual=R$ {limite_atual:.2f}, "
-        f"score={score}, maximo=R$ {limite_maximo:.2f}"
+    eventos.info(
+        "tool.limite_consultado",
+        limite_atual=limite_atual,
+        score=score,
+        limite_maximo=limite_maximo,
     )
 
     return f"LIMITE|{limite_atual}|{score}|{limite_maximo}"
@@ -47,19 +48,19 @@ def solicitar_aumento_limite(novo_limite: float) -> str:
     Args:
         novo_limite: Valor do novo limite desejado em reais
     """
-    logger.info(
-        f"[TOOL] solicitar_aumento_limite chamada com novo_limite={novo_limite}"
-    )
+    eventos.debug("tool.chamada", tool="solicitar_aumento_limite", novo_limite=novo_limite)
 
     contexto = get_contexto()
     if not contexto.cliente_autenticado:
-        logger.warning("[TOOL] Cliente nao autenticado")
+        eventos.warning("tool.cliente_nao_autenticado")
         return "ERRO|Cliente nao autenticado"
 
-    logger.info(
-        f"[TOOL] Processando solicitacao: CPF={contexto.cpf}, "
-        f"Limite atual={contexto.limite_atual}, "
-        f"Novo limite={novo_limite}, Score={contexto.score}"
+    eventos.info(
+        "tool.solicitacao_recebida",
+        cpf=contexto.cpf,
+        limite_atual=contexto.limite_atual,
+        novo_limite=novo_limite,
+        score=contexto.score,
     )
 
     solicitacao = _credito_service.registrar_solicitacao(
@@ -72,13 +73,15 @@ def solicitar_aumento_limite(novo_limite: float) -> str:
     if solicitacao.status_pedido.value == "aprovado":
         _cliente_service.atualizar_limite(contexto.cpf, novo_limite)
         contexto.limite_atual = novo_limite
-        logger.info(f"[TOOL] Aumento APROVADO: novo limite = R$ {novo_limite:.2f}")
+        eventos.info("tool.aumento_aprovado", novo_limite=novo_limite)
         return f"APROVADO|{novo_limite}"
     else:
         limite_maximo = _credito_service.obter_limite_maximo_por_score(contexto.score)
-        logger.info(
-            f"[TOOL] Aumento REJEITADO: limite solicitado = R$ {novo_limite:.2f}, "
-            f"limite maximo = R$ {limite_maximo:.2f}, score = {contexto.score}"
+        eventos.info(
+            "tool.aumento_rejeitado",
+            novo_limite=novo_limite,
+            limite_maximo=limite_maximo,
+            score=contexto.score,
         )
         return f"REJEITADO|{limite_maximo}|{contexto.score}"
 
@@ -88,17 +91,15 @@ def obter_limite_maximo() -> str:
     """
     Retorna o limite maximo que o cliente pode solicitar com seu score atual.
     """
-    logger.info("[TOOL] obter_limite_maximo chamada")
+    eventos.debug("tool.chamada", tool="obter_limite_maximo")
 
     contexto = get_contexto()
     if not contexto.cliente_autenticado:
-        logger.warning("[TOOL] Cliente nao autenticado")
+        eventos.warning("tool.cliente_nao_autenticado")
         return "ERRO|Cliente nao autenticado"
 
     limite_maximo = _credito_service.obter_limite_maximo_por_score(contexto.score)
 
-    logger.info(
-        f"[TOOL] Limite maximo obtido: R$ {limite_maximo:.2f} para score {contexto.score}"
-    )
+    eventos.info("tool.limite_maximo_obtido", limite_maximo=limite_maximo, score=contexto.score)
 
     return f"LIMITE_MAXIMO|{limite_maximo}|{contexto.score}"
@@ -1,17 +1,53 @@
 """Tools para o Agente de Entrevista de Credito."""
 
-import logging
-
 from crewai.tools import tool
 
 from app.agents.tools.context import get_contexto
+from app.eventos import obter_eventos
 from app.services.cliente_service import ClienteService
-from app.services.score_service import ScoreService, TipoEmprego
+from app.services.credito_service import CreditoService, SimulacaoInvalidaError
 
-logger = logging.getLogger(__name__)
+eventos = obter_eventos("tools")
 
 _cliente_service = ClienteService()
-_score_service = ScoreService()
+_credito_service = CreditoService()
+
+
+@tool("simular_score")
+def simular_score(
+    renda_mensal: float,
+    tipo_emprego: str,
+    despesas_mensais: float,
+    num_dependentes: int,
+    dividas_atuais: float,
+) -> str:
+    """
+    Simula o score e o limite maximo para um conjunto de respostas, sem alterar
+    os dados do cliente. Use quando o cliente quiser saber o efeito de mudar uma
+    resposta; para concluir a analise use calcular_novo_score.
+
+    Args:
+        renda_mensal: Renda mensal do cliente em reais
+        tipo_emprego: Tipo de emprego (CLT, FORMAL, PJ, AUTONOMO, DESEMPREGADO)
+        despesas_mensais: Total de despesas fixas mensais em reais
+        num_dependentes: Numero de dependentes (0, 1, 2, 3 ou mais)
+        dividas_atuais: Total de dividas em aberto em reais (0 se nao tiver)
+
+    Returns:
+        SIMULACAO|score|limite_maximo, ou ERRO|motivo
+    """
+    try:
+        simulacao = _credito_service.simular(
+            renda_mensal, tipo_emprego, despesas_mensais, num_dependentes, dividas_atuais
+        )
+    except SimulacaoInvalidaError as e:
+        eventos.warning("tool.simulacao_invalida", motivo=e)
+        return f"ERRO|{e}"
+
+    eventos.info(
+        "tool.simulacao", score=simulacao["score"], limite_maximo=simulacao["limite_maximo"]
+    )
+    return f"SIMULACAO|{simulacao['score']}|{simulacao['limite_maximo']}"
 
 
 @tool("calcular_novo_score")
@@ -35,74 +71,52 @@ def calcular_novo_score(
     Returns:
         String formatada com o resultado do calculo
     """
-    logger.info(
-        f"[TOOL] calcular_novo_score chamada com: "
-        f"renda={renda_mensal}, emprego={tipo_emprego}, "
-        f"despesas={despesas_mensais}, dependentes={num_dependentes}, "
-        f"dividas={dividas_atuais}"
+    eventos.debug(
+        "tool.chamada",
+        tool="calcular_novo_score",
+        renda=renda_mensal,
+        emprego=tipo_emprego,
+        despesas=despesas_mensais,
+        dependentes=num_dependentes,
+        dividas=dividas_atuais,
     )
 
     contexto = get_contexto()
 
-    tipo_upper = tipo_emprego.upper().strip()
-    tipos_validos = {
-        "CLT": TipoEmprego.FORMAL,
-        "FORMAL": TipoEmprego.FORMAL,
-        "PJ": TipoEmprego.AUTONOMO,
-        "AUTONOMO": TipoEmprego.AUTONOMO,
-        "AUTÔNOMO": TipoEmprego.AUTONOMO,
-        "DESEMPREGADO": TipoEmprego.DESEMPREGADO,
-    }
-
-    if tipo_upper not in tipos_validos:
-        logger.warning(f"[TOOL] Tipo de emprego invalido: {tipo_upper}")
-        return f"ERRO|Tipo de emprego invalido. Use: CLT, FORMAL, PJ, AUTONOMO ou DESEMPREGADO"
-
-    tipo_emprego_enum = tipos_validos[tipo_upper]
-
-    if renda_mensal <= 0:
-        logger.warning(f"[TOOL] Renda invalida: {renda_mensal}")
-        return "ERRO|Renda mensal deve ser maior que zero"
-
-    if despesas_mensais < 0:
-        logger.warning(f"[TOOL] Despesas invalidas: {despesas_mensais}")
-        return "ERRO|Despesas mensais nao podem ser negativas"
-
-    if despesas_mensais > renda_mensal * 1.5:
-        logger.warning(
-            f"[TOOL] Despesas ({despesas_mensais}) muito altas em relacao a renda ({renda_mensal}). "
-            "Isso resultara em score baixo."
+    # O score gravado usa os valores informados; a normalização é só do cache de simulações.
+    try:
+        novo_score = _credito_service.calcular_score(
+            renda_mensal, tipo_emprego, despesas_mensais, num_dependentes, dividas_atuais
         )
+    except SimulacaoInvalidaError as e:
+        eventos.warning("tool.dados_invalidos", motivo=e)
+        return f"ERRO|{e}"
 
-    tem_dividas = dividas_atuais > 0
-
-    novo_score = _score_service.calcular_score(
-        renda_mensal=renda_mensal,
-        tipo_emprego=tipo_emprego_enum,
-        despesas_fixas=despesas_mensais,
-        num_dependentes=num_dependentes,
-        tem_dividas=tem_dividas,
-    )
+    if despesas_mensais > renda_mensal * 1.5:
+        eventos.warning("tool.despesas_altas", renda=renda_mensal, despesas=despesas_mensais)
 
     score_anterior = contexto.score
     limite_atual = contexto.limite_atual
 
-    from app.services.credito_service import CreditoService
-
-    credito_service = CreditoService()
-    novo_limite_maximo = credito_service.obter_limite_maximo_por_score(novo_score)
-    limite_maximo_anterior = credito_service.obter_limite_maximo_por_score(score_anterior)
+    novo_limite_maximo = _credito_service.obter_limite_maximo_por_score(novo_score)
+    limite_maximo_anterior = _credito_service.obter_limite_maximo_por_score(score_anterior)
 
-    logger.info(
-        f"[TOOL] Score calculado: {score_anterior} -> {novo_score}, "
-        f"Limite maximo: R$ {limite_maximo_anterior:.2f} -> R$ {novo_limite_maximo:.2f}"
+    eventos.info(
+        "tool.score_calculado",
+        score_anterior=score_anterior,
+        score_novo=novo_score,
+        limite_maximo_anterior=limite_maximo_anterior,
+        limite_maximo_novo=novo_limite_maximo,
     )
 
     if novo_score < score_anterior or novo_limite_maximo < limite_atual:
-        logger.warning(
-            f"[TOOL] VALIDACAO: Novo score ({novo_score}) ou limite maximo ({novo_limite_maximo:.2f}) "
-            f"e MENOR que o atual (score: {score_anterior}, limite: {limite_atual:.2f}). "
-            f"NAO sera atualizado na base de dados para proteger o cliente."
+        eventos.warning(
+            "tool.score_nao_atualizado",
+            motivo="novo score ou limite maximo menor que o atual",
+            score_anterior=score_anterior,
+            score_novo=novo_score,
+            limite_atual=limite_atual,
+            limite_maximo_novo=novo_limite_maximo,
         )
 
         return (
@@ -118,7 +132,7 @@ def calcular_novo_score(
 
     if contexto.cpf:
         _cliente_service.atualizar_score(contexto.cpf, novo_score)
-        logger.info(f"[TOOL] Score atualizado no CSV: {score_anterior} -> {novo_score}")
+        eventos.info("tool.score_atualizado", score_anterior=score_anterior, score_novo=novo_score)
 
     return (
         f"SUCESSO! Calculo finalizado. "
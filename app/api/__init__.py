@@ -1,4 +1,5 @@
 from app.api.chat import router as chat_router
 from app.api.admin import router as admin_router
+from app.api.credito import router as credito_router
 
-__all__ = ["chat_router", "admin_router"]
+__all__ = ["chat_router", "admin_router", "credito_router"]
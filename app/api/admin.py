@@ -1,6 +1,10 @@
-from datetime import date
+from collections.abc import Iterator
+from datetime import date, datetime
+from itertools import islice
+from typing import Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.models import Cliente
@@ -72,42 +76,155 @@ async def adicionar_cliente(request: AdicionarClienteRequest):
     )
 
 
+def _cliente_response(cliente: Cliente) -> ClienteResponse:
+    return ClienteResponse(
+        cpf=cliente.cpf,
+        nome=cliente.nome,
+        data_nascimento=cliente.data_nascimento,
+        score=cliente.score,
+        limite_atual=cliente.limite_atual,
+    )
+
+
+def _linhas_ndjson(clientes: Iterator[Cliente]) -> Iterator[str]:
+    for cliente in clientes:
+        yield _cliente_response(cliente).model_dump_json() + "\n"
+
+
 @router.get("/clientes", response_model=list[ClienteResponse])
-async def listar_clientes():
+async def listar_clientes(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=10_000),
+    after_cpf: str | None = None,
+    score_min: int | None = None,
+    score_max: int | None = None,
+    limite_min: float | None = None,
+    limite_max: float | None = None,
+    nome_prefixo: str | None = None,
+    formato: Literal["json", "ndjson"] = "json",
+):
     """
-    Lista todos os clientes cadastrados no sistema.
+    Lista os clientes cadastrados no sistema.
+
+    Sem parâmetros, retorna todos os clientes. Com filtros ou paginação, os
+    clientes são percorridos em ordem de CPF: `after_cpf` é o cursor (o último
+    CPF da página anterior) e, quando a página vem cheia, o próximo cursor é
+    informado no header `X-Proximo-Cursor`. Com `formato=ndjson`, a resposta é
+    transmitida um cliente por linha, sem montar a lista em memória.
     """
-    cliente_service = ClienteService()
-    clientes = cliente_service.listar_todos()
-
-    return [
-        ClienteResponse(
-            cpf=cliente.cpf,
-            nome=cliente.nome,
-            data_nascimento=cliente.data_nascimento,
-            score=cliente.score,
-            limite_atual=cliente.limite_atual,
+    cursor = after_cpf.replace(".", "").replace("-", "") if after_cpf is not None else None
+    if cursor is not None and not (cursor.isascii() and cursor.isdigit()):
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor inválido. after_cpf deve ser o CPF do último cliente da página.",
         )
-        for cliente in clientes
+
+    cliente_service = ClienteService()
+    filtros = (after_cpf, score_min, score_max, limite_min, limite_max, nome_prefixo)
+
+    if formato == "ndjson":
+        clientes = islice(cliente_service.iterar(*filtros), limit)
+        return StreamingResponse(_linhas_ndjson(clientes), media_type="application/x-ndjson")
+
+    if limit is None and all(filtro is None for filtro in filtros):
+        return [_cliente_response(cliente) for cliente in cliente_service.listar_todos()]
+
+    clientes = [
+        _cliente_response(cliente)
+        for cliente in islice(cliente_service.iterar(*filtros), limit)
     ]
+    if limit is not None and len(clientes) == limit:
+        response.headers["X-Proximo-Cursor"] = clientes[-1].cpf
+    return clientes
+
+
+class EstatisticasClientesResponse(BaseModel):
+    total: int
+    score_medio: float | None = None
+    score_minimo: int | None = None
+    score_maximo: int | None = None
+    limite_total: float | None = None
+    limite_medio: float | None = None
+    limite_minimo: float | None = None
+    limite_maximo: float | None = None
+
+
+@router.get("/clientes/estatisticas", response_model=EstatisticasClientesResponse)
+async def estatisticas_clientes(
+    score_min: int | None = None,
+    score_max: int | None = None,
+    limite_min: float | None = None,
+    limite_max: float | None = None,
+):
+    """
+    Retorna agregados de score e limite da carteira, opcionalmente filtrada
+    por faixa de score e de limite.
+    """
+    cliente_service = ClienteService()
+    return cliente_service.estatisticas(score_min, score_max, limite_min, limite_max)
 
 
 @router.get("/solicitacoes", response_model=list[SolicitacaoCredito])
-async def listar_solicitacoes():
+async def listar_solicitacoes(desde: datetime | None = None, ate: datetime | None = None):
+    """
+    Lista as solicitações de aumento de limite.
+
+    Com `desde` e/ou `ate`, retorna apenas as feitas no intervalo
+    (`desde` inclusive, `ate` exclusive), em ordem cronológica.
+    """
+    solicitacao_service = SolicitacaoService()
+    if desde is None and ate is None:
+        return solicitacao_service.listar_todas()
+    return solicitacao_service.listar_periodo(desde, ate)
+
+
+class FaixaScoreEstatisticas(BaseModel):
+    faixa: str
+    score_minimo: int | None = None
+    score_maximo: int | None = None
+    total: int
+    aprovados: int
+    rejeitados: int
+    taxa_aprovacao: float | None = None
+
+
+class EstatisticasSolicitacoesResponse(BaseModel):
+    total: int
+    por_status: dict[str, int]
+    taxa_aprovacao: float | None = None
+    media_limite_atual: float | None = None
+    media_novo_limite_solicitado: float | None = None
+    por_faixa_score: list[FaixaScoreEstatisticas]
+    distribuicao_limite_atual: dict[str, int]
+    distribuicao_novo_limite_solicitado: dict[str, int]
+    distribuicao_aumento: dict[str, int]
+
+
+@router.get("/solicitacoes/stats", response_model=EstatisticasSolicitacoesResponse)
+async def estatisticas_solicitacoes(desde: date | None = None, ate: date | None = None):
     """
-    Lista todas as solicitações de aumento de limite.
+    Retorna indicadores das solicitações entre `desde` e `ate` (datas inclusivas):
+    contagens por status, taxa de aprovação geral e por faixa de score (conforme
+    `score_limite.csv`) e distribuições do limite atual, do novo limite
+    solicitado e da razão entre eles.
     """
     solicitacao_service = SolicitacaoService()
-    return solicitacao_service.listar_todas()
+    return solicitacao_service.estatisticas(desde, ate)
 
 
 @router.get("/solicitacoes/{cpf}", response_model=list[SolicitacaoCredito])
-async def listar_solicitacoes_por_cpf(cpf: str):
+async def listar_solicitacoes_por_cpf(
+    cpf: str, desde: datetime | None = None, ate: datetime | None = None
+):
     """
-    Lista todas as solicitações de aumento de limite de um cliente específico.
+    Lista as solicitações de aumento de limite de um cliente específico,
+    opcionalmente restritas ao intervalo entre `desde` e `ate`.
     """
     solicitacao_service = SolicitacaoService()
-    solicitacoes = solicitacao_service.listar_por_cpf(cpf)
+    if desde is None and ate is None:
+        solicitacoes = solicitacao_service.listar_por_cpf(cpf)
+    else:
+        solicitacoes = solicitacao_service.listar_periodo(desde, ate, cpf)
 
     if not solicitacoes:
         raise HTTPException(
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from app.services import CreditoService
+from app.services.credito_service import SimulacaoInvalidaError
+
+router = APIRouter(prefix="/credito", tags=["credito"])
+
+
+class SimularCreditoRequest(BaseModel):
+    renda_mensal: float
+    tipo_emprego: str
+    despesas_mensais: float
+    num_dependentes: int
+    dividas_atuais: float = 0.0
+
+
+class SimularCreditoResponse(BaseModel):
+    score: int
+    score_minimo: int | None
+    score_maximo: int | None
+    limite_maximo: float
+
+
+@router.post("/simular", response_model=SimularCreditoResponse)
+async def simular_credito(request: SimularCreditoRequest):
+    """
+    Simula score, faixa de score e limite máximo para um perfil financeiro.
+
+    Nada é gravado: a simulação não altera clientes nem registra solicitações.
+    Perfis repetidos ou equivalentes são respondidos a partir de um cache.
+    """
+    try:
+        simulacao = CreditoService().simular(
+            renda_mensal=request.renda_mensal,
+            tipo_emprego=request.tipo_emprego,
+            despesas_mensais=request.despesas_mensais,
+            num_dependentes=request.num_dependentes,
+            dividas_atuais=request.dividas_atuais,
+        )
+    except SimulacaoInvalidaError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return SimularCreditoResponse(**simulacao)
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -6,12 +8,51 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-4o-mini"
 
     serpapi_key: str = ""
+    cambio_provedor: str = "serpapi"
+    cambio_provedor_url: str = ""
+    cambio_replay_path: str = ""
+    cambio_replay_latencia_s: float = 0.0
+    cambio_replay_taxa_erro: float = 0.0
+    cambio_cache_ttl_s: float = 60.0
+    cambio_cache_stale_s: float = 300.0
+    cambio_http2: bool = True
+    cambio_http_max_conexoes: int = 20
+    cambio_http_max_keepalive: int = 10
+    cambio_http_keepalive_s: float = 30.0
+    cambio_http_timeout_s: float = 10.0
+    cambio_http_timeout_conexao_s: float = 5.0
+    cambio_lote_paralelismo: int = 4
+    cambio_disjuntor_falhas: int = 5
+    cambio_disjuntor_aberto_s: float = 30.0
+    cambio_atualizacao_ativa: bool = False
+    cambio_atualizacao_intervalo_s: float = 300.0
+    cambio_atualizacao_janela_s: float = 1800.0
+    cambio_atualizacao_moedas_base: list[str] | None = None
+    cambio_historico_path: str = ""
 
     mongo_uri: str = "mongodb://localhost:27017"
     mongo_db: str = "banking_agents"
+    mongo_pool_max: int = 50
+    mongo_pool_min: int = 0
+    mongo_pool_ocioso_ms: int = 60_000
+    mongo_pool_espera_ms: int = 0
+    mongo_timeout_selecao_ms: int = 5_000
+    mongo_escrita_w: str = "1"
+    mongo_escrita_journal: bool = False
+
+    storage_backend: Literal["csv", "sqlite"] = "csv"
+    sqlite_path: str = ""
+    clientes_journal_max_entradas: int = 1000
+    solicitacoes_lote_max: int = 256
+    solicitacoes_lote_intervalo_ms: float = 0.0
+    solicitacoes_fsync: bool = True
+    solicitacoes_particao: Literal["ano", "mes", "dia"] = "mes"
+    simulacao_cache_tamanho: int = 4096
 
     app_name: str = "Multi-Agent Banking System"
     debug: bool = False
+    log_niveis: dict[str, str] = {}
+    log_amostragem: dict[str, float] = {}
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,118 @@
+"""
+Log de eventos estruturados (nome do evento + campos chave/valor).
+
+Cada subsistema (`score`, `tools`, `orquestrador`, ...) tem um logger próprio,
+`app.eventos.<subsistema>`, cujo nível pode ser ajustado em `LOG_NIVEIS` e cuja
+taxa de amostragem dos eventos INFO/DEBUG fica em `LOG_AMOSTRAGEM`, ambos como
+JSON (ex.: `LOG_NIVEIS='{"score": "WARNING"}'`).
+
+Com o nível desabilitado, registrar um evento custa uma checagem de nível: nada
+é formatado. Mesmo habilitado, o texto só é montado quando um handler emite o
+registro; os campos também seguem em `record.campos` para handlers estruturados.
+"""
+
+import json
+import logging
+import random
+import threading
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tamanho máximo do texto de cada campo na mensagem formatada.
+TAMANHO_MAXIMO_VALOR = 200
+
+
+def _formatar_valor(valor) -> str:
+    if isinstance(valor, float):
+        return f"{valor:.2f}"
+    texto = str(valor)
+    if len(texto) > TAMANHO_MAXIMO_VALOR:
+        texto = texto[:TAMANHO_MAXIMO_VALOR] + "..."
+    if not texto or any(c.isspace() or c in '="' for c in texto):
+        return json.dumps(texto, ensure_ascii=False)
+    return texto
+
+
+class Evento:
+    """Mensagem de log formatada sob demanda como `evento chave=valor ...`."""
+
+    __slots__ = ("nome", "campos")
+
+    def __init__(self, nome: str, campos: dict):
+        self.nome = nome
+        self.campos = campos
+
+    def __str__(self) -> str:
+        partes = [self.nome]
+        partes += [f"{chave}={_formatar_valor(valor)}" for chave, valor in self.campos.items()]
+        return " ".join(partes)
+
+
+class RegistroEventos:
+    """Registra eventos de um subsistema, com nível e amostragem próprios."""
+
+    def __init__(self, subsistema: str, nivel: str | None = None, amostragem: float = 1.0):
+        self.subsistema = subsistema
+        self.logger = logging.getLogger(f"app.eventos.{subsistema}")
+        if nivel is not None:
+            try:
+                self.logger.setLevel(nivel.upper())
+            except ValueError:
+                logger.warning(
+                    f"Nível de log inválido para {subsistema!r} em LOG_NIVEIS: {nivel!r}; "
+                    "mantido o nível padrão"
+                )
+        self.amostragem = amostragem
+
+    def habilitado(self, nivel: int) -> bool:
+        """Indica se eventos do nível seriam registrados (útil antes de cálculos caros)."""
+        return self.logger.isEnabledFor(nivel)
+
+    def _emitir(self, nivel: int, evento: str, campos: dict) -> None:
+        if nivel < logging.WARNING and self.amostragem < 1.0:
+            if random.random() >= self.amostragem:
+                return
+        # stacklevel=3: o registro aponta para quem chamou debug/info/warning/error.
+        self.logger.log(
+            nivel,
+            Evento(evento, campos),
+            extra={"evento": evento, "campos": campos},
+            stacklevel=3,
+        )
+
+    # Cada método checa o nível antes de qualquer outra coisa, sem chamadas intermediárias.
+    def debug(self, evento: str, **campos) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._emitir(logging.DEBUG, evento, campos)
+
+    def info(self, evento: str, **campos) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._emitir(logging.INFO, evento, campos)
+
+    def warning(self, evento: str, **campos) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._emitir(logging.WARNING, evento, campos)
+
+    def error(self, evento: str, **campos) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._emitir(logging.ERROR, evento, campos)
+
+
+_registros: dict[str, RegistroEventos] = {}
+_registros_lock = threading.Lock()
+
+
+def obter_eventos(subsistema: str) -> RegistroEventos:
+    """Retorna o registro de eventos do subsistema, configurado a partir de settings."""
+    with _registros_lock:
+        registro = _registros.get(subsistema)
+        if registro is None:
+            registro = RegistroEventos(
+                subsistema,
+                settings.log_niveis.get(subsistema),
+                settings.log_amostragem.get(subsistema, 1.0),
+            )
+            _registros[subsistema] = registro
+        return registro
@@ -202,23 +202,21 @@ elif st.session_state.pagina_atual == "listar_clientes":
     st.caption("Visualize todos os clientes do sistema")
 
     cliente_service = ClienteService()
-    clientes = cliente_service.listar_todos()
+    snapshot = cliente_service.snapshot_colunar()
 
-    if not clientes:
+    if len(snapshot) == 0:
         st.warning("Nenhum cliente cadastrado no sistema.")
     else:
-        st.success(f"Total de clientes: {len(clientes)}")
+        st.success(f"Total de clientes: {len(snapshot)}")
 
-        df_clientes = pd.DataFrame([
-            {
-                "CPF": cliente.cpf,
-                "Nome": cliente.nome,
-                "Data Nascimento": cliente.data_nascimento.strftime("%d/%m/%Y"),
-                "Score": cliente.score,
-                "Limite Atual": f"R$ {cliente.limite_atual:,.2f}",
-            }
-            for cliente in clientes
-        ])
+        colunas = snapshot.colunas()
+        df_clientes = pd.DataFrame({
+            "CPF": colunas["cpf"],
+            "Nome": colunas["nome"],
+            "Data Nascimento": pd.to_datetime(colunas["data_nascimento"]).strftime("%d/%m/%Y"),
+            "Score": colunas["score"],
+            "Limite Atual": [f"R$ {limite:,.2f}" for limite in colunas["limite_atual"]],
+        })
 
         st.dataframe(df_clientes, width="stretch", hide_index=True)
 
@@ -233,7 +231,25 @@ elif st.session_state.pagina_atual == "solicitacoes":
     if not solicitacoes:
         st.warning("Nenhuma solicitação encontrada.")
     else:
-        st.success(f"Total de solicitações: {len(solicitacoes)}")
+        estatisticas = solicitacao_service.estatisticas()
+        taxa_aprovacao = estatisticas["taxa_aprovacao"]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Total de solicitações", estatisticas["total"])
+        col2.metric(
+            "Taxa de aprovação",
+            f"{taxa_aprovacao:.1%}" if taxa_aprovacao is not None else "-",
+        )
+        col3.metric(
+            "Novo limite médio",
+            f"R$ {estatisticas['media_novo_limite_solicitado'] or 0:,.2f}",
+        )
+
+        with st.expander("Aprovação por faixa de score"):
+            st.dataframe(
+                pd.DataFrame(estatisticas["por_faixa_score"]),
+                width="stretch",
+                hide_index=True,
+            )
 
         col1, col2 = st.columns(2)
         with col1:
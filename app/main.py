@@ -5,9 +5,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 
-from app.api import chat_router, admin_router
+from app.api import chat_router, admin_router, credito_router
 from app.config import settings
-from app.memory import create_indexes
+from app.memory import abrir_cliente_mongo, create_indexes, fechar_clientes_mongo
+from app.services.atualizador_cotacoes import AtualizadorCotacoes
+from app.services.http_cambio import abrir_clientes_http, fechar_clientes_http
 
 logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
@@ -26,12 +28,29 @@ async def lifespan(app: FastAPI):
         collection = db["conversations"]
         await create_indexes(collection)
         logger.info("MongoDB indexes created successfully")
+        client.close()
     except Exception as e:
         logger.warning(f"Could not create MongoDB indexes: {e}")
 
+    abrir_cliente_mongo()
+    abrir_clientes_http()
+
+    atualizador = None
+    if (
+        settings.cambio_atualizacao_ativa
+        and settings.serpapi_key
+        and settings.cambio_atualizacao_intervalo_s > 0
+    ):
+        atualizador = AtualizadorCotacoes()
+        atualizador.iniciar()
+
     yield
 
     logger.info("Shutting down application...")
+    if atualizador is not None:
+        await atualizador.parar()
+    await fechar_clientes_http()
+    fechar_clientes_mongo()
 
 
 app = FastAPI(
@@ -51,6 +70,7 @@ app.add_middleware(
 
 app.include_router(chat_router)
 app.include_router(admin_router)
+app.include_router(credito_router)
 
 
 @app.get("/health")
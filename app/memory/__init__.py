@@ -1,3 +1,15 @@
 from app.memory.chat_memory import ChatMemory, get_memory, create_indexes
+from app.memory.cliente_mongo import (
+    abrir_cliente_mongo,
+    fechar_clientes_mongo,
+    obter_cliente_mongo,
+)
 
-__all__ = ["ChatMemory", "get_memory", "create_indexes"]
+__all__ = [
+    "ChatMemory",
+    "get_memory",
+    "create_indexes",
+    "obter_cliente_mongo",
+    "abrir_cliente_mongo",
+    "fechar_clientes_mongo",
+]
@@ -1,39 +1,56 @@
 import logging
 from datetime import datetime
-from typing import Optional
 
-from pymongo import MongoClient
+from pymongo import WriteConcern
 
 from app.config import settings
+from app.memory.cliente_mongo import obter_cliente_mongo
 
 logger = logging.getLogger(__name__)
 
 
+def _write_concern_padrao() -> WriteConcern:
+    # "1", "2"... e numero de nos; outros valores ("majority") sao nomes de modo.
+    w = settings.mongo_escrita_w
+    return WriteConcern(w=int(w) if w.isdigit() else w, j=settings.mongo_escrita_journal or None)
+
+
 class ChatMemory:
-    """Gerencia o historico de conversas no MongoDB."""
+    """
+    Gerencia o historico de conversas no MongoDB.
+
+    Usa o cliente compartilhado do processo (`obter_cliente_mongo`); criar uma
+    memoria por sessao ou por troca de agente nao abre novas conexoes. As
+    escritas usam `write_concern` (padrao: `MONGO_ESCRITA_W`/`MONGO_ESCRITA_JOURNAL`).
+    """
 
-    def __init__(self, agent_id: str, conversation_id: str):
+    def __init__(
+        self, agent_id: str, conversation_id: str, write_concern: WriteConcern | None = None
+    ):
         self.agent_id = agent_id
         self.conversation_id = conversation_id
         self.session_id = f"{agent_id}:{conversation_id}"
-        self._client: Optional[MongoClient] = None
+        if write_concern is None:
+            write_concern = _write_concern_padrao()
+        self.write_concern = write_concern
         self._collection = None
 
     @property
     def collection(self):
         if self._collection is None:
-            self._client = MongoClient(settings.mongo_uri)
-            db = self._client[settings.mongo_db]
-            self._collection = db["conversations"]
+            db = obter_cliente_mongo()[settings.mongo_db]
+            self._collection = db.get_collection(
+                "conversations", write_concern=self.write_concern
+            )
         return self._collection
 
-    def _doc(self, msg_type: str, content: str) -> dict:
+    def _doc(self, msg_type: str, content: str, created_at: datetime | None = None) -> dict:
         return {
             "session_id": self.session_id,
             "agent_id": self.agent_id,
             "conversation_id": self.conversation_id,
             "message": {"type": msg_type, "content": content},
-            "created_at": datetime.utcnow(),
+            "created_at": created_at or datetime.utcnow(),
         }
 
     def add_user_message(self, message: str) -> None:
@@ -50,10 +67,26 @@ class ChatMemory:
         except Exception as e:
             logger.error(f"[chat_memory] Error saving AI message: {e}")
 
+    def add_turn(self, user_message: str, ai_message: str) -> None:
+        """Salva a mensagem do usuario e a resposta em uma unica ida ao banco."""
+        created_at = datetime.utcnow()
+        try:
+            self.collection.insert_many(
+                [
+                    self._doc("human", user_message, created_at),
+                    self._doc("ai", ai_message, created_at),
+                ],
+                ordered=True,
+            )
+            logger.debug(f"[chat_memory] Turn saved: {user_message[:50]}...")
+        except Exception as e:
+            logger.error(f"[chat_memory] Error saving turn: {e}")
+
     def get_messages(self) -> list[dict]:
         try:
+            # As mensagens de um turno tem o mesmo created_at; o _id mantem a ordem.
             docs = self.collection.find({"session_id": self.session_id}).sort(
-                "created_at", 1
+                [("created_at", 1), ("_id", 1)]
             )
             messages = []
             for d in docs:
@@ -75,8 +108,8 @@ class ChatMemory:
             logger.error(f"[chat_memory] Error clearing messages: {e}")
 
     def close(self) -> None:
-        if self._client:
-            self._client.close()
+        # O cliente e compartilhado e fechado no encerramento da aplicacao.
+        self._collection = None
 
 
 def get_memory(agent_id: str, conversation_id: str) -> ChatMemory:
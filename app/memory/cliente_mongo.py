@@ -0,0 +1,57 @@
+"""
+Clientes MongoDB compartilhados pela memória de conversas.
+
+Um `MongoClient` mantém seu próprio pool de conexões e threads de monitoramento,
+então há um único cliente por URI no processo, reaproveitado por todas as
+`ChatMemory`. O cliente é aberto e fechado pelo lifespan da aplicação; fora
+dela (CLI, testes) é criado sob demanda no primeiro uso.
+"""
+
+import logging
+import threading
+
+from pymongo import MongoClient
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_clientes: dict[str, MongoClient] = {}
+_lock = threading.Lock()
+
+
+def _configuracao() -> dict:
+    return {
+        "maxPoolSize": settings.mongo_pool_max,
+        "minPoolSize": settings.mongo_pool_min,
+        "maxIdleTimeMS": settings.mongo_pool_ocioso_ms,
+        "waitQueueTimeoutMS": settings.mongo_pool_espera_ms or None,
+        "serverSelectionTimeoutMS": settings.mongo_timeout_selecao_ms,
+    }
+
+
+def obter_cliente_mongo(uri: str | None = None) -> MongoClient:
+    """Retorna o cliente compartilhado da URI (padrão: `settings.mongo_uri`)."""
+    uri = uri or settings.mongo_uri
+    with _lock:
+        cliente = _clientes.get(uri)
+        if cliente is None:
+            cliente = _clientes[uri] = MongoClient(uri, **_configuracao())
+        return cliente
+
+
+def abrir_cliente_mongo() -> None:
+    """Cria o cliente padrão; chamado na inicialização da aplicação."""
+    obter_cliente_mongo()
+    logger.info(
+        f"Cliente MongoDB aberto (pool: {settings.mongo_pool_min}-{settings.mongo_pool_max})"
+    )
+
+
+def fechar_clientes_mongo() -> None:
+    """Fecha os clientes compartilhados e seus pools de conexões."""
+    with _lock:
+        clientes = list(_clientes.values())
+        _clientes.clear()
+    for cliente in clientes:
+        cliente.close()
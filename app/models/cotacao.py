@@ -7,3 +7,4 @@ class Cotacao(BaseModel):
     moeda_destino: str
     valor: float
     data_consulta: datetime
+    desatualizada: bool = False
@@ -15,3 +15,4 @@ class SolicitacaoCredito(BaseModel):
     limite_atual: float
     novo_limite_solicitado: float
     status_pedido: StatusSolicitacao = StatusSolicitacao.PENDENTE
+    score: int | None = None
@@ -0,0 +1,99 @@
+"""Atualização periódica das cotações em background, com registro no histórico."""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from app.config import settings
+from app.models import Cotacao
+from app.services.cambio_service import MOEDAS_DISPONIVEIS, CambioService
+from app.storage.arquivos import TravaArquivo
+from app.storage.historico_cotacoes import HistoricoCotacoes, obter_historico_cotacoes
+
+logger = logging.getLogger(__name__)
+
+
+class AtualizadorCotacoes:
+    """
+    Busca as cotações das moedas a cada `intervalo` segundos, mantendo o cache
+    aquecido, e acrescenta cada cotação obtida ao histórico.
+
+    Sem `moedas`, cada ciclo atualiza as `moedas_base` (padrão: as moedas
+    oferecidas pelo agente) e as demais consultadas (X→BRL) nos últimos
+    `janela` segundos, para que a primeira consulta após um período ocioso
+    também encontre o cache aquecido.
+    Com vários workers, só o que obtém a trava do histórico executa os ciclos;
+    os demais tentam de novo a cada intervalo.
+    """
+
+    def __init__(
+        self,
+        cambio_service: CambioService | None = None,
+        historico: HistoricoCotacoes | None = None,
+        moedas: Iterable[str] | None = None,
+        intervalo: float | None = None,
+        janela: float | None = None,
+        moedas_base: Iterable[str] | None = None,
+    ):
+        self.cambio_service = cambio_service or CambioService()
+        self.historico = historico or obter_historico_cotacoes()
+        self.moedas = list(moedas) if moedas is not None else None
+        self.intervalo = settings.cambio_atualizacao_intervalo_s if intervalo is None else intervalo
+        self.janela = settings.cambio_atualizacao_janela_s if janela is None else janela
+        if moedas_base is None:
+            moedas_base = settings.cambio_atualizacao_moedas_base
+        self.moedas_base = set(MOEDAS_DISPONIVEIS if moedas_base is None else moedas_base)
+        self.trava = TravaArquivo(self.historico.path.with_suffix(".atualizador.lock"))
+        self._tarefa: asyncio.Task | None = None
+
+    def moedas_do_ciclo(self) -> list[str]:
+        """Moedas atualizadas no próximo ciclo."""
+        if self.moedas is not None:
+            return self.moedas
+        pares = self.cambio_service.cache.pares_recentes(self.janela)
+        consultadas = {origem for origem, destino in pares if destino == "BRL"}
+        return sorted(self.moedas_base | consultadas)
+
+    async def executar_ciclo(self) -> list[Cotacao]:
+        """Atualiza as cotações uma vez e as registra no histórico."""
+        moedas = self.moedas_do_ciclo()
+        if not moedas:
+            return []
+        cotacoes = await self.cambio_service.atualizar_cotacoes(moedas)
+        if cotacoes:
+            await asyncio.to_thread(self.historico.registrar, cotacoes)
+        faltando = len(moedas) - len(cotacoes)
+        if faltando:
+            logger.warning(f"Atualização de cotações: {faltando} moeda(s) sem cotação")
+        return cotacoes
+
+    async def _executar_ciclos(self) -> None:
+        while True:
+            try:
+                await self.executar_ciclo()
+            except Exception as e:
+                logger.error(f"Falha na atualização de cotações: {e}")
+            await asyncio.sleep(self.intervalo)
+
+    async def _executar(self) -> None:
+        while True:
+            with self.trava.tentar_exclusiva() as lider:
+                if lider:
+                    logger.info("Atualização de cotações ativa neste processo")
+                    await self._executar_ciclos()
+            await asyncio.sleep(self.intervalo)
+
+    def iniciar(self) -> None:
+        """Inicia a atualização periódica no event loop atual (o primeiro ciclo é imediato)."""
+        if self._tarefa is None or self._tarefa.done():
+            self._tarefa = asyncio.create_task(self._executar())
+
+    async def parar(self) -> None:
+        if self._tarefa is None:
+            return
+        self._tarefa.cancel()
+        try:
+            await self._tarefa
+        except asyncio.CancelledError:
+            pass
+        self._tarefa = None
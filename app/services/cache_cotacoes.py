@@ -0,0 +1,245 @@
+"""Cache de cotações por par de moedas, com TTL e stale-while-revalidate."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+
+from app.config import settings
+from app.models import Cotacao
+
+logger = logging.getLogger(__name__)
+
+
+class BuscaCanceladaError(Exception):
+    """A busca compartilhada foi cancelada antes de terminar; quem esperava tenta de novo."""
+
+
+def _em_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class CacheCotacoes:
+    """
+    Guarda a última cotação de cada par `(moeda_origem, moeda_destino)`.
+
+    Até `ttl` segundos após a consulta a cotação é servida direto do cache. Na
+    janela seguinte, de `janela_stale` segundos, ela continua sendo servida
+    imediatamente, mas uma única atualização roda em background; depois disso
+    a próxima consulta espera uma nova busca.
+
+    Buscas são deduplicadas por par (single-flight): enquanto uma busca está
+    em andamento, threads e tasks asyncio que pedem o mesmo par aguardam o
+    mesmo `Future` em vez de disparar outra requisição. A exceção é a chamada
+    síncrona feita de dentro de um event loop: esperar ali poderia bloquear o
+    loop do qual a busca depende, então ela recebe a última cotação conhecida
+    (marcada como desatualizada) ou faz a sua própria busca. Se a busca
+    compartilhada for cancelada, quem a esperava tenta de novo.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        janela_stale: float | None = None,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = settings.cambio_cache_ttl_s if ttl is None else ttl
+        self.janela_stale = (
+            settings.cambio_cache_stale_s if janela_stale is None else janela_stale
+        )
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._entradas: dict[tuple[str, str], tuple[Cotacao, float]] = {}
+        self._atualizando: set[tuple[str, str]] = set()
+        self._em_voo: dict[tuple[str, str], Future] = {}
+        self._tarefas: set[asyncio.Task] = set()
+        self._consultas: dict[tuple[str, str], float] = {}
+
+    def _consultar(self, chave: tuple[str, str]) -> tuple[Cotacao | None, bool]:
+        """
+        Retorna a cotação utilizável do cache (ou None) e se uma atualização em
+        background deve ser iniciada pelo chamador.
+        """
+        with self._lock:
+            self._consultas[chave] = self._relogio()
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                return None, False
+            cotacao, obtida_em = entrada
+            idade = self._relogio() - obtida_em
+            if idade < self.ttl:
+                return cotacao, False
+            if idade < self.ttl + self.janela_stale:
+                if chave in self._atualizando:
+                    return cotacao, False
+                self._atualizando.add(chave)
+                return cotacao, True
+            return None, False
+
+    def _entrar_no_voo(self, chave: tuple[str, str]) -> tuple[Future, bool]:
+        """Retorna o `Future` da busca do par e se o chamador é quem deve fazê-la."""
+        with self._lock:
+            futuro = self._em_voo.get(chave)
+            if futuro is not None:
+                return futuro, False
+            futuro = Future()
+            # Marcado como em execução para que nenhum seguidor consiga cancelá-lo.
+            futuro.set_running_or_notify_cancel()
+            self._em_voo[chave] = futuro
+            return futuro, True
+
+    def _concluir_voo(
+        self,
+        chave: tuple[str, str],
+        futuro: Future,
+        cotacao: Cotacao | None,
+        erro: BaseException | None,
+    ) -> None:
+        with self._lock:
+            if erro is None:
+                self._entradas[chave] = (cotacao, self._relogio())
+            del self._em_voo[chave]
+        if erro is None:
+            futuro.set_result(cotacao)
+        else:
+            futuro.set_exception(erro)
+
+    def obter(self, chave: tuple[str, str], buscar: Callable[[], Cotacao]) -> Cotacao:
+        """Retorna a cotação do par, usando `buscar` quando o cache não a tem ou expirou."""
+        cotacao, atualizar = self._consultar(chave)
+        if atualizar:
+            threading.Thread(target=self._atualizar, args=(chave, buscar), daemon=True).start()
+        if cotacao is not None:
+            return cotacao
+        return self._buscar_unico(chave, buscar)
+
+    async def obter_async(
+        self, chave: tuple[str, str], buscar: Callable[[], Awaitable[Cotacao]]
+    ) -> Cotacao:
+        """Versão assíncrona de `obter`; `buscar` é uma função assíncrona."""
+        cotacao, atualizar = self._consultar(chave)
+        if atualizar:
+            tarefa = asyncio.create_task(self._atualizar_async(chave, buscar))
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(self._tarefas.discard)
+        if cotacao is not None:
+            return cotacao
+        return await self._buscar_unico_async(chave, buscar)
+
+    def atualizar(self, chave: tuple[str, str], buscar: Callable[[], Cotacao]) -> Cotacao:
+        """Busca o par mesmo que o cache esteja válido (ou junta-se à busca em andamento)."""
+        return self._buscar_unico(chave, buscar)
+
+    async def atualizar_async(
+        self, chave: tuple[str, str], buscar: Callable[[], Awaitable[Cotacao]]
+    ) -> Cotacao:
+        """Versão assíncrona de `atualizar`."""
+        return await self._buscar_unico_async(chave, buscar)
+
+    def _concluir_com_erro(self, chave: tuple[str, str], futuro: Future, erro: BaseException):
+        if isinstance(erro, asyncio.CancelledError):
+            erro = BuscaCanceladaError(f"Busca de {chave[0]}/{chave[1]} cancelada")
+        self._concluir_voo(chave, futuro, None, erro)
+
+    def _buscar_unico(self, chave: tuple[str, str], buscar: Callable[[], Cotacao]) -> Cotacao:
+        futuro, lider = self._entrar_no_voo(chave)
+        if not lider:
+            return self._seguir(chave, futuro, buscar)
+        try:
+            cotacao = buscar()
+        except BaseException as e:
+            self._concluir_com_erro(chave, futuro, e)
+            raise
+        self._concluir_voo(chave, futuro, cotacao, None)
+        return cotacao
+
+    def _seguir(
+        self, chave: tuple[str, str], futuro: Future, buscar: Callable[[], Cotacao]
+    ) -> Cotacao:
+        if not futuro.done() and _em_event_loop():
+            ultima = self.ultima(chave)
+            if ultima is not None:
+                return ultima.model_copy(update={"desatualizada": True})
+            cotacao = buscar()
+            with self._lock:
+                self._entradas[chave] = (cotacao, self._relogio())
+            return cotacao
+        try:
+            return futuro.result()
+        except BuscaCanceladaError:
+            return self._buscar_unico(chave, buscar)
+
+    async def _buscar_unico_async(
+        self, chave: tuple[str, str], buscar: Callable[[], Awaitable[Cotacao]]
+    ) -> Cotacao:
+        futuro, lider = self._entrar_no_voo(chave)
+        if not lider:
+            try:
+                # shield: cancelar quem espera não cancela a busca compartilhada.
+                return await asyncio.shield(asyncio.wrap_future(futuro))
+            except BuscaCanceladaError:
+                return await self._buscar_unico_async(chave, buscar)
+        try:
+            cotacao = await buscar()
+        except BaseException as e:
+            self._concluir_com_erro(chave, futuro, e)
+            raise
+        self._concluir_voo(chave, futuro, cotacao, None)
+        return cotacao
+
+    def _atualizar(self, chave: tuple[str, str], buscar: Callable[[], Cotacao]) -> None:
+        try:
+            self._buscar_unico(chave, buscar)
+        except Exception as e:
+            logger.warning(f"Falha ao atualizar cotação {chave[0]}/{chave[1]} em background: {e}")
+        finally:
+            with self._lock:
+                self._atualizando.discard(chave)
+
+    async def _atualizar_async(
+        self, chave: tuple[str, str], buscar: Callable[[], Awaitable[Cotacao]]
+    ) -> None:
+        try:
+            await self._buscar_unico_async(chave, buscar)
+        except Exception as e:
+            logger.warning(f"Falha ao atualizar cotação {chave[0]}/{chave[1]} em background: {e}")
+        finally:
+            with self._lock:
+                self._atualizando.discard(chave)
+
+    def ultima(self, chave: tuple[str, str]) -> Cotacao | None:
+        """Retorna a última cotação conhecida do par, mesmo expirada."""
+        with self._lock:
+            entrada = self._entradas.get(chave)
+        return entrada[0] if entrada is not None else None
+
+    def pares_recentes(self, janela: float) -> list[tuple[str, str]]:
+        """Pares consultados (por `obter`/`obter_async`) nos últimos `janela` segundos."""
+        limite = self._relogio() - janela
+        with self._lock:
+            for chave in [c for c, instante in self._consultas.items() if instante < limite]:
+                del self._consultas[chave]
+            return list(self._consultas)
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+
+
+_cache: CacheCotacoes | None = None
+_cache_lock = threading.Lock()
+
+
+def obter_cache_cotacoes() -> CacheCotacoes:
+    """Retorna o cache de cotações compartilhado pelo processo."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CacheCotacoes()
+        return _cache
@@ -1,14 +1,35 @@
+import asyncio
 import logging
-import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
 import httpx
 
 from app.config import settings
 from app.models import Cotacao
+from app.services.cache_cotacoes import CacheCotacoes, obter_cache_cotacoes
+from app.services.disjuntor import Disjuntor, obter_disjuntor
+from app.services.http_cambio import obter_cliente_http, obter_cliente_http_async
+from app.services.provedores_cambio import ProvedorCambio, obter_provedor_cambio
 
 logger = logging.getLogger(__name__)
 
+# Moedas oferecidas pelo agente de câmbio (código -> nome).
+MOEDAS_DISPONIVEIS = {
+    "USD": "Dolar Americano",
+    "EUR": "Euro",
+    "GBP": "Libra Esterlina",
+    "ARS": "Peso Argentino",
+    "CAD": "Dolar Canadense",
+    "AUD": "Dolar Australiano",
+    "JPY": "Iene Japones",
+    "CHF": "Franco Suico",
+    "CNY": "Yuan Chines",
+    "BTC": "Bitcoin",
+}
+
 
 class CambioAPIIndisponivelError(Exception):
     """Exceção lançada quando a API de câmbio está indisponível."""
@@ -17,77 +38,198 @@ class CambioAPIIndisponivelError(Exception):
 
 
 class CambioService:
-    BASE_URL = "https://serpapi.com/search.json"
     ERRO_API_INDISPONIVEL = (
         "A API de cotação de câmbio está indisponível no momento. "
         "Não é possível fornecer o valor da cotação agora. "
         "Por favor, peça ao cliente para tentar novamente em alguns minutos."
     )
 
+    def __init__(
+        self,
+        cache: CacheCotacoes | None = None,
+        cliente: httpx.Client | None = None,
+        cliente_async: httpx.AsyncClient | None = None,
+        disjuntor: Disjuntor | None = None,
+        provedor: ProvedorCambio | None = None,
+    ):
+        self.provedor = provedor or obter_provedor_cambio()
+        self.cache = cache or obter_cache_cotacoes()
+        self.disjuntor = disjuntor or obter_disjuntor(self.provedor.nome)
+        self._cliente = cliente
+        self._cliente_async = cliente_async
+
+    @property
+    def cliente(self) -> httpx.Client:
+        return self._cliente or obter_cliente_http()
+
+    @property
+    def cliente_async(self) -> httpx.AsyncClient:
+        return self._cliente_async or obter_cliente_http_async()
+
     def _tratar_erro_api(self, erro: Exception, tipo_erro: str) -> None:
         logger.error(f"{tipo_erro} ao consultar API de câmbio: {erro}")
         raise CambioAPIIndisponivelError(self.ERRO_API_INDISPONIVEL)
 
-    def _extrair_valor(self, texto: str) -> float | None:
-        texto = texto.replace(",", ".")
-        match = re.search(r"(\d+\.?\d*)", texto)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                return None
-        return None
-
-    def _parse_serpapi_response(self, data: dict) -> float | None:
-        valor = None
-
-        if "answer_box" in data:
-            answer = data["answer_box"]
-            if "result" in answer:
-                valor = self._extrair_valor(answer["result"])
-            elif "answer" in answer:
-                valor = self._extrair_valor(answer["answer"])
-
-        if valor is None and "knowledge_graph" in data:
-            kg = data["knowledge_graph"]
-            if "description" in kg:
-                valor = self._extrair_valor(kg["description"])
-
-        if valor is None and "organic_results" in data and len(data["organic_results"]) > 0:
-            snippet = data["organic_results"][0].get("snippet", "")
-            valor = self._extrair_valor(snippet)
-
-        return valor
-
     def obter_cotacao_sync(
         self, moeda_origem: str = "USD", moeda_destino: str = "BRL"
     ) -> Cotacao:
-        query = f"1 {moeda_origem} to {moeda_destino}"
+        """
+        Retorna a cotação do par, servida do cache enquanto estiver dentro do TTL
+        (ou da janela de stale-while-revalidate, com atualização em background).
 
-        params = {
-            "q": query,
-            "api_key": settings.serpapi_key,
-            "engine": "google",
-            "hl": "pt-br",
-            "gl": "br",
-        }
+        Se a API falhar (ou o disjuntor estiver aberto), retorna a última cotação
+        conhecida do par com `desatualizada=True`; sem ela, propaga o erro.
+        """
+        chave = (moeda_origem.upper(), moeda_destino.upper())
+        try:
+            return self.cache.obter(chave, lambda: self._buscar_cotacao(*chave))
+        except CambioAPIIndisponivelError:
+            ultima = self._ultima_conhecida(chave)
+            if ultima is None:
+                raise
+            return ultima
 
+    async def obter_cotacao(self, moeda_origem: str = "USD", moeda_destino: str = "BRL") -> Cotacao:
+        """Versão assíncrona de `obter_cotacao_sync`, sobre o cliente HTTP assíncrono."""
+        chave = (moeda_origem.upper(), moeda_destino.upper())
         try:
-            with httpx.Client() as client:
-                response = client.get(self.BASE_URL, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
+            return await self.cache.obter_async(chave, lambda: self._buscar_cotacao_async(*chave))
+        except CambioAPIIndisponivelError:
+            ultima = self._ultima_conhecida(chave)
+            if ultima is None:
+                raise
+            return ultima
+
+    def _ultima_conhecida(self, chave: tuple[str, str]) -> Cotacao | None:
+        ultima = self.cache.ultima(chave)
+        if ultima is None:
+            return None
+        logger.warning(
+            f"Usando última cotação conhecida de {chave[0]}/{chave[1]} "
+            f"({ultima.data_consulta:%H:%M})"
+        )
+        return ultima.model_copy(update={"desatualizada": True})
+
+    def obter_cotacoes_sync(
+        self, moedas: Iterable[str], moeda_destino: str = "BRL"
+    ) -> dict[str, Cotacao]:
+        """
+        Retorna as cotações de várias moedas em `moeda_destino`, buscadas em paralelo
+        (no máximo `CAMBIO_LOTE_PARALELISMO` por vez).
+
+        Só pares X→BRL são consultados; quando o destino não é BRL a cotação é
+        derivada por triangulação (X→BRL / destino→BRL). Moedas cuja cotação não
+        pôde ser obtida ficam de fora do resultado.
+        """
+        codigos, destino, pares = self._planejar_lote(moedas, moeda_destino)
+        if not pares:
+            return self._montar_lote(codigos, destino, {})
+        paralelismo = min(len(pares), settings.cambio_lote_paralelismo)
+        with ThreadPoolExecutor(max_workers=paralelismo) as executor:
+            em_brl = dict(zip(pares, executor.map(self._tentar_cotacao_sync, pares)))
+        return self._montar_lote(codigos, destino, em_brl)
+
+    async def obter_cotacoes(
+        self, moedas: Iterable[str], moeda_destino: str = "BRL"
+    ) -> dict[str, Cotacao]:
+        """Versão assíncrona de `obter_cotacoes_sync`."""
+        codigos, destino, pares = self._planejar_lote(moedas, moeda_destino)
+        em_brl = await self._em_paralelo(pares, self.obter_cotacao)
+        return self._montar_lote(codigos, destino, em_brl)
+
+    async def atualizar_cotacoes(self, moedas: Iterable[str]) -> list[Cotacao]:
+        """
+        Busca na API as cotações X→BRL das moedas, mesmo que estejam em cache, e
+        as guarda no cache. Retorna as cotações obtidas.
+        """
+        pares = [codigo.upper() for codigo in dict.fromkeys(moedas) if codigo.upper() != "BRL"]
+
+        async def atualizar(codigo: str, moeda_destino: str) -> Cotacao:
+            chave = (codigo, moeda_destino)
+            return await self.cache.atualizar_async(
+                chave, lambda: self._buscar_cotacao_async(*chave)
+            )
+
+        resultados = await self._em_paralelo(pares, atualizar)
+        return [cotacao for cotacao in resultados.values() if cotacao is not None]
 
-                valor = self._parse_serpapi_response(data)
+    async def _em_paralelo(self, pares: list[str], consultar) -> dict[str, Cotacao | None]:
+        """Executa `consultar(codigo, "BRL")` para cada moeda, com paralelismo limitado."""
+        semaforo = asyncio.Semaphore(settings.cambio_lote_paralelismo)
 
-                if valor:
-                    return Cotacao(
-                        moeda_origem=moeda_origem.upper(),
-                        moeda_destino=moeda_destino.upper(),
-                        valor=valor,
-                        data_consulta=datetime.now(),
-                    )
+        async def tentar(codigo: str) -> Cotacao | None:
+            async with semaforo:
+                try:
+                    return await consultar(codigo, "BRL")
+                except CambioAPIIndisponivelError:
+                    return None
 
+        resultados = await asyncio.gather(*(tentar(codigo) for codigo in pares))
+        return dict(zip(pares, resultados))
+
+    def _tentar_cotacao_sync(self, codigo: str) -> Cotacao | None:
+        try:
+            return self.obter_cotacao_sync(codigo, "BRL")
+        except CambioAPIIndisponivelError:
+            return None
+
+    @staticmethod
+    def _planejar_lote(
+        moedas: Iterable[str], moeda_destino: str
+    ) -> tuple[list[str], str, list[str]]:
+        """Normaliza as moedas pedidas e lista os pares X→BRL a consultar."""
+        destino = moeda_destino.upper().strip()
+        codigos = list(dict.fromkeys(m.upper().strip() for m in moedas if m.strip()))
+        codigos = [codigo for codigo in codigos if codigo != destino]
+        pares = [codigo for codigo in codigos if codigo != "BRL"]
+        if destino != "BRL" and codigos:
+            pares.append(destino)
+        return codigos, destino, pares
+
+    @staticmethod
+    def _montar_lote(
+        codigos: list[str], destino: str, em_brl: dict[str, Cotacao | None]
+    ) -> dict[str, Cotacao]:
+        if destino == "BRL":
+            return {codigo: em_brl[codigo] for codigo in codigos if em_brl.get(codigo)}
+        referencia = em_brl.get(destino)
+        if referencia is None:
+            return {}
+        resultado = {}
+        for codigo in codigos:
+            if codigo == "BRL":
+                cotacao = referencia.model_copy(update={"valor": 1.0})
+            elif em_brl.get(codigo) is not None:
+                cotacao = em_brl[codigo]
+            else:
+                continue
+            resultado[codigo] = Cotacao(
+                moeda_origem=codigo,
+                moeda_destino=destino,
+                valor=cotacao.valor / referencia.valor,
+                data_consulta=min(cotacao.data_consulta, referencia.data_consulta),
+                desatualizada=cotacao.desatualizada or referencia.desatualizada,
+            )
+        return resultado
+
+    @contextmanager
+    def _chamada_api(self) -> Iterator[None]:
+        """Passa a chamada pelo disjuntor e registra nele o resultado."""
+        if not self.disjuntor.permitir():
+            logger.debug("Disjuntor da API de câmbio aberto, chamada recusada")
+            raise CambioAPIIndisponivelError(self.ERRO_API_INDISPONIVEL)
+        try:
+            with self._erros_api():
+                yield
+        except CambioAPIIndisponivelError:
+            self.disjuntor.registrar_falha()
+            raise
+        self.disjuntor.registrar_sucesso()
+
+    @contextmanager
+    def _erros_api(self) -> Iterator[None]:
+        try:
+            yield
         except httpx.TimeoutException as e:
             self._tratar_erro_api(e, "Timeout")
         except httpx.HTTPError as e:
@@ -95,5 +237,31 @@ class CambioService:
         except (KeyError, ValueError) as e:
             self._tratar_erro_api(e, "Erro ao processar dados")
 
-        logger.warning("API de câmbio não retornou valor válido")
-        raise CambioAPIIndisponivelError(self.ERRO_API_INDISPONIVEL)
+    def _cotacao_da_resposta(
+        self, response: httpx.Response, moeda_origem: str, moeda_destino: str
+    ) -> Cotacao:
+        response.raise_for_status()
+        valor = self.provedor.extrair_cotacao(response.json())
+        if not valor:
+            logger.warning("API de câmbio não retornou valor válido")
+            raise CambioAPIIndisponivelError(self.ERRO_API_INDISPONIVEL)
+        return Cotacao(
+            moeda_origem=moeda_origem.upper(),
+            moeda_destino=moeda_destino.upper(),
+            valor=valor,
+            data_consulta=datetime.now(),
+        )
+
+    def _buscar_cotacao(self, moeda_origem: str, moeda_destino: str) -> Cotacao:
+        with self._chamada_api():
+            response = self.cliente.get(
+                self.provedor.url, params=self.provedor.parametros(moeda_origem, moeda_destino)
+            )
+            return self._cotacao_da_resposta(response, moeda_origem, moeda_destino)
+
+    async def _buscar_cotacao_async(self, moeda_origem: str, moeda_destino: str) -> Cotacao:
+        with self._chamada_api():
+            response = await self.cliente_async.get(
+                self.provedor.url, params=self.provedor.parametros(moeda_origem, moeda_destino)
+            )
+            return self._cotacao_da_resposta(response, moeda_origem, moeda_destino)
@@ -1,38 +1,44 @@
-import csv
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
 from app.models import Cliente
+from app.services.faixas_score import obter_tabela_faixas_score
+from app.storage import ClienteStorage, obter_storage_clientes
+from app.storage.colunar import SnapshotColunar, obter_colunar_clientes
 
 
 class ClienteService:
-    def __init__(self, csv_path: str | None = None, score_limite_path: str | None = None):
+    def __init__(
+        self,
+        csv_path: str | None = None,
+        score_limite_path: str | None = None,
+        storage: ClienteStorage | None = None,
+    ):
         if csv_path is None:
             csv_path = Path(__file__).parent.parent / "data" / "clientes.csv"
         if score_limite_path is None:
             score_limite_path = Path(__file__).parent.parent / "data" / "score_limite.csv"
         self.csv_path = Path(csv_path)
         self.score_limite_path = Path(score_limite_path)
+        self._storage = storage or obter_storage_clientes(self.csv_path)
+
+    @staticmethod
+    def _row_para_cliente(row: dict[str, str]) -> Cliente:
+        return Cliente(
+            cpf=row["cpf"],
+            nome=row["nome"],
+            data_nascimento=datetime.strptime(row["data_nascimento"], "%Y-%m-%d").date(),
+            score=int(row["score"]),
+            limite_atual=float(row["limite_atual"]),
+        )
 
     def buscar_por_cpf(self, cpf: str) -> Cliente | None:
         cpf_limpo = cpf.replace(".", "").replace("-", "")
-        try:
-            with open(self.csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row["cpf"] == cpf_limpo:
-                        return Cliente(
-                            cpf=row["cpf"],
-                            nome=row["nome"],
-                            data_nascimento=datetime.strptime(
-                                row["data_nascimento"], "%Y-%m-%d"
-                            ).date(),
-                            score=int(row["score"]),
-                            limite_atual=float(row["limite_atual"]),
-                        )
-        except FileNotFoundError:
+        row = self._storage.obter(cpf_limpo)
+        if row is None:
             return None
-        return None
+        return self._row_para_cliente(row)
 
     def autenticar(self, cpf: str, data_nascimento: str) -> Cliente | None:
         cliente = self.buscar_por_cpf(cpf)
@@ -53,71 +59,24 @@ class ClienteService:
 
     def atualizar_score(self, cpf: str, novo_score: int) -> bool:
         cpf_limpo = cpf.replace(".", "").replace("-", "")
-        linhas = []
-        encontrado = False
-
-        try:
-            with open(self.csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames
-                for row in reader:
-                    if row["cpf"] == cpf_limpo:
-                        row["score"] = str(novo_score)
-                        encontrado = True
-                    linhas.append(row)
-        except FileNotFoundError:
-            return False
-
-        if not encontrado:
-            return False
-
-        with open(self.csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(linhas)
+        return self._storage.atualizar_campo(cpf_limpo, "score", str(novo_score))
 
-        return True
+    def atualizar_scores(self, scores: dict[str, int], apenas_maiores: bool = False) -> int:
+        """
+        Atualiza o score de vários clientes de uma vez; retorna quantos foram atualizados.
+        Com `apenas_maiores`, nenhum score é reduzido, mesmo que mude após a leitura.
+        """
+        return self._storage.atualizar_em_lote(
+            "score", {cpf: str(score) for cpf, score in scores.items()}, apenas_maiores
+        )
 
     def atualizar_limite(self, cpf: str, novo_limite: float) -> bool:
         cpf_limpo = cpf.replace(".", "").replace("-", "")
-        linhas = []
-        encontrado = False
-
-        try:
-            with open(self.csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames
-                for row in reader:
-                    if row["cpf"] == cpf_limpo:
-                        row["limite_atual"] = f"{novo_limite:.2f}"
-                        encontrado = True
-                    linhas.append(row)
-        except FileNotFoundError:
-            return False
-
-        if not encontrado:
-            return False
-
-        with open(self.csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(linhas)
-
-        return True
+        return self._storage.atualizar_campo(cpf_limpo, "limite_atual", f"{novo_limite:.2f}")
 
     def calcular_limite_por_score(self, score: int) -> float:
         """Calcula o limite máximo baseado no score consultando a tabela score_limite.csv"""
-        try:
-            with open(self.score_limite_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    score_min = int(row["score_minimo"])
-                    score_max = int(row["score_maximo"])
-                    if score_min <= score <= score_max:
-                        return float(row["limite_maximo"])
-        except FileNotFoundError:
-            return 0.0
-        return 0.0
+        return obter_tabela_faixas_score(self.score_limite_path).limite_maximo(score)
 
     def adicionar_cliente(
         self, cpf: str, nome: str, data_nascimento: str, score: int
@@ -142,57 +101,77 @@ class ClienteService:
 
         limite = self.calcular_limite_por_score(score)
 
+        row = {
+            "cpf": cpf_limpo,
+            "nome": nome,
+            "data_nascimento": data_nascimento,
+            "score": str(score),
+            "limite_atual": f"{limite:.2f}",
+        }
+
         try:
-            with open(self.csv_path, "a", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=[
-                        "cpf",
-                        "nome",
-                        "data_nascimento",
-                        "score",
-                        "limite_atual",
-                    ],
-                )
-                writer.writerow(
-                    {
-                        "cpf": cpf_limpo,
-                        "nome": nome,
-                        "data_nascimento": data_nascimento,
-                        "score": score,
-                        "limite_atual": f"{limite:.2f}",
-                    }
-                )
-            return True
+            return self._storage.adicionar(row)
         except Exception:
             return False
 
     def listar_todos(self) -> list[Cliente]:
         """Lista todos os clientes do CSV"""
         clientes = []
-        try:
-            with open(self.csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        clientes.append(
-                            Cliente(
-                                cpf=row["cpf"],
-                                nome=row["nome"],
-                                data_nascimento=datetime.strptime(
-                                    row["data_nascimento"], "%Y-%m-%d"
-                                ).date(),
-                                score=int(row["score"]),
-                                limite_atual=float(row["limite_atual"]),
-                            )
-                        )
-                    except Exception:
-                        import logging
-                        logger = logging.getLogger(__name__)
-                        logger.warning(
-                            f"Cliente com dados inválidos ignorado: CPF={row.get('cpf', 'N/A')}"
-                        )
-                        continue
-        except FileNotFoundError:
-            return []
+        for row in self._storage.linhas():
+            try:
+                clientes.append(self._row_para_cliente(row))
+            except Exception:
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning(
+                    f"Cliente com dados inválidos ignorado: CPF={row.get('cpf', 'N/A')}"
+                )
+                continue
         return clientes
+
+    def snapshot_colunar(self) -> SnapshotColunar:
+        """Retorna o snapshot colunar (ordenado por CPF) da base de clientes"""
+        diretorio = self.csv_path.with_suffix(".colunar")
+        return obter_colunar_clientes(self._storage, diretorio).snapshot()
+
+    def filtrar(
+        self,
+        score_min: int | None = None,
+        score_max: int | None = None,
+        limite_min: float | None = None,
+        limite_max: float | None = None,
+    ) -> list[Cliente]:
+        """Lista, ordenados por CPF, os clientes dentro das faixas de score e limite"""
+        snapshot = self.snapshot_colunar()
+        return snapshot.materializar(
+            snapshot.filtrar(score_min, score_max, limite_min, limite_max)
+        )
+
+    def iterar(
+        self,
+        after_cpf: str | None = None,
+        score_min: int | None = None,
+        score_max: int | None = None,
+        limite_min: float | None = None,
+        limite_max: float | None = None,
+        nome_prefixo: str | None = None,
+    ) -> Iterator[Cliente]:
+        """Gera, em ordem de CPF e sem montar a lista, os clientes que atendem aos filtros"""
+        snapshot = self.snapshot_colunar()
+        if after_cpf:
+            after_cpf = after_cpf.replace(".", "").replace("-", "")
+        for i in snapshot.iterar_indices(
+            after_cpf, score_min, score_max, limite_min, limite_max, nome_prefixo
+        ):
+            yield snapshot.materializar([i])[0]
+
+    def estatisticas(
+        self,
+        score_min: int | None = None,
+        score_max: int | None = None,
+        limite_min: float | None = None,
+        limite_max: float | None = None,
+    ) -> dict:
+        """Calcula agregados de score e limite dos clientes dentro das faixas"""
+        snapshot = self.snapshot_colunar()
+        return snapshot.agregados(snapshot.filtrar(score_min, score_max, limite_min, limite_max))
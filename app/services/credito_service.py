@@ -1,8 +1,38 @@
-import csv
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+from app.config import settings
 from app.models import SolicitacaoCredito, StatusSolicitacao
+from app.services.faixas_score import obter_tabela_faixas_score
+from app.services.score_service import TIPOS_EMPREGO_ACEITOS, ScoreService, TipoEmprego
+from app.storage import SolicitacaoStorage, obter_storage_solicitacoes
+
+
+class SimulacaoInvalidaError(ValueError):
+    """Exceção lançada quando os dados de uma simulação de crédito são inválidos."""
+
+    pass
+
+
+_score_service = ScoreService()
+
+
+@lru_cache(maxsize=settings.simulacao_cache_tamanho)
+def _score_simulado(
+    renda_mensal: float,
+    tipo_emprego: TipoEmprego,
+    despesas_fixas: float,
+    num_dependentes: int,
+    tem_dividas: bool,
+) -> int:
+    return _score_service.calcular_score(
+        renda_mensal=renda_mensal,
+        tipo_emprego=tipo_emprego,
+        despesas_fixas=despesas_fixas,
+        num_dependentes=num_dependentes,
+        tem_dividas=tem_dividas,
+    )
 
 
 class CreditoService:
@@ -10,23 +40,115 @@ class CreditoService:
         self,
         solicitacoes_path: str | None = None,
         score_limite_path: str | None = None,
+        storage: SolicitacaoStorage | None = None,
     ):
         base_path = Path(__file__).parent.parent / "data"
         self.solicitacoes_path = Path(solicitacoes_path or base_path / "solicitacoes_aumento_limite.csv")
         self.score_limite_path = Path(score_limite_path or base_path / "score_limite.csv")
+        self._storage = storage or obter_storage_solicitacoes(self.solicitacoes_path)
 
     def obter_limite_maximo_por_score(self, score: int) -> float:
-        try:
-            with open(self.score_limite_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    score_min = int(row["score_minimo"])
-                    score_max = int(row["score_maximo"])
-                    if score_min <= score <= score_max:
-                        return float(row["limite_maximo"])
-        except FileNotFoundError:
-            pass
-        return 0.0
+        return obter_tabela_faixas_score(self.score_limite_path).limite_maximo(score)
+
+    @staticmethod
+    def _validar_perfil(
+        renda_mensal: float, tipo_emprego: str, despesas_mensais: float
+    ) -> TipoEmprego:
+        tipo = TIPOS_EMPREGO_ACEITOS.get(tipo_emprego.upper().strip())
+        if tipo is None:
+            raise SimulacaoInvalidaError(
+                "Tipo de emprego invalido. Use: CLT, FORMAL, PJ, AUTONOMO ou DESEMPREGADO"
+            )
+        if renda_mensal <= 0:
+            raise SimulacaoInvalidaError("Renda mensal deve ser maior que zero")
+        if despesas_mensais < 0:
+            raise SimulacaoInvalidaError("Despesas mensais nao podem ser negativas")
+        return tipo
+
+    @staticmethod
+    def normalizar_perfil(
+        renda_mensal: float,
+        tipo_emprego: str,
+        despesas_mensais: float,
+        num_dependentes: int,
+        dividas_atuais: float,
+    ) -> tuple[float, TipoEmprego, float, int, bool]:
+        """
+        Valida o perfil e o reduz aos valores que influenciam o score.
+
+        Valores em centavos, 3 ou mais dependentes e qualquer dívida positiva
+        têm o mesmo peso, então perfis que diferem só nisso viram a mesma chave.
+        Usado só como chave do cache de simulações.
+        """
+        tipo = CreditoService._validar_perfil(renda_mensal, tipo_emprego, despesas_mensais)
+        if num_dependentes < 0:
+            raise SimulacaoInvalidaError("Numero de dependentes nao pode ser negativo")
+        return (
+            round(renda_mensal, 2),
+            tipo,
+            round(despesas_mensais, 2),
+            min(num_dependentes, 3),
+            dividas_atuais > 0,
+        )
+
+    def simular(
+        self,
+        renda_mensal: float,
+        tipo_emprego: str,
+        despesas_mensais: float,
+        num_dependentes: int,
+        dividas_atuais: float,
+    ) -> dict:
+        """
+        Calcula score, faixa e limite máximo de um perfil, sem gravar nada.
+
+        O score fica em um cache LRU (`SIMULACAO_CACHE_TAMANHO` perfis)
+        indexado pelo perfil normalizado; a faixa é consultada a cada chamada,
+        acompanhando alterações da tabela.
+        """
+        score = _score_simulado(
+            *self.normalizar_perfil(
+                renda_mensal, tipo_emprego, despesas_mensais, num_dependentes, dividas_atuais
+            )
+        )
+        faixa = obter_tabela_faixas_score(self.score_limite_path).faixa(score)
+        return {
+            "score": score,
+            "score_minimo": faixa[0] if faixa else None,
+            "score_maximo": faixa[1] if faixa else None,
+            "limite_maximo": faixa[2] if faixa else 0.0,
+        }
+
+    def calcular_score(
+        self,
+        renda_mensal: float,
+        tipo_emprego: str,
+        despesas_mensais: float,
+        num_dependentes: int,
+        dividas_atuais: float,
+    ) -> int:
+        """
+        Calcula o score a partir dos valores informados, sem normalização nem
+        cache; é o score gravado ao concluir a entrevista.
+        """
+        return _score_service.calcular_score(
+            renda_mensal=renda_mensal,
+            tipo_emprego=self._validar_perfil(renda_mensal, tipo_emprego, despesas_mensais),
+            despesas_fixas=despesas_mensais,
+            num_dependentes=num_dependentes,
+            tem_dividas=dividas_atuais > 0,
+        )
+
+    @staticmethod
+    def estatisticas_simulacao() -> dict:
+        """Acertos, faltas e ocupação do cache de simulações."""
+        info = _score_simulado.cache_info()
+        return {
+            "acertos": info.hits,
+            "faltas": info.misses,
+            "tamanho": info.currsize,
+            "capacidade": info.maxsize,
+        }
 
     def verificar_elegibilidade(
         self, score: int, limite_solicitado: float
@@ -51,27 +173,11 @@ class CreditoService:
             limite_atual=limite_atual,
             novo_limite_solicitado=novo_limite,
             status_pedido=status,
+            score=score,
         )
 
         self._salvar_solicitacao(solicitacao)
         return solicitacao
 
     def _salvar_solicitacao(self, solicitacao: SolicitacaoCredito) -> None:
-        arquivo_existe = self.solicitacoes_path.exists()
-        with open(self.solicitacoes_path, "a", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            if not arquivo_existe or self.solicitacoes_path.stat().st_size == 0:
-                writer.writerow([
-                    "cpf_cliente",
-                    "data_hora_solicitacao",
-                    "limite_atual",
-                    "novo_limite_solicitado",
-                    "status_pedido",
-                ])
-            writer.writerow([
-                solicitacao.cpf_cliente,
-                solicitacao.data_hora_solicitacao.isoformat(),
-                solicitacao.limite_atual,
-                solicitacao.novo_limite_solicitado,
-                solicitacao.status_pedido.value,
-            ])
+        self._storage.anexar(solicitacao)
@@ -0,0 +1,90 @@
+"""Disjuntor (circuit breaker) para chamadas a serviços externos."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Disjuntor:
+    """
+    Abre após `falhas_para_abrir` falhas consecutivas e passa a recusar chamadas.
+
+    Depois de `tempo_aberto` segundos, uma única chamada de teste é liberada
+    (meio aberto): se ela funcionar o disjuntor fecha, se falhar ele volta a
+    abrir por mais `tempo_aberto` segundos.
+    """
+
+    FECHADO = "fechado"
+    ABERTO = "aberto"
+    MEIO_ABERTO = "meio_aberto"
+
+    def __init__(
+        self,
+        nome: str = "",
+        falhas_para_abrir: int | None = None,
+        tempo_aberto: float | None = None,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        self.nome = nome
+        self.falhas_para_abrir = (
+            settings.cambio_disjuntor_falhas if falhas_para_abrir is None else falhas_para_abrir
+        )
+        self.tempo_aberto = (
+            settings.cambio_disjuntor_aberto_s if tempo_aberto is None else tempo_aberto
+        )
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._estado = self.FECHADO
+        self._falhas = 0
+        self._desde = 0.0
+
+    @property
+    def estado(self) -> str:
+        return self._estado
+
+    def permitir(self) -> bool:
+        """Indica se a chamada pode seguir; no meio aberto, só a chamada de teste segue."""
+        with self._lock:
+            if self._estado == self.FECHADO:
+                return True
+            # Também libera um novo teste se o anterior nunca registrou o resultado.
+            if self._relogio() - self._desde >= self.tempo_aberto:
+                self._estado = self.MEIO_ABERTO
+                self._desde = self._relogio()
+                return True
+            return False
+
+    def registrar_sucesso(self) -> None:
+        with self._lock:
+            if self._estado != self.FECHADO:
+                logger.info(f"Disjuntor {self.nome} fechado")
+            self._estado = self.FECHADO
+            self._falhas = 0
+
+    def registrar_falha(self) -> None:
+        with self._lock:
+            self._falhas += 1
+            if self._estado == self.MEIO_ABERTO or self._falhas >= self.falhas_para_abrir:
+                if self._estado == self.FECHADO:
+                    logger.warning(f"Disjuntor {self.nome} aberto após {self._falhas} falhas")
+                self._estado = self.ABERTO
+                self._desde = self._relogio()
+
+
+_disjuntores: dict[str, Disjuntor] = {}
+_disjuntores_lock = threading.Lock()
+
+
+def obter_disjuntor(nome: str) -> Disjuntor:
+    """Retorna o disjuntor compartilhado pelo processo para o serviço `nome`."""
+    with _disjuntores_lock:
+        disjuntor = _disjuntores.get(nome)
+        if disjuntor is None:
+            disjuntor = Disjuntor(nome)
+            _disjuntores[nome] = disjuntor
+        return disjuntor
@@ -0,0 +1,99 @@
+"""
+Extração de números das respostas dos provedores de câmbio.
+
+As expressões são compiladas uma vez. Os números seguem a convenção do locale
+(`decimal=","` para pt-BR, `"."` para en): com os dois separadores, o último é
+o decimal ("5.123,45", "5,123.45"); com um só, ele é decimal se for o do
+locale, e separador de milhar apenas quando separa grupos de três dígitos de
+um número que não começa com zero ("1.234" em pt-BR, mas "5.43" e "0.185" são
+decimais). Espaços não separáveis (U+00A0, U+202F) são sempre de milhar.
+"""
+
+import math
+import re
+from typing import NamedTuple
+
+# Parte inteira, primeiro separador, dígitos seguintes e o resto do número
+# ("5.123,45" -> "5", ".", "123", ",45"). Sem resto é a forma simples, a mais comum.
+_NUMERO = r"(\d+)(?:([.,\u00a0\u202f])(\d+))?((?:[.,\u00a0\u202f]\d+)*)"
+RE_NUMERO = re.compile(_NUMERO)
+# Em "1 Euro igual a 6,32 Real brasileiro" a cotação é o número após o "igual a".
+RE_APOS_IGUALDADE = re.compile(rf"(?:=|\bigual a\b|\bequals\b)\s*{_NUMERO}")
+RE_DIGITOS = re.compile(r"\d+")
+
+
+class ExtracaoCotacao(NamedTuple):
+    """Valor extraído e o ramo da resposta de onde ele veio (None se nada casou)."""
+
+    valor: float | None
+    ramo: str | None
+
+
+def _agrupado(inteiro: str, grupos: list[str]) -> bool:
+    return len(inteiro) <= 3 and inteiro[0] != "0" and all(len(g) == 3 for g in grupos)
+
+
+def _converter_simples(inteiro: str, separador: str | None, digitos: str, decimal: str) -> float:
+    if separador is None:
+        return float(inteiro)
+    if separador != decimal and _agrupado(inteiro, [digitos]):
+        return float(inteiro + digitos)
+    if separador in ".,":
+        return float(f"{inteiro}.{digitos}")
+    return math.nan
+
+
+def _converter_geral(texto: str, decimal: str) -> float:
+    texto = texto.replace("\u00a0", "").replace("\u202f", "")
+    tem_ponto, tem_virgula = "." in texto, "," in texto
+    if tem_ponto and tem_virgula:
+        separador = "." if texto.rfind(".") > texto.rfind(",") else ","
+        inteiro, _, fracao = texto.rpartition(separador)
+        inteiro = inteiro.replace("," if separador == "." else ".", "")
+        return float(f"{inteiro}.{fracao}") if RE_DIGITOS.fullmatch(inteiro) else math.nan
+    if not (tem_ponto or tem_virgula):
+        return float(texto)
+    partes = texto.split("." if tem_ponto else ",")
+    if len(partes) == 2:
+        return _converter_simples(partes[0], "." if tem_ponto else ",", partes[1], decimal)
+    # Vários separadores iguais só são válidos como milhar ("1.234.567").
+    return float("".join(partes)) if _agrupado(partes[0], partes[1:]) else math.nan
+
+
+def _converter(match: re.Match, decimal: str) -> float | None:
+    inteiro, separador, digitos, resto = match.group(1, 2, 3, 4)
+    if resto:
+        valor = _converter_geral(match.string[match.start(1) : match.end(4)], decimal)
+    else:
+        valor = _converter_simples(inteiro, separador, digitos, decimal)
+    return valor if math.isfinite(valor) else None
+
+
+def converter_numero(texto: str, decimal: str = ",") -> float | None:
+    """Converte um número formatado conforme o locale; None se não for um número."""
+    match = RE_NUMERO.fullmatch(texto.strip())
+    return _converter(match, decimal) if match is not None else None
+
+
+def numero_no_texto(texto: str, decimal: str = ",") -> float | None:
+    """
+    Retorna o número de um texto livre: o que segue um "=" ou "igual a", se
+    houver, senão o primeiro número do texto.
+    """
+    # Os testes de substring evitam a busca com alternância na maioria dos textos.
+    if "=" in texto or "igual a" in texto or "equals" in texto:
+        match = RE_APOS_IGUALDADE.search(texto)
+        if match is not None:
+            return _converter(match, decimal)
+    match = RE_NUMERO.search(texto)
+    return _converter(match, decimal) if match is not None else None
+
+
+def numero_do_campo(valor, decimal: str = ",") -> float | None:
+    """Converte um campo estruturado, numérico ou texto, em float."""
+    tipo = type(valor)
+    if tipo is float or tipo is int:
+        return float(valor) if math.isfinite(valor) else None
+    if tipo is str:
+        return numero_no_texto(valor, decimal)
+    return None
@@ -0,0 +1,133 @@
+"""Tabela de faixas de score -> limite máximo (`score_limite.csv`), carregada uma vez."""
+
+import csv
+import logging
+import os
+import threading
+from bisect import bisect_right
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FaixasScoreInvalidasError(Exception):
+    """Exceção lançada quando as faixas de `score_limite.csv` são inválidas."""
+
+    pass
+
+
+class TabelaFaixasScore:
+    """
+    Faixas de score ordenadas pelo score mínimo, com busca binária.
+
+    A tabela é lida uma vez e só é recarregada quando o mtime ou o tamanho do
+    arquivo mudam. As faixas precisam ser contíguas e sem sobreposição; se uma
+    recarga encontrar faixas inválidas, a última tabela válida continua em uso.
+    Um arquivo inexistente equivale a uma tabela vazia (limite 0.0).
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._assinatura: tuple[int, int] | None = None
+        self._carregada = False
+        self._definir([])
+
+    def _definir(self, faixas: list[tuple[int, int, float]]) -> None:
+        # Trocado de uma vez para que leitores concorrentes vejam um estado coerente.
+        self._estado = (
+            faixas,
+            [minimo for minimo, _, _ in faixas],
+            np.array([minimo for minimo, _, _ in faixas], dtype=np.int64),
+            np.array([maximo for _, maximo, _ in faixas], dtype=np.int64),
+            np.array([limite for _, _, limite in faixas], dtype=np.float64),
+        )
+
+    def _ler(self) -> list[tuple[int, int, float]]:
+        with open(self.path, encoding="utf-8") as f:
+            faixas = sorted(
+                (int(row["score_minimo"]), int(row["score_maximo"]), float(row["limite_maximo"]))
+                for row in csv.DictReader(f)
+            )
+
+        for minimo, maximo, _ in faixas:
+            if minimo > maximo:
+                raise FaixasScoreInvalidasError(
+                    f"Faixa {minimo}-{maximo} com mínimo acima do máximo"
+                )
+        for (_, maximo, _), (proximo, _, _) in zip(faixas, faixas[1:]):
+            if proximo <= maximo:
+                raise FaixasScoreInvalidasError(f"Faixas sobrepostas em {proximo}")
+            if proximo != maximo + 1:
+                raise FaixasScoreInvalidasError(f"Lacuna entre as faixas: {maximo} e {proximo}")
+        return faixas
+
+    def _garantir_atualizada(self) -> tuple:
+        try:
+            stat = os.stat(self.path)
+            assinatura = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            assinatura = None
+
+        with self._lock:
+            if self._carregada and assinatura == self._assinatura:
+                return self._estado
+            if assinatura is None:
+                self._definir([])
+            else:
+                try:
+                    self._definir(self._ler())
+                except (FaixasScoreInvalidasError, KeyError, ValueError) as e:
+                    if not self._carregada:
+                        raise FaixasScoreInvalidasError(f"{self.path}: {e}") from e
+                    logger.error(f"Tabela {self.path} inválida, mantendo a anterior: {e}")
+                except FileNotFoundError:
+                    self._definir([])
+            self._assinatura = assinatura
+            self._carregada = True
+            return self._estado
+
+    def faixas(self) -> list[tuple[int, int, float]]:
+        """Retorna as faixas `(score_minimo, score_maximo, limite_maximo)` em ordem."""
+        return list(self._garantir_atualizada()[0])
+
+    def faixa(self, score: int) -> tuple[int, int, float] | None:
+        """Retorna a faixa que contém o score, ou None."""
+        faixas, minimos, _, _, _ = self._garantir_atualizada()
+        i = bisect_right(minimos, score) - 1
+        if i < 0 or score > faixas[i][1]:
+            return None
+        return faixas[i]
+
+    def limite_maximo(self, score: int) -> float:
+        """Retorna o limite máximo da faixa do score, ou 0.0 fora da tabela."""
+        faixa = self.faixa(score)
+        return faixa[2] if faixa is not None else 0.0
+
+    def limites_para(self, scores) -> np.ndarray:
+        """Versão vetorizada de `limite_maximo` para um array de scores."""
+        faixas, _, minimos, maximos, limites = self._garantir_atualizada()
+        scores = np.asarray(scores)
+        if not faixas:
+            return np.zeros(scores.shape, dtype=np.float64)
+        indices = np.searchsorted(minimos, scores, side="right") - 1
+        seguros = np.maximum(indices, 0)
+        validos = (indices >= 0) & (scores <= maximos[seguros])
+        return np.where(validos, limites[seguros], 0.0)
+
+
+_tabelas: dict[Path, TabelaFaixasScore] = {}
+_tabelas_lock = threading.Lock()
+
+
+def obter_tabela_faixas_score(path: str | Path) -> TabelaFaixasScore:
+    """Retorna a tabela compartilhada pelo processo para o arquivo informado."""
+    chave = Path(path).resolve()
+    with _tabelas_lock:
+        tabela = _tabelas.get(chave)
+        if tabela is None:
+            tabela = TabelaFaixasScore(chave)
+            _tabelas[chave] = tabela
+        return tabela
@@ -0,0 +1,85 @@
+"""
+Clientes HTTP de longa duração usados nas consultas de câmbio.
+
+Os clientes mantêm um pool de conexões keep-alive (HTTP/2 quando o pacote `h2`
+está instalado), de modo que consultas seguidas reaproveitam conexões TCP/TLS
+já abertas. São abertos e fechados pelo lifespan da aplicação; fora dela (CLI,
+testes) são criados sob demanda no primeiro uso.
+"""
+
+import importlib.util
+import logging
+import threading
+
+import httpx
+
+from app.config import settings
+from app.services.replay_cambio import transporte_configurado
+
+logger = logging.getLogger(__name__)
+
+_cliente: httpx.Client | None = None
+_cliente_async: httpx.AsyncClient | None = None
+_lock = threading.Lock()
+
+
+def _usar_http2() -> bool:
+    return settings.cambio_http2 and importlib.util.find_spec("h2") is not None
+
+
+def _configuracao() -> dict:
+    # Com replay configurado, as respostas vêm das gravações e não da rede.
+    transporte = transporte_configurado()
+    if transporte is not None:
+        return {"transport": transporte}
+    return {
+        "http2": _usar_http2(),
+        "limits": httpx.Limits(
+            max_connections=settings.cambio_http_max_conexoes,
+            max_keepalive_connections=settings.cambio_http_max_keepalive,
+            keepalive_expiry=settings.cambio_http_keepalive_s,
+        ),
+        "timeout": httpx.Timeout(
+            settings.cambio_http_timeout_s, connect=settings.cambio_http_timeout_conexao_s
+        ),
+    }
+
+
+def obter_cliente_http() -> httpx.Client:
+    """Retorna o cliente síncrono compartilhado (usado pelas tools dos agentes)."""
+    global _cliente
+    with _lock:
+        if _cliente is None or _cliente.is_closed:
+            _cliente = httpx.Client(**_configuracao())
+        return _cliente
+
+
+def obter_cliente_http_async() -> httpx.AsyncClient:
+    """Retorna o cliente assíncrono compartilhado."""
+    global _cliente_async
+    with _lock:
+        if _cliente_async is None or _cliente_async.is_closed:
+            _cliente_async = httpx.AsyncClient(**_configuracao())
+        return _cliente_async
+
+
+def abrir_clientes_http() -> None:
+    """Cria os clientes compartilhados; chamado na inicialização da aplicação."""
+    obter_cliente_http()
+    obter_cliente_http_async()
+    if settings.cambio_replay_path:
+        logger.warning(f"Cotações de câmbio em modo replay: {settings.cambio_replay_path}")
+    else:
+        logger.info(f"Clientes HTTP de câmbio abertos (HTTP/2: {_usar_http2()})")
+
+
+async def fechar_clientes_http() -> None:
+    """Fecha os clientes compartilhados e suas conexões."""
+    global _cliente, _cliente_async
+    with _lock:
+        cliente, cliente_async = _cliente, _cliente_async
+        _cliente = _cliente_async = None
+    if cliente is not None:
+        cliente.close()
+    if cliente_async is not None:
+        await cliente_async.aclose()
@@ -0,0 +1,128 @@
+"""Provedores de cotação de câmbio, selecionados por `settings.cambio_provedor`."""
+
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+
+from app.config import settings
+from app.eventos import obter_eventos
+from app.services.extracao_cotacoes import ExtracaoCotacao, numero_do_campo
+
+eventos = obter_eventos("cambio")
+
+# As buscas são feitas com hl=pt-br: números em texto usam vírgula decimal.
+DECIMAL_SERPAPI = ","
+# Ramos da resposta na ordem de preferência, agrupados pela chave de primeiro nível:
+# campos numéricos estruturados primeiro, depois textos livres.
+RAMOS_SERPAPI = tuple(
+    (raiz, tuple((".".join(map(str, (raiz, *caminho))), caminho) for caminho in caminhos))
+    for raiz, caminhos in (
+        (
+            "answer_box",
+            (
+                ("currency_converter", "to", "price"),
+                ("extracted_value",),
+                ("exchange_rate",),
+                ("result",),
+                ("answer",),
+            ),
+        ),
+        ("knowledge_graph", (("description",),)),
+        ("organic_results", ((0, "snippet"),)),
+    )
+)
+
+
+def _campo(dados, caminho: tuple):
+    # Sem exceções no caminho comum: a maioria das respostas não tem quase todos os ramos.
+    for chave in caminho:
+        if type(dados) is dict:
+            dados = dados.get(chave)
+        elif type(dados) is list and type(chave) is int and chave < len(dados):
+            dados = dados[chave]
+        else:
+            return None
+    return dados
+
+
+class ProvedorCambio(ABC):
+    """
+    API externa de cotações.
+
+    O provedor só descreve a requisição e interpreta a resposta; transporte
+    (clientes HTTP compartilhados), cache e disjuntor ficam com `CambioService`,
+    de forma que os caminhos síncrono e assíncrono usam o mesmo provedor.
+    A contagem de respostas por ramo de extração fica em `ramos`.
+    """
+
+    nome: str
+    url_padrao: str
+
+    def __init__(self, url: str | None = None):
+        self.url = url or settings.cambio_provedor_url or self.url_padrao
+        self.ramos: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def parametros(self, moeda_origem: str, moeda_destino: str) -> dict[str, str]:
+        """Parâmetros de query da consulta do par."""
+
+    @abstractmethod
+    def interpretar(self, dados: dict) -> ExtracaoCotacao:
+        """Valor da cotação no JSON de resposta e o ramo de onde ele veio."""
+
+    def extrair_cotacao(self, dados: dict) -> float | None:
+        """Valor da cotação no JSON de resposta, ou None se não houver."""
+        if not isinstance(dados, dict):
+            raise ValueError(f"Resposta de {self.nome} não é um objeto JSON")
+        extracao = self.interpretar(dados)
+        with self._lock:
+            self.ramos[extracao.ramo] += 1
+        eventos.debug("cotacao_extraida", provedor=self.nome, ramo=extracao.ramo)
+        return extracao.valor
+
+
+class SerpApiProvedor(ProvedorCambio):
+    """Cotações extraídas da busca do Google via SerpAPI."""
+
+    nome = "serpapi"
+    url_padrao = "https://serpapi.com/search.json"
+
+    def parametros(self, moeda_origem: str, moeda_destino: str) -> dict[str, str]:
+        return {
+            "q": f"1 {moeda_origem} to {moeda_destino}",
+            "api_key": settings.serpapi_key,
+            "engine": "google",
+            "hl": "pt-br",
+            "gl": "br",
+        }
+
+    def interpretar(self, dados: dict) -> ExtracaoCotacao:
+        for raiz, ramos in RAMOS_SERPAPI:
+            trecho = dados.get(raiz)
+            if not trecho:
+                continue
+            for ramo, caminho in ramos:
+                campo = _campo(trecho, caminho)
+                if campo is None:
+                    continue
+                valor = numero_do_campo(campo, DECIMAL_SERPAPI)
+                if valor:
+                    return ExtracaoCotacao(valor, ramo)
+        return ExtracaoCotacao(None, None)
+
+
+PROVEDORES: dict[str, type[ProvedorCambio]] = {
+    SerpApiProvedor.nome: SerpApiProvedor,
+}
+
+
+def obter_provedor_cambio(nome: str | None = None) -> ProvedorCambio:
+    """Instancia o provedor `nome` (padrão: `settings.cambio_provedor`)."""
+    nome = nome or settings.cambio_provedor
+    try:
+        return PROVEDORES[nome]()
+    except KeyError:
+        raise ValueError(
+            f"Provedor de câmbio desconhecido: {nome} (disponíveis: {', '.join(PROVEDORES)})"
+        ) from None
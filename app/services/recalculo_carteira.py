@@ -0,0 +1,167 @@
+"""
+Recálculo em lote dos scores da carteira a partir de perfis financeiros.
+
+O arquivo de perfis é um CSV com as colunas `cpf`, `renda_mensal`,
+`tipo_emprego`, `despesas_mensais`, `num_dependentes` e `dividas_atuais`, os
+mesmos dados coletados na entrevista de crédito.
+
+Uso:
+    python -m app.services.recalculo_carteira PERFIS [--clientes ARQUIVO] [--lote 100000]
+"""
+
+import argparse
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.services.cliente_service import ClienteService
+from app.services.faixas_score import obter_tabela_faixas_score
+from app.services.score_service import TIPOS_EMPREGO_ACEITOS, ScoreService
+
+logger = logging.getLogger(__name__)
+
+COLUNAS_PERFIL = [
+    "cpf",
+    "renda_mensal",
+    "tipo_emprego",
+    "despesas_mensais",
+    "num_dependentes",
+    "dividas_atuais",
+]
+
+
+def recalcular_carteira(
+    perfis_path: str | Path,
+    cliente_service: ClienteService | None = None,
+    score_service: ScoreService | None = None,
+    tamanho_lote: int = 100_000,
+    progresso: Callable[[int, float], None] | None = None,
+) -> dict[str, int | float]:
+    """
+    Recalcula o score dos clientes presentes no arquivo de perfis.
+
+    Os perfis são lidos em lotes e cruzados por CPF com o snapshot colunar da
+    base (busca binária); scores e limites máximos são calculados vetorizados.
+    Como na entrevista, o score só muda quando nem ele nem o limite máximo da
+    nova faixa ficam abaixo do score e do limite atuais. As mudanças são
+    gravadas ao final, todas em um único snapshot da base; como o snapshot
+    lido pode estar defasado, a escrita confere de novo que nenhum score baixe.
+
+    `progresso` recebe, após cada lote, os perfis lidos e os segundos decorridos.
+    Retorna os contadores do processamento.
+    """
+    cliente_service = cliente_service or ClienteService()
+    score_service = score_service or ScoreService()
+    tabela = obter_tabela_faixas_score(cliente_service.score_limite_path)
+    snapshot = cliente_service.snapshot_colunar()
+    cpfs_base = snapshot.registros["cpf"]
+
+    contadores: Counter = Counter()
+    novos_scores: dict[str, int] = {}
+    inicio = time.perf_counter()
+
+    lotes = pd.read_csv(
+        perfis_path,
+        usecols=COLUNAS_PERFIL,
+        dtype={"cpf": str, "tipo_emprego": str},
+        chunksize=tamanho_lote,
+    )
+    for lote in lotes:
+        contadores["lidos"] += len(lote)
+
+        cpf = lote["cpf"].fillna("").str.replace(r"[.\-]", "", regex=True)
+        tipos = lote["tipo_emprego"].fillna("").str.upper().str.strip().map(TIPOS_EMPREGO_ACEITOS)
+        renda = pd.to_numeric(lote["renda_mensal"], errors="coerce")
+        despesas = pd.to_numeric(lote["despesas_mensais"], errors="coerce")
+        dependentes = pd.to_numeric(lote["num_dependentes"], errors="coerce")
+        dividas = pd.to_numeric(lote["dividas_atuais"], errors="coerce")
+
+        validos = (
+            (cpf.str.len() == 11)
+            & cpf.str.isdigit()
+            & tipos.notna()
+            & (renda > 0)
+            & (despesas >= 0)
+            & dependentes.notna()
+            & dividas.notna()
+        ).to_numpy()
+        contadores["invalidos"] += int(np.count_nonzero(~validos))
+
+        chaves = cpf.to_numpy()[validos].astype("S11")
+        posicoes = np.searchsorted(cpfs_base, chaves)
+        encontrados = posicoes < len(cpfs_base)
+        encontrados[encontrados] = cpfs_base[posicoes[encontrados]] == chaves[encontrados]
+        contadores["nao_encontrados"] += int(np.count_nonzero(~encontrados))
+
+        selecao = np.flatnonzero(validos)[encontrados]
+        registros = snapshot.registros[posicoes[encontrados]]
+        novos = score_service.calcular_scores_batch(
+            {
+                "renda_mensal": renda.to_numpy()[selecao],
+                "tipo_emprego": tipos.to_numpy()[selecao],
+                "despesas_fixas": despesas.to_numpy()[selecao],
+                "num_dependentes": dependentes.to_numpy()[selecao],
+                "tem_dividas": dividas.to_numpy()[selecao] > 0,
+            }
+        )
+        atuais = registros["score"].astype(np.int64)
+        pioraria = (novos < atuais) | (tabela.limites_para(novos) < registros["limite_atual"])
+        mudou = ~pioraria & (novos != atuais)
+        contadores["mantidos"] += int(np.count_nonzero(pioraria))
+        contadores["inalterados"] += int(np.count_nonzero(~pioraria & ~mudou))
+        novos_scores.update(
+            zip(registros["cpf"][mudou].astype(str).tolist(), novos[mudou].tolist())
+        )
+
+        if progresso is not None:
+            progresso(contadores["lidos"], time.perf_counter() - inicio)
+
+    contadores["atualizados"] = (
+        cliente_service.atualizar_scores(novos_scores, apenas_maiores=True) if novos_scores else 0
+    )
+    resultado: dict[str, int | float] = {
+        campo: contadores[campo]
+        for campo in ("lidos", "invalidos", "nao_encontrados", "mantidos", "inalterados")
+    }
+    resultado["atualizados"] = contadores["atualizados"]
+    resultado["segundos"] = time.perf_counter() - inicio
+    logger.info(f"Recálculo da carteira concluído: {resultado}")
+    return resultado
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Recalcula os scores da carteira a partir de um CSV de perfis financeiros."
+    )
+    parser.add_argument("perfis", help="CSV com os perfis financeiros dos clientes")
+    parser.add_argument("--clientes", default=None, help="CSV de clientes (padrão: app/data)")
+    parser.add_argument("--score-limite", default=None, help="tabela de faixas de score")
+    parser.add_argument("--lote", type=int, default=100_000, help="perfis lidos por lote")
+    args = parser.parse_args(argv)
+
+    def mostrar_progresso(lidos: int, segundos: float) -> None:
+        print(f"  {lidos:>12} perfis lidos  {lidos / max(segundos, 1e-9):>12.0f} perfis/s")
+
+    resultado = recalcular_carteira(
+        args.perfis,
+        ClienteService(args.clientes, args.score_limite),
+        tamanho_lote=args.lote,
+        progresso=mostrar_progresso,
+    )
+    print(
+        f"Perfis lidos: {resultado['lidos']} em {resultado['segundos']:.2f}s | "
+        f"atualizados: {resultado['atualizados']}, "
+        f"mantidos (score ou limite menor): {resultado['mantidos']}, "
+        f"inalterados: {resultado['inalterados']}, "
+        f"CPF não encontrado: {resultado['nao_encontrados']}, "
+        f"inválidos: {resultado['invalidos']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Reprodução offline de respostas gravadas da SerpAPI.
+
+`TransporteReplay` é um transporte httpx (síncrono e assíncrono) que responde
+às consultas de câmbio a partir de um JSON `{query: resposta}`, com latência e
+injeção de erros configuráveis. Com `CAMBIO_REPLAY_PATH` definido, os clientes
+HTTP da aplicação passam a usá-lo no lugar da rede; benchmarks e testes o usam
+diretamente.
+
+Uso (gravação das respostas reais, requer `SERPAPI_KEY`):
+    python -m app.services.replay_cambio SAIDA [--moedas USD EUR ...]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Literal
+
+import httpx
+
+from app.config import settings
+from app.services.provedores_cambio import SerpApiProvedor
+
+# Chaves da resposta que descrevem a busca (URLs, ids), descartadas na gravação.
+CAMPOS_DESCARTADOS = ("search_metadata", "search_parameters", "search_information")
+
+
+class TransporteReplay(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Responde pelo parâmetro `q` da requisição com a resposta gravada (404 se não
+    houver gravação para a consulta).
+
+    Cada requisição espera `latencia` segundos mais um acréscimo uniforme de até
+    `variacao` segundos. Com probabilidade `taxa_erro` ela falha: com HTTP 503,
+    ou, com `erro="timeout"`, com `httpx.ReadTimeout` após a espera.
+    """
+
+    def __init__(
+        self,
+        gravacoes: dict[str, dict],
+        latencia: float = 0.0,
+        variacao: float = 0.0,
+        taxa_erro: float = 0.0,
+        erro: Literal["503", "timeout"] = "503",
+        semente: int | None = None,
+    ):
+        self._corpos = {q: json.dumps(dados).encode() for q, dados in gravacoes.items()}
+        self.latencia = latencia
+        self.variacao = variacao
+        self.taxa_erro = taxa_erro
+        self.erro = erro
+        self.requisicoes = 0
+        self._rng = random.Random(semente)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def de_arquivo(cls, path: str | Path, **kwargs) -> "TransporteReplay":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), **kwargs)
+
+    def _sortear(self) -> tuple[float, bool]:
+        with self._lock:
+            self.requisicoes += 1
+            atraso = self.latencia + self.variacao * self._rng.random()
+            return atraso, self._rng.random() < self.taxa_erro
+
+    def _responder(self, request: httpx.Request, falhar: bool) -> httpx.Response:
+        if falhar:
+            if self.erro == "timeout":
+                raise httpx.ReadTimeout("Timeout simulado", request=request)
+            return httpx.Response(503, json={"error": "Erro simulado"}, request=request)
+        corpo = self._corpos.get(request.url.params.get("q", ""))
+        if corpo is None:
+            return httpx.Response(404, json={"error": "Consulta sem gravação"}, request=request)
+        return httpx.Response(
+            200, content=corpo, headers={"content-type": "application/json"}, request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        atraso, falhar = self._sortear()
+        if atraso:
+            time.sleep(atraso)
+        return self._responder(request, falhar)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        atraso, falhar = self._sortear()
+        if atraso:
+            await asyncio.sleep(atraso)
+        return self._responder(request, falhar)
+
+
+def transporte_configurado() -> TransporteReplay | None:
+    """Transporte de replay definido em settings, ou None para usar a rede."""
+    if not settings.cambio_replay_path:
+        return None
+    return TransporteReplay.de_arquivo(
+        settings.cambio_replay_path,
+        latencia=settings.cambio_replay_latencia_s,
+        taxa_erro=settings.cambio_replay_taxa_erro,
+    )
+
+
+def gravar(saida: str | Path, moedas: list[str], moeda_destino: str = "BRL") -> int:
+    """Consulta a SerpAPI para cada moeda e grava as respostas em `saida`."""
+    provedor = SerpApiProvedor()
+    gravacoes = {}
+    with httpx.Client(timeout=settings.cambio_http_timeout_s) as cliente:
+        for moeda in moedas:
+            parametros = provedor.parametros(moeda.upper(), moeda_destino.upper())
+            response = cliente.get(provedor.url, params=parametros)
+            response.raise_for_status()
+            dados = response.json()
+            for campo in CAMPOS_DESCARTADOS:
+                dados.pop(campo, None)
+            gravacoes[parametros["q"]] = dados
+    Path(saida).write_text(json.dumps(gravacoes, ensure_ascii=False, indent=2), encoding="utf-8")
+    return len(gravacoes)
+
+
+def main(argv: list[str] | None = None) -> None:
+    from app.services.cambio_service import MOEDAS_DISPONIVEIS
+
+    parser = argparse.ArgumentParser(description="Grava respostas da SerpAPI para replay.")
+    parser.add_argument("saida", help="arquivo JSON de saída")
+    parser.add_argument("--moedas", nargs="+", default=list(MOEDAS_DISPONIVEIS))
+    parser.add_argument("--destino", default="BRL")
+    args = parser.parse_args(argv)
+
+    total = gravar(args.saida, args.moedas, args.destino)
+    print(f"{total} respostas gravadas em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
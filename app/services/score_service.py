@@ -1,5 +1,13 @@
+import logging
+from collections.abc import Mapping
 from enum import Enum
 
+import numpy as np
+
+from app.eventos import obter_eventos
+
+eventos = obter_eventos("score")
+
 
 class TipoEmprego(str, Enum):
     """Tipos de emprego conforme desafio."""
@@ -10,6 +18,17 @@ class TipoEmprego(str, Enum):
     PJ = "autonomo"
 
 
+# Tipos de emprego aceitos na entrada (em maiúsculas), como informados pelo cliente.
+TIPOS_EMPREGO_ACEITOS = {
+    "CLT": TipoEmprego.FORMAL,
+    "FORMAL": TipoEmprego.FORMAL,
+    "PJ": TipoEmprego.AUTONOMO,
+    "AUTONOMO": TipoEmprego.AUTONOMO,
+    "AUTÔNOMO": TipoEmprego.AUTONOMO,
+    "DESEMPREGADO": TipoEmprego.DESEMPREGADO,
+}
+
+
 class ScoreService:
     PESO_RENDA = 30
     PESO_EMPREGO = {
@@ -37,11 +56,8 @@ class ScoreService:
         tem_dividas: bool,
     ) -> int:
         if despesas_fixas > renda_mensal:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                f"[SCORE] Dados suspeitos: despesas (R$ {despesas_fixas:.2f}) > renda (R$ {renda_mensal:.2f}). "
-                "Isso resulta em score muito baixo."
+            eventos.warning(
+                "score.despesas_maiores_que_renda", renda=renda_mensal, despesas=despesas_fixas
             )
 
         componente_renda = (renda_mensal / (despesas_fixas + 1)) * self.PESO_RENDA
@@ -62,15 +78,63 @@ class ScoreService:
             + componente_dividas
         )
 
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(
-            f"[SCORE] Calculo detalhado: "
-            f"Renda={renda_mensal:.2f}, Despesas={despesas_fixas:.2f}, "
-            f"Emprego={tipo_emprego.value}, Dependentes={num_dependentes}, Dividas={tem_dividas} | "
-            f"Componentes: renda={componente_renda:.2f}, emprego={componente_emprego}, "
-            f"dependentes={componente_dependentes}, dividas={componente_dividas} | "
-            f"Score final={int(score_calculado)}"
-        )
+        if eventos.habilitado(logging.INFO):
+            eventos.info(
+                "score.calculado",
+                renda=renda_mensal,
+                despesas=despesas_fixas,
+                emprego=tipo_emprego.value,
+                dependentes=num_dependentes,
+                dividas=tem_dividas,
+                componente_renda=componente_renda,
+                componente_emprego=componente_emprego,
+                componente_dependentes=componente_dependentes,
+                componente_dividas=componente_dividas,
+                score=int(score_calculado),
+            )
 
         return max(0, min(1000, int(score_calculado)))
+
+    def calcular_scores_batch(self, dados: Mapping) -> np.ndarray:
+        """
+        Calcula os scores de várias pessoas de uma vez.
+
+        `dados` é um DataFrame (ou dict de arrays) com as colunas `renda_mensal`,
+        `tipo_emprego`, `despesas_fixas`, `num_dependentes` e `tem_dividas`, nos
+        mesmos formatos de `calcular_score`. O resultado é idêntico ao cálculo
+        linha a linha, mas sem objetos nem logs por linha.
+        """
+        renda = np.asarray(dados["renda_mensal"], dtype=np.float64)
+        despesas = np.asarray(dados["despesas_fixas"], dtype=np.float64)
+        # dtype=object: com o dtype inferido, listas de enums viram textos truncados.
+        tipos = np.asarray(dados["tipo_emprego"], dtype=object)
+        dependentes = np.asarray(dados["num_dependentes"])
+        dividas = np.asarray(dados["tem_dividas"], dtype=bool)
+
+        suspeitos = int(np.count_nonzero(despesas > renda))
+        if suspeitos:
+            eventos.warning("score.lote.despesas_maiores_que_renda", registros=suspeitos)
+
+        componente_renda = (renda / (despesas + 1)) * self.PESO_RENDA
+
+        # Enums de TipoEmprego são str; no array de objetos a comparação é a do Python
+        # e funciona tanto com enums quanto com textos.
+        componente_emprego = np.zeros(len(renda), dtype=np.float64)
+        for tipo, peso in self.PESO_EMPREGO.items():
+            componente_emprego[tipos == tipo.value] = peso
+
+        componente_dependentes = np.where(dependentes >= 3, self.PESO_DEPENDENTES[3], 30)
+        for quantidade in (0, 1, 2):
+            componente_dependentes[dependentes == quantidade] = self.PESO_DEPENDENTES[quantidade]
+
+        componente_dividas = np.where(dividas, self.PESO_DIVIDAS[True], self.PESO_DIVIDAS[False])
+
+        score_calculado = (
+            componente_renda
+            + componente_emprego
+            + componente_dependentes
+            + componente_dividas
+        )
+        eventos.info("score.lote.calculado", registros=len(score_calculado))
+
+        return np.clip(np.trunc(score_calculado), 0, 1000).astype(np.int64)
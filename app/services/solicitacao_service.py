@@ -1,44 +1,104 @@
-import csv
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
 from app.models.solicitacao import SolicitacaoCredito, StatusSolicitacao
+from app.services.faixas_score import obter_tabela_faixas_score
+from app.storage import SolicitacaoStorage, obter_storage_solicitacoes
 
 
 class SolicitacaoService:
-    def __init__(self, csv_path: str | None = None):
+    def __init__(
+        self,
+        csv_path: str | None = None,
+        storage: SolicitacaoStorage | None = None,
+        score_limite_path: str | None = None,
+    ):
         if csv_path is None:
             csv_path = (
                 Path(__file__).parent.parent
                 / "data"
                 / "solicitacoes_aumento_limite.csv"
             )
+        if score_limite_path is None:
+            score_limite_path = Path(__file__).parent.parent / "data" / "score_limite.csv"
         self.csv_path = Path(csv_path)
+        self.score_limite_path = Path(score_limite_path)
+        self._storage = storage or obter_storage_solicitacoes(self.csv_path)
 
     def listar_todas(self) -> list[SolicitacaoCredito]:
-        """Lista todas as solicitações de aumento de limite do CSV"""
-        solicitacoes = []
-        try:
-            with open(self.csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    solicitacoes.append(
-                        SolicitacaoCredito(
-                            cpf_cliente=row["cpf_cliente"],
-                            data_hora_solicitacao=datetime.fromisoformat(
-                                row["data_hora_solicitacao"]
-                            ),
-                            limite_atual=float(row["limite_atual"]),
-                            novo_limite_solicitado=float(row["novo_limite_solicitado"]),
-                            status_pedido=StatusSolicitacao(row["status_pedido"]),
-                        )
-                    )
-        except FileNotFoundError:
-            return []
-        return solicitacoes
+        """Lista todas as solicitações de aumento de limite"""
+        return self._storage.listar()
 
     def listar_por_cpf(self, cpf: str) -> list[SolicitacaoCredito]:
         """Lista todas as solicitações de um cliente específico"""
         cpf_limpo = cpf.replace(".", "").replace("-", "")
-        todas = self.listar_todas()
-        return [s for s in todas if s.cpf_cliente == cpf_limpo]
+        return self._storage.listar_por_cpf(cpf_limpo)
+
+    def listar_periodo(
+        self,
+        desde: datetime | None = None,
+        ate: datetime | None = None,
+        cpf: str | None = None,
+    ) -> list[SolicitacaoCredito]:
+        """Lista as solicitações feitas entre `desde` (inclusive) e `ate` (exclusive)"""
+        if cpf is not None:
+            cpf = cpf.replace(".", "").replace("-", "")
+        return self._storage.listar_periodo(desde, ate, cpf)
+
+    def estatisticas(self, desde: date | None = None, ate: date | None = None) -> dict:
+        """
+        Calcula os indicadores das solicitações entre `desde` e `ate` (datas inclusivas).
+
+        Os valores vêm dos agregados diários mantidos pelo storage. A taxa de
+        aprovação considera apenas solicitações decididas (aprovadas ou rejeitadas).
+        """
+        totais = self._storage.resumo(desde, ate).totais()
+
+        def taxa(contagem: dict[str, int]) -> float | None:
+            aprovados = contagem.get(StatusSolicitacao.APROVADO.value, 0)
+            decididos = aprovados + contagem.get(StatusSolicitacao.REJEITADO.value, 0)
+            return aprovados / decididos if decididos else None
+
+        faixas = [
+            (f"{score_minimo}-{score_maximo}", score_minimo, score_maximo, {})
+            for score_minimo, score_maximo, _ in obter_tabela_faixas_score(
+                self.score_limite_path
+            ).faixas()
+        ]
+        sem_faixa: dict[str, int] = {}
+        for score, contagem in totais["por_score"].items():
+            destino = next(
+                (
+                    faixa[3]
+                    for faixa in faixas
+                    if score is not None and faixa[1] <= score <= faixa[2]
+                ),
+                sem_faixa,
+            )
+            for status, n in contagem.items():
+                destino[status] = destino.get(status, 0) + n
+        if sem_faixa:
+            faixas.append(("sem score", None, None, sem_faixa))
+
+        return {
+            "total": totais["total"],
+            "por_status": totais["por_status"],
+            "taxa_aprovacao": taxa(totais["por_status"]),
+            "media_limite_atual": totais["media_limite_atual"],
+            "media_novo_limite_solicitado": totais["media_novo_limite_solicitado"],
+            "por_faixa_score": [
+                {
+                    "faixa": faixa,
+                    "score_minimo": score_minimo,
+                    "score_maximo": score_maximo,
+                    "total": sum(contagem.values()),
+                    "aprovados": contagem.get(StatusSolicitacao.APROVADO.value, 0),
+                    "rejeitados": contagem.get(StatusSolicitacao.REJEITADO.value, 0),
+                    "taxa_aprovacao": taxa(contagem),
+                }
+                for faixa, score_minimo, score_maximo, contagem in faixas
+            ],
+            "distribuicao_limite_atual": totais["limite_atual"],
+            "distribuicao_novo_limite_solicitado": totais["novo_limite_solicitado"],
+            "distribuicao_aumento": totais["aumento"],
+        }
@@ -0,0 +1,20 @@
+from app.storage.backends import (
+    obter_banco_sqlite,
+    obter_storage_clientes,
+    obter_storage_solicitacoes,
+)
+from app.storage.base import ClienteStorage, SolicitacaoStorage
+from app.storage.historico_cotacoes import HistoricoCotacoes, obter_historico_cotacoes
+from app.storage.indice_clientes import IndiceClientes, obter_indice_clientes
+
+__all__ = [
+    "ClienteStorage",
+    "SolicitacaoStorage",
+    "IndiceClientes",
+    "obter_indice_clientes",
+    "HistoricoCotacoes",
+    "obter_historico_cotacoes",
+    "obter_banco_sqlite",
+    "obter_storage_clientes",
+    "obter_storage_solicitacoes",
+]
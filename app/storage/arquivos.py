@@ -0,0 +1,122 @@
+"""Primitivas de arquivo da camada de storage: travas e escrita atômica."""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+_travas_locais: dict[Path, threading.Lock] = {}
+_travas_locais_lock = threading.Lock()
+
+
+def _trava_local(path: Path) -> threading.Lock:
+    with _travas_locais_lock:
+        return _travas_locais.setdefault(path, threading.Lock())
+
+
+class TravaArquivo:
+    """
+    Trava consultiva leitor/escritor baseada em `fcntl.flock`.
+
+    Cada aquisição abre o seu próprio descritor do arquivo de trava, portanto a
+    exclusão vale tanto entre processos quanto entre threads do mesmo processo.
+    Em plataformas sem `fcntl` a trava degrada para um lock exclusivo local.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    @contextmanager
+    def _adquirir(self, operacao: int):
+        if fcntl is None:
+            with _trava_local(self.path.resolve()):
+                yield
+            return
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, operacao)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def compartilhada(self):
+        """Trava de leitura: várias podem ser mantidas ao mesmo tempo."""
+        return self._adquirir(fcntl.LOCK_SH if fcntl else 0)
+
+    def exclusiva(self):
+        """Trava de escrita: exclui leitores e outros escritores."""
+        return self._adquirir(fcntl.LOCK_EX if fcntl else 0)
+
+    @contextmanager
+    def tentar_exclusiva(self):
+        """Trava exclusiva sem espera: produz True se obtida, False se já estiver em uso."""
+        if fcntl is None:
+            trava = _trava_local(self.path.resolve())
+            obtida = trava.acquire(blocking=False)
+            try:
+                yield obtida
+            finally:
+                if obtida:
+                    trava.release()
+            return
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+@contextmanager
+def escrita_atomica(path: str | Path, modo: str = "w", **kwargs):
+    """
+    Escreve `path` por meio de um arquivo temporário e `os.replace`.
+
+    Leitores enxergam sempre o arquivo antigo ou o novo completo; o conteúdo é
+    sincronizado em disco antes da troca, e o temporário é removido em caso de erro.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, modo, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    _sincronizar_diretorio(path.parent)
+
+
+def _sincronizar_diretorio(diretorio: Path) -> None:
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(diretorio, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
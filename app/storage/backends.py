@@ -0,0 +1,40 @@
+"""Seleção do backend de armazenamento conforme `settings.storage_backend`."""
+
+import threading
+from pathlib import Path
+
+from app.config import settings
+from app.storage.base import ClienteStorage, SolicitacaoStorage
+from app.storage.indice_clientes import obter_indice_clientes
+from app.storage.solicitacoes_csv import CsvSolicitacaoStorage
+from app.storage.sqlite import BancoSqlite, SqliteClienteStorage, SqliteSolicitacaoStorage
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+_bancos: dict[Path, BancoSqlite] = {}
+_bancos_lock = threading.Lock()
+
+
+def obter_banco_sqlite(path: str | Path | None = None) -> BancoSqlite:
+    """Retorna o banco SQLite compartilhado pelo processo."""
+    chave = Path(path or settings.sqlite_path or DATA_DIR / "banking.db").resolve()
+    with _bancos_lock:
+        banco = _bancos.get(chave)
+        if banco is None:
+            banco = BancoSqlite(chave)
+            _bancos[chave] = banco
+        return banco
+
+
+def obter_storage_clientes(csv_path: str | Path) -> ClienteStorage:
+    """Storage de clientes do backend configurado; `csv_path` vale para o backend CSV."""
+    if settings.storage_backend == "sqlite":
+        return SqliteClienteStorage(obter_banco_sqlite())
+    return obter_indice_clientes(csv_path)
+
+
+def obter_storage_solicitacoes(csv_path: str | Path) -> SolicitacaoStorage:
+    """Storage de solicitações do backend configurado; `csv_path` vale para o backend CSV."""
+    if settings.storage_backend == "sqlite":
+        return SqliteSolicitacaoStorage(obter_banco_sqlite())
+    return CsvSolicitacaoStorage(csv_path)
@@ -0,0 +1,124 @@
+"""Interfaces dos backends de armazenamento."""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time, timedelta
+
+from app.models import SolicitacaoCredito
+from app.storage.resumo_solicitacoes import ResumoSolicitacoes
+
+
+class ClienteStorage(ABC):
+    """
+    Armazenamento da base de clientes.
+
+    As linhas são dicts com os campos de `CAMPOS_CLIENTE` serializados como texto,
+    no mesmo formato do CSV, independentemente do backend.
+    """
+
+    @abstractmethod
+    def obter(self, cpf: str) -> dict[str, str] | None:
+        """Retorna a linha do cliente com o CPF informado, ou None."""
+
+    @abstractmethod
+    def contem(self, cpf: str) -> bool:
+        """Indica se o CPF existe na base."""
+
+    @abstractmethod
+    def linhas(self) -> list[dict[str, str]]:
+        """Retorna todas as linhas na ordem de inclusão."""
+
+    @abstractmethod
+    def adicionar(self, row: dict[str, str]) -> bool:
+        """Inclui um cliente; retorna False se o CPF já existir."""
+
+    @abstractmethod
+    def atualizar_campo(self, cpf: str, campo: str, valor: str) -> bool:
+        """Atualiza um campo de um cliente; retorna False se o CPF não existir."""
+
+    def atualizar_em_lote(
+        self, campo: str, valores: dict[str, str], apenas_maiores: bool = False
+    ) -> int:
+        """
+        Atualiza um campo de vários clientes (CPF -> valor).
+
+        Com `apenas_maiores`, um valor só é gravado se for maior que o atual
+        (comparados como números), verificado no momento da escrita.
+        Retorna quantos clientes foram atualizados. Backends que conseguem
+        gravar tudo de uma vez devem sobrescrever esta implementação.
+        """
+        atualizados = 0
+        for cpf, valor in valores.items():
+            if apenas_maiores:
+                row = self.obter(cpf)
+                if row is None or float(row[campo]) >= float(valor):
+                    continue
+            atualizados += self.atualizar_campo(cpf, campo, valor)
+        return atualizados
+
+    def versao(self) -> str | None:
+        """
+        Identifica o conteúdo atual da base; muda a cada escrita.
+
+        Usado para invalidar estruturas derivadas, como o snapshot colunar.
+        None indica que o backend não sabe versionar e deve ser sempre relido.
+        """
+        return None
+
+    def versao_e_alteracoes(self) -> tuple[str | None, list[tuple[str, str, str]]]:
+        """
+        Retorna a versão da base sem as alterações pontuais e essas alterações.
+
+        As alterações `(cpf, campo, valor)` vêm na ordem em que foram gravadas e
+        a versão só muda quando a base é reescrita, de forma que estruturas
+        derivadas podem aplicá-las sem serem reconstruídas. A implementação
+        padrão não separa as alterações: retorna `versao()` e uma lista vazia.
+        """
+        return self.versao(), []
+
+
+class SolicitacaoStorage(ABC):
+    """Armazenamento do histórico de solicitações de aumento de limite."""
+
+    @abstractmethod
+    def anexar(self, solicitacao: SolicitacaoCredito) -> None:
+        """Registra uma nova solicitação."""
+
+    @abstractmethod
+    def listar(self) -> list[SolicitacaoCredito]:
+        """Retorna todas as solicitações na ordem de registro."""
+
+    @abstractmethod
+    def listar_por_cpf(self, cpf: str) -> list[SolicitacaoCredito]:
+        """Retorna as solicitações de um cliente na ordem de registro."""
+
+    @abstractmethod
+    def listar_periodo(
+        self,
+        desde: datetime | None = None,
+        ate: datetime | None = None,
+        cpf: str | None = None,
+    ) -> list[SolicitacaoCredito]:
+        """
+        Retorna as solicitações com `desde <= data_hora < ate`, em ordem cronológica,
+        opcionalmente restritas a um CPF.
+        """
+
+    def resumo(self, desde: date | None = None, ate: date | None = None) -> ResumoSolicitacoes:
+        """
+        Retorna os agregados diários das solicitações entre `desde` e `ate`, inclusive.
+
+        A implementação padrão percorre as solicitações do período; backends que
+        mantêm agregados incrementais devem sobrescrevê-la.
+        """
+        resumo = ResumoSolicitacoes()
+        inicio = datetime.combine(desde, time.min) if desde else None
+        fim = datetime.combine(ate + timedelta(days=1), time.min) if ate else None
+        for s in self.listar_periodo(inicio, fim):
+            resumo.adicionar(
+                s.data_hora_solicitacao.isoformat(),
+                s.status_pedido.value,
+                s.score,
+                s.limite_atual,
+                s.novo_limite_solicitado,
+            )
+        return resumo
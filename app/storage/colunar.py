@@ -0,0 +1,327 @@
+"""Snapshot colunar da base de clientes, mapeado em memória com NumPy."""
+
+import json
+import logging
+import shutil
+import threading
+import uuid
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from app.models import Cliente
+from app.storage.arquivos import TravaArquivo, escrita_atomica
+from app.storage.base import ClienteStorage
+
+logger = logging.getLogger(__name__)
+
+DTYPE_CLIENTES = np.dtype(
+    [
+        ("cpf", "S11"),
+        ("data_nascimento", "<i4"),
+        ("score", "<i2"),
+        ("limite_atual", "<f8"),
+    ]
+)
+EPOCH = date(1970, 1, 1).toordinal()
+
+
+class SnapshotColunar:
+    """
+    Tabela de clientes em colunas: CPF como bytes de largura fixa, data de
+    nascimento em dias desde 1970-01-01 (int32), score (int16) e limite (float64).
+
+    As linhas ficam ordenadas por CPF. Os nomes ficam em um blob UTF-8 separado,
+    indexado por offsets. Filtros e agregados rodam vetorizados e objetos `Cliente`
+    só são construídos para as linhas efetivamente retornadas.
+    """
+
+    def __init__(self, registros: np.ndarray, offsets: np.ndarray, nomes: np.ndarray):
+        self.registros = registros
+        self._offsets = offsets
+        self._nomes = nomes
+
+    @classmethod
+    def abrir(cls, diretorio: Path) -> "SnapshotColunar":
+        return cls(
+            np.load(diretorio / "registros.npy", mmap_mode="r"),
+            np.load(diretorio / "offsets.npy", mmap_mode="r"),
+            np.load(diretorio / "nomes.npy", mmap_mode="r"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.registros)
+
+    def com_alteracoes(self, alteracoes: list[tuple[str, str, str]]) -> "SnapshotColunar | None":
+        """
+        Retorna uma cópia com as alterações `(cpf, campo, valor)` aplicadas.
+
+        Só os registros são copiados; os nomes continuam compartilhados. CPFs
+        fora do snapshot são ignorados. Retorna None se alguma alteração não
+        couber nas colunas (outro campo ou valor inválido).
+        """
+        registros = np.array(self.registros)
+        cpfs = registros["cpf"]
+        for cpf, campo, valor in alteracoes:
+            if campo not in ("score", "limite_atual"):
+                return None
+            chave = cpf.encode("ascii", "ignore")
+            i = int(np.searchsorted(cpfs, chave))
+            if i == len(cpfs) or cpfs[i] != chave:
+                continue
+            try:
+                convertido = int(valor) if campo == "score" else float(valor)
+            except ValueError:
+                return None
+            if campo == "score" and not 0 <= convertido <= 1000:
+                return None
+            registros[campo][i] = convertido
+        return SnapshotColunar(registros, self._offsets, self._nomes)
+
+    def filtrar(
+        self,
+        score_min: int | None = None,
+        score_max: int | None = None,
+        limite_min: float | None = None,
+        limite_max: float | None = None,
+    ) -> np.ndarray:
+        """Retorna os índices das linhas que atendem aos filtros."""
+        mascara = np.ones(len(self.registros), dtype=bool)
+        if score_min is not None:
+            mascara &= self.registros["score"] >= score_min
+        if score_max is not None:
+            mascara &= self.registros["score"] <= score_max
+        if limite_min is not None:
+            mascara &= self.registros["limite_atual"] >= limite_min
+        if limite_max is not None:
+            mascara &= self.registros["limite_atual"] <= limite_max
+        return np.flatnonzero(mascara)
+
+    def iterar_indices(
+        self,
+        after_cpf: str | None = None,
+        score_min: int | None = None,
+        score_max: int | None = None,
+        limite_min: float | None = None,
+        limite_max: float | None = None,
+        nome_prefixo: str | None = None,
+        tamanho_bloco: int = 1024,
+    ) -> Iterator[int]:
+        """
+        Percorre, em ordem de CPF, os índices que atendem aos filtros.
+
+        A varredura começa logo após `after_cpf` (busca binária) e avança em blocos
+        de tamanho fixo, mantendo o uso de memória constante. O prefixo de nome é
+        comparado sem diferenciar maiúsculas de minúsculas. Do cursor só contam os
+        dígitos ASCII, como nos CPFs do snapshot.
+        """
+        inicio = 0
+        if after_cpf:
+            cursor = after_cpf.encode("ascii", "ignore").translate(None, _NAO_DIGITOS)
+            inicio = int(np.searchsorted(self.registros["cpf"], cursor, "right"))
+        prefixo = nome_prefixo.casefold() if nome_prefixo else None
+
+        for bloco in range(inicio, len(self.registros), tamanho_bloco):
+            fim = min(bloco + tamanho_bloco, len(self.registros))
+            registros = self.registros[bloco:fim]
+            mascara = np.ones(fim - bloco, dtype=bool)
+            if score_min is not None:
+                mascara &= registros["score"] >= score_min
+            if score_max is not None:
+                mascara &= registros["score"] <= score_max
+            if limite_min is not None:
+                mascara &= registros["limite_atual"] >= limite_min
+            if limite_max is not None:
+                mascara &= registros["limite_atual"] <= limite_max
+            for i in np.flatnonzero(mascara) + bloco:
+                if prefixo is None or self.nome(i).casefold().startswith(prefixo):
+                    yield int(i)
+
+    def agregados(self, indices: np.ndarray | None = None) -> dict:
+        """Calcula totais, médias e extremos de score e limite."""
+        registros = self.registros if indices is None else self.registros[indices]
+        if len(registros) == 0:
+            return {"total": 0}
+        scores = registros["score"]
+        limites = registros["limite_atual"]
+        return {
+            "total": int(len(registros)),
+            "score_medio": float(scores.mean(dtype=np.float64)),
+            "score_minimo": int(scores.min()),
+            "score_maximo": int(scores.max()),
+            "limite_total": float(limites.sum()),
+            "limite_medio": float(limites.mean()),
+            "limite_minimo": float(limites.min()),
+            "limite_maximo": float(limites.max()),
+        }
+
+    def nome(self, indice: int) -> str:
+        inicio, fim = self._offsets[indice], self._offsets[indice + 1]
+        return bytes(self._nomes[inicio:fim]).decode("utf-8")
+
+    def materializar(self, indices) -> list[Cliente]:
+        """Constrói objetos `Cliente` apenas para as linhas informadas."""
+        clientes = []
+        for i in indices:
+            registro = self.registros[i]
+            clientes.append(
+                Cliente(
+                    cpf=registro["cpf"].decode("ascii"),
+                    nome=self.nome(i),
+                    data_nascimento=date.fromordinal(int(registro["data_nascimento"]) + EPOCH),
+                    score=int(registro["score"]),
+                    limite_atual=float(registro["limite_atual"]),
+                )
+            )
+        return clientes
+
+    def colunas(self, indices: np.ndarray | None = None) -> dict[str, np.ndarray | list]:
+        """Retorna as colunas prontas para um DataFrame, sem objetos por linha."""
+        if indices is None:
+            indices = np.arange(len(self.registros))
+        registros = self.registros[indices]
+        return {
+            "cpf": registros["cpf"].astype(str),
+            "nome": [self.nome(i) for i in indices],
+            "data_nascimento": registros["data_nascimento"].astype("datetime64[D]"),
+            "score": registros["score"],
+            "limite_atual": registros["limite_atual"],
+        }
+
+
+_NAO_DIGITOS = bytes(b for b in range(128) if not 48 <= b <= 57)
+
+
+def _converter_linha(row: dict[str, str]) -> tuple[bytes, int, int, float] | None:
+    cpf = "".join(c for c in row["cpf"] if c.isdigit())
+    if len(cpf) != 11:
+        return None
+    score = int(row["score"])
+    if not 0 <= score <= 1000:
+        return None
+    dias = date.fromisoformat(row["data_nascimento"]).toordinal() - EPOCH
+    return cpf.encode("ascii"), dias, score, float(row["limite_atual"])
+
+
+def montar_colunas(linhas: list[dict[str, str]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Converte linhas do storage em (registros, offsets dos nomes, blob de nomes)."""
+    validas = []
+    nomes = []
+    for row in linhas:
+        try:
+            convertida = _converter_linha(row)
+        except (KeyError, ValueError):
+            convertida = None
+        if convertida is None:
+            logger.warning(f"Cliente com dados inválidos ignorado: CPF={row.get('cpf', 'N/A')}")
+            continue
+        validas.append(convertida)
+        nomes.append(row["nome"].encode("utf-8"))
+
+    registros = np.array(validas, dtype=DTYPE_CLIENTES)
+    ordem = np.argsort(registros["cpf"], kind="stable")
+    registros = registros[ordem]
+    nomes = [nomes[i] for i in ordem]
+
+    offsets = np.zeros(len(nomes) + 1, dtype=np.uint64)
+    offsets[1:] = np.cumsum([len(n) for n in nomes], dtype=np.uint64)
+    return registros, offsets, np.frombuffer(b"".join(nomes), dtype=np.uint8)
+
+
+def construir_snapshot(linhas: list[dict[str, str]], diretorio: Path) -> None:
+    """Grava o snapshot binário de `linhas` em `diretorio`."""
+    registros, offsets, nomes = montar_colunas(linhas)
+    diretorio.mkdir(parents=True, exist_ok=True)
+    np.save(diretorio / "registros.npy", registros)
+    np.save(diretorio / "offsets.npy", offsets)
+    np.save(diretorio / "nomes.npy", nomes)
+
+
+class ColunarClientes:
+    """
+    Mantém o snapshot colunar sincronizado com um `ClienteStorage`.
+
+    Cada versão da base é gravada em um subdiretório próprio e publicada
+    trocando atomicamente `atual.json`; o snapshot só é reconstruído quando a
+    base é reescrita (compactação do journal, inclusão de clientes) e é
+    reaproveitado entre processos enquanto ela não muda. As alterações
+    pontuais ainda no journal são aplicadas sobre uma cópia dos registros
+    mapeados, apenas as novas desde a consulta anterior.
+    """
+
+    def __init__(self, storage: ClienteStorage, diretorio: str | Path):
+        self.storage = storage
+        self.diretorio = Path(diretorio)
+        self._lock = threading.Lock()
+        self._versao: str | None = None
+        self._base: SnapshotColunar | None = None
+        self._snapshot: SnapshotColunar | None = None
+        self._aplicadas = 0
+
+    def _ler_publicado(self) -> dict | None:
+        try:
+            return json.loads((self.diretorio / "atual.json").read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _publicar(self, versao: str) -> SnapshotColunar:
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        with TravaArquivo(self.diretorio / "publicacao.lock").exclusiva():
+            nome = uuid.uuid4().hex
+            construir_snapshot(self.storage.linhas(), self.diretorio / nome)
+            with escrita_atomica(self.diretorio / "atual.json", "w", encoding="utf-8") as f:
+                json.dump({"versao": versao, "diretorio": nome}, f)
+            # Mapeamentos já abertos continuam válidos após a remoção (POSIX).
+            for antigo in self.diretorio.iterdir():
+                if antigo.is_dir() and antigo.name != nome:
+                    shutil.rmtree(antigo, ignore_errors=True)
+        return SnapshotColunar.abrir(self.diretorio / nome)
+
+    def _abrir_base(self, versao: str) -> SnapshotColunar:
+        publicado = self._ler_publicado()
+        if publicado is not None and publicado["versao"] == versao:
+            try:
+                return SnapshotColunar.abrir(self.diretorio / publicado["diretorio"])
+            except FileNotFoundError:
+                pass
+        return self._publicar(versao)
+
+    def snapshot(self) -> SnapshotColunar:
+        """Retorna o snapshot da versão atual do storage."""
+        versao, alteracoes = self.storage.versao_e_alteracoes()
+        if versao is None:
+            return SnapshotColunar(*montar_colunas(self.storage.linhas()))
+
+        with self._lock:
+            if self._base is None or versao != self._versao or len(alteracoes) < self._aplicadas:
+                if self._base is None or versao != self._versao:
+                    self._base = self._abrir_base(versao)
+                    self._versao = versao
+                self._snapshot = self._base
+                self._aplicadas = 0
+
+            if len(alteracoes) > self._aplicadas:
+                snapshot = self._snapshot.com_alteracoes(alteracoes[self._aplicadas :])
+                if snapshot is None:
+                    snapshot = SnapshotColunar(*montar_colunas(self.storage.linhas()))
+                self._snapshot = snapshot
+                self._aplicadas = len(alteracoes)
+            return self._snapshot
+
+
+_colunares: dict[Path, ColunarClientes] = {}
+_colunares_lock = threading.Lock()
+
+
+def obter_colunar_clientes(storage: ClienteStorage, diretorio: str | Path) -> ColunarClientes:
+    """Retorna o gerenciador de snapshot compartilhado para `diretorio`."""
+    chave = Path(diretorio).resolve()
+    with _colunares_lock:
+        colunar = _colunares.get(chave)
+        if colunar is None:
+            colunar = ColunarClientes(storage, chave)
+            _colunares[chave] = colunar
+        colunar.storage = storage
+        return colunar
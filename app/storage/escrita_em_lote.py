@@ -0,0 +1,155 @@
+"""Escrita em lote (group commit) de linhas anexadas a um CSV."""
+
+import csv
+import io
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+from app.config import settings
+from app.storage.arquivos import TravaArquivo, escrita_atomica
+
+logger = logging.getLogger(__name__)
+
+
+class EscritorEmLote:
+    """
+    Agrupa as linhas enviadas por várias threads e as grava em lotes.
+
+    Uma thread dedicada aguarda a primeira linha e junta as que chegarem em até
+    `intervalo_ms`, limitadas a `tamanho_lote`; com intervalo zero, o lote é o
+    que se acumulou na fila enquanto o anterior era gravado. Cada lote é gravado
+    com uma única escrita sob a trava exclusiva do arquivo e, se `fsync` estiver
+    ativo, sincronizado em disco antes de confirmar. Quem envia recebe um
+    `Future` que é resolvido quando o lote que contém a sua linha é confirmado.
+    """
+
+    def __init__(
+        self,
+        csv_path: str | Path,
+        cabecalho: list[str],
+        tamanho_lote: int | None = None,
+        intervalo_ms: float | None = None,
+        fsync: bool | None = None,
+    ):
+        self.csv_path = Path(csv_path)
+        self.cabecalho = cabecalho
+        self.trava = TravaArquivo(self.csv_path.with_suffix(".lock"))
+        self.tamanho_lote = tamanho_lote or settings.solicitacoes_lote_max
+        self.intervalo = (
+            settings.solicitacoes_lote_intervalo_ms if intervalo_ms is None else intervalo_ms
+        ) / 1000
+        self.fsync = settings.solicitacoes_fsync if fsync is None else fsync
+        self._fila: queue.SimpleQueue[tuple[list, Future]] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._arquivo_verificado: tuple[int, int] | None = None
+
+    def enviar(self, linha: list) -> Future:
+        """Enfileira uma linha e retorna o `Future` da sua confirmação."""
+        futuro: Future = Future()
+        self._fila.put((linha, futuro))
+        self._garantir_thread()
+        return futuro
+
+    def gravar(self, linha: list) -> None:
+        """Enfileira uma linha e aguarda a gravação do lote que a contém."""
+        self.enviar(linha).result()
+
+    def _garantir_thread(self) -> None:
+        with self._thread_lock:
+            # Após um fork a thread do processo pai não existe no filho.
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._executar, name=f"escritor-{self.csv_path.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _executar(self) -> None:
+        while True:
+            lote = [self._fila.get()]
+            prazo = time.monotonic() + self.intervalo
+            while len(lote) < self.tamanho_lote:
+                restante = prazo - time.monotonic()
+                try:
+                    if restante > 0:
+                        lote.append(self._fila.get(timeout=restante))
+                    else:
+                        lote.append(self._fila.get_nowait())
+                except queue.Empty:
+                    break
+            self._gravar_lote(lote)
+
+    def _atualizar_cabecalho(self) -> None:
+        """
+        Garante que o arquivo existente use o cabeçalho atual.
+
+        Arquivos gravados antes da inclusão de colunas novas no fim do cabeçalho
+        são regravados uma única vez com o cabeçalho completo; as linhas antigas
+        ficam com as colunas novas vazias. Exige a trava exclusiva.
+        """
+        with open(self.csv_path, "rb") as f:
+            campos = next(csv.reader([f.readline().decode("utf-8")]), [])
+            if campos != self.cabecalho:
+                if campos != self.cabecalho[: len(campos)]:
+                    raise ValueError(f"Cabeçalho incompatível em {self.csv_path}: {campos}")
+                buffer = io.StringIO()
+                csv.writer(buffer).writerow(self.cabecalho)
+                with escrita_atomica(self.csv_path, "wb") as destino:
+                    destino.write(buffer.getvalue().encode("utf-8"))
+                    shutil.copyfileobj(f, destino)
+                logger.info(f"Cabeçalho de {self.csv_path} atualizado para {self.cabecalho}")
+        stat = os.stat(self.csv_path)
+        self._arquivo_verificado = (stat.st_dev, stat.st_ino)
+
+    def _gravar_lote(self, lote: list[tuple[list, Future]]) -> None:
+        lote = [(linha, futuro) for linha, futuro in lote if futuro.set_running_or_notify_cancel()]
+        if not lote:
+            return
+
+        try:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            with self.trava.exclusiva():
+                try:
+                    stat = os.stat(self.csv_path)
+                except FileNotFoundError:
+                    stat = None
+                if stat is None or stat.st_size == 0:
+                    writer.writerow(self.cabecalho)
+                elif (stat.st_dev, stat.st_ino) != self._arquivo_verificado:
+                    self._atualizar_cabecalho()
+                writer.writerows(linha for linha, _ in lote)
+                with open(self.csv_path, "ab") as f:
+                    f.write(buffer.getvalue().encode("utf-8"))
+                    if self.fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"Erro ao gravar lote de {len(lote)} linhas em {self.csv_path}: {e}")
+            for _, futuro in lote:
+                futuro.set_exception(e)
+            return
+
+        for _, futuro in lote:
+            futuro.set_result(None)
+
+
+_escritores: dict[Path, EscritorEmLote] = {}
+_escritores_lock = threading.Lock()
+
+
+def obter_escritor_em_lote(csv_path: str | Path, cabecalho: list[str]) -> EscritorEmLote:
+    """Retorna o escritor compartilhado pelo processo para o arquivo informado."""
+    chave = Path(csv_path).resolve()
+    with _escritores_lock:
+        escritor = _escritores.get(chave)
+        if escritor is None:
+            escritor = EscritorEmLote(chave, cabecalho)
+            _escritores[chave] = escritor
+        return escritor
@@ -0,0 +1,128 @@
+"""Histórico de cotações de câmbio em SQLite (série temporal só de inserções)."""
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from app.config import settings
+from app.models import Cotacao
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Tabela agrupada por par e instante (WITHOUT ROWID): as consultas por par e
+# janela de tempo leem um trecho contíguo da chave primária.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cotacoes (
+    moeda_origem TEXT NOT NULL,
+    moeda_destino TEXT NOT NULL,
+    instante REAL NOT NULL,
+    valor REAL NOT NULL,
+    PRIMARY KEY (moeda_origem, moeda_destino, instante)
+) WITHOUT ROWID;
+"""
+
+SQL_INSERIR = (
+    "INSERT OR REPLACE INTO cotacoes (moeda_origem, moeda_destino, instante, valor) "
+    "VALUES (?, ?, ?, ?)"
+)
+SQL_ULTIMAS = (
+    "SELECT instante, valor FROM cotacoes WHERE moeda_origem = ? AND moeda_destino = ? "
+    "ORDER BY instante DESC LIMIT ?"
+)
+SQL_RESUMO = (
+    "SELECT COUNT(*), MIN(valor), MAX(valor), AVG(valor) FROM cotacoes "
+    "WHERE moeda_origem = ?1 AND moeda_destino = ?2 "
+    "AND instante >= ?3 AND (?4 IS NULL OR instante < ?4)"
+)
+
+
+class HistoricoCotacoes:
+    """
+    Série temporal das cotações por par de moedas, com uma conexão por thread.
+
+    Os instantes são gravados como timestamp (segundos) de `data_consulta`.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._local = threading.local()
+        with self.conexao() as conn:
+            conn.executescript(SCHEMA)
+
+    def conexao(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def registrar(self, cotacoes: Iterable[Cotacao]) -> int:
+        """Acrescenta as cotações ao histórico, em uma única transação."""
+        linhas = [
+            (c.moeda_origem, c.moeda_destino, c.data_consulta.timestamp(), c.valor)
+            for c in cotacoes
+        ]
+        if linhas:
+            with self.conexao() as conn:
+                conn.executemany(SQL_INSERIR, linhas)
+        return len(linhas)
+
+    def ultimas(self, moeda_origem: str, moeda_destino: str = "BRL", n: int = 10) -> list[Cotacao]:
+        """Retorna as últimas `n` cotações do par, da mais antiga para a mais recente."""
+        origem, destino = moeda_origem.upper(), moeda_destino.upper()
+        rows = self.conexao().execute(SQL_ULTIMAS, (origem, destino, n)).fetchall()
+        return [
+            Cotacao(
+                moeda_origem=origem,
+                moeda_destino=destino,
+                valor=valor,
+                data_consulta=datetime.fromtimestamp(instante),
+            )
+            for instante, valor in reversed(rows)
+        ]
+
+    def resumo(
+        self,
+        moeda_origem: str,
+        moeda_destino: str = "BRL",
+        inicio: datetime | None = None,
+        fim: datetime | None = None,
+    ) -> dict[str, float | int | None]:
+        """
+        Retorna quantidade, mínimo, máximo e média das cotações do par em
+        `[inicio, fim)`; sem cotações na janela, os valores são None.
+        """
+        row = (
+            self.conexao()
+            .execute(
+                SQL_RESUMO,
+                (
+                    moeda_origem.upper(),
+                    moeda_destino.upper(),
+                    inicio.timestamp() if inicio is not None else float("-inf"),
+                    fim.timestamp() if fim is not None else None,
+                ),
+            )
+            .fetchone()
+        )
+        quantidade, minimo, maximo, media = row
+        return {"quantidade": quantidade, "minimo": minimo, "maximo": maximo, "media": media}
+
+
+_historicos: dict[Path, HistoricoCotacoes] = {}
+_historicos_lock = threading.Lock()
+
+
+def obter_historico_cotacoes(path: str | Path | None = None) -> HistoricoCotacoes:
+    """Retorna o histórico de cotações compartilhado pelo processo."""
+    chave = Path(path or settings.cambio_historico_path or DATA_DIR / "cotacoes.db").resolve()
+    with _historicos_lock:
+        historico = _historicos.get(chave)
+        if historico is None:
+            historico = HistoricoCotacoes(chave)
+            _historicos[chave] = historico
+        return historico
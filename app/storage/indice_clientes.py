@@ -0,0 +1,272 @@
+"""Índice em memória da base de clientes, indexado por CPF."""
+
+import csv
+import io
+import logging
+import os
+import threading
+from pathlib import Path
+
+from app.config import settings
+from app.storage.arquivos import TravaArquivo, escrita_atomica
+from app.storage.base import ClienteStorage
+from app.storage.journal_clientes import JournalClientes
+
+logger = logging.getLogger(__name__)
+
+CAMPOS_CLIENTE = ["cpf", "nome", "data_nascimento", "score", "limite_atual"]
+
+
+class IndiceClientes(ClienteStorage):
+    """
+    Mantém as linhas do CSV de clientes em um dict CPF -> linha.
+
+    O snapshot é lido uma única vez e só é recarregado quando o seu mtime ou
+    tamanho mudam, de forma que buscas por CPF não tocam o disco. Atualizações
+    de score e limite são gravadas no journal e aplicadas sobre o snapshot;
+    quando o journal cresce, ele é consolidado em um novo snapshot em background.
+
+    Escritas tomam a trava exclusiva do arquivo (entre processos e threads) e
+    recargas completas tomam a trava compartilhada. A trava de arquivo é sempre
+    adquirida antes do lock interno, que só protege o estado em memória.
+    """
+
+    def __init__(self, csv_path: Path):
+        self.csv_path = Path(csv_path)
+        self.journal = JournalClientes(self.csv_path.with_suffix(".journal"))
+        self.trava = TravaArquivo(self.csv_path.with_suffix(".lock"))
+        self._lock = threading.RLock()
+        self._assinatura: tuple[int, int] | None = None
+        self._offset_journal = 0
+        self._entradas_journal = 0
+        self._compactando = False
+        self._linhas: dict[str, dict[str, str]] = {}
+        self._alteracoes: list[tuple[str, str, str]] = []
+
+    def _assinatura_arquivo(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.csv_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _carregar(self, assinatura: tuple[int, int] | None) -> None:
+        linhas: dict[str, dict[str, str]] = {}
+        if assinatura is not None:
+            with open(self.csv_path, "rb") as f:
+                dados = f.read()
+            # Ignora uma linha final incompleta de um append em andamento.
+            dados = dados[: dados.rfind(b"\n") + 1]
+            for row in csv.DictReader(io.StringIO(dados.decode("utf-8"), newline="")):
+                linhas.setdefault(row["cpf"], row)
+        self._linhas = linhas
+        self._assinatura = assinatura
+        self._offset_journal = 0
+        self._entradas_journal = 0
+        self._alteracoes = []
+        self._aplicar_journal()
+
+    def _aplicar_journal(self) -> None:
+        entradas, self._offset_journal = self.journal.ler_a_partir(self._offset_journal)
+        for cpf, campo, valor in entradas:
+            row = self._linhas.get(cpf)
+            if row is not None and campo in row:
+                row[campo] = valor
+        self._entradas_journal += len(entradas)
+        self._alteracoes.extend(entradas)
+
+    def _precisa_recarregar(self) -> bool:
+        assinatura = self._assinatura_arquivo()
+        if assinatura != self._assinatura or assinatura is None:
+            return True
+        return self.journal.tamanho() < self._offset_journal
+
+    def _sincronizar(self) -> None:
+        """Atualiza o estado em memória; exige a trava de arquivo já adquirida."""
+        with self._lock:
+            if self._precisa_recarregar():
+                self._carregar(self._assinatura_arquivo())
+            elif self.journal.tamanho() > self._offset_journal:
+                self._aplicar_journal()
+
+    def _garantir_atualizado(self) -> None:
+        # Sem mudanças no arquivo nem no journal, nenhuma trava de arquivo é tomada;
+        # a leitura de entradas novas do journal exige a trava, pois uma compactação
+        # em outro processo pode truncá-lo ou substituí-lo durante a leitura.
+        with self._lock:
+            if not self._precisa_recarregar():
+                if self.journal.tamanho() <= self._offset_journal:
+                    return
+            elif self._assinatura_arquivo() is None:
+                self._carregar(None)
+                return
+        with self.trava.compartilhada():
+            self._sincronizar()
+
+    def obter(self, cpf: str) -> dict[str, str] | None:
+        """Retorna a linha do cliente com o CPF informado, ou None."""
+        self._garantir_atualizado()
+        with self._lock:
+            row = self._linhas.get(cpf)
+            return dict(row) if row is not None else None
+
+    def contem(self, cpf: str) -> bool:
+        self._garantir_atualizado()
+        with self._lock:
+            return cpf in self._linhas
+
+    def linhas(self) -> list[dict[str, str]]:
+        """Retorna todas as linhas na ordem do arquivo, com o journal aplicado."""
+        self._garantir_atualizado()
+        with self._lock:
+            return [dict(row) for row in self._linhas.values()]
+
+    def versao(self) -> str | None:
+        self._garantir_atualizado()
+        with self._lock:
+            if self._assinatura is None:
+                return None
+            mtime, tamanho = self._assinatura
+            return f"{mtime}:{tamanho}:{self._offset_journal}"
+
+    def versao_e_alteracoes(self) -> tuple[str | None, list[tuple[str, str, str]]]:
+        """Assinatura do CSV e entradas do journal ainda não consolidadas."""
+        self._garantir_atualizado()
+        with self._lock:
+            if self._assinatura is None:
+                return None, []
+            mtime, tamanho = self._assinatura
+            return f"{mtime}:{tamanho}", list(self._alteracoes)
+
+    def adicionar(self, row: dict[str, str]) -> bool:
+        """
+        Acrescenta um cliente ao fim do snapshot.
+
+        A verificação de duplicidade e o append acontecem sob a trava exclusiva.
+        Retorna False se o CPF já existir na base.
+        """
+        with self.trava.exclusiva():
+            self._sincronizar()
+            with self._lock:
+                if row["cpf"] in self._linhas:
+                    return False
+                novo_arquivo = self._assinatura is None or self._assinatura[1] == 0
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=CAMPOS_CLIENTE)
+                if novo_arquivo:
+                    writer.writeheader()
+                writer.writerow(row)
+                with open(self.csv_path, "ab") as f:
+                    f.write(buffer.getvalue().encode("utf-8"))
+                self._linhas[row["cpf"]] = dict(row)
+                self._assinatura = self._assinatura_arquivo()
+        return True
+
+    def atualizar_campo(self, cpf: str, campo: str, valor: str) -> bool:
+        """
+        Atualiza um campo de um cliente gravando apenas um delta no journal.
+
+        Retorna False se o CPF não existir na base.
+        """
+        with self.trava.exclusiva():
+            self._sincronizar()
+            with self._lock:
+                if cpf not in self._linhas:
+                    return False
+                self.journal.anexar(cpf, campo, valor)
+                self._aplicar_journal()
+                agendar = (
+                    self._entradas_journal >= settings.clientes_journal_max_entradas
+                    and not self._compactando
+                )
+                if agendar:
+                    self._compactando = True
+
+        if agendar:
+            threading.Thread(target=self._compactar_em_background, daemon=True).start()
+        return True
+
+    def _compactar_em_background(self) -> None:
+        try:
+            self.compactar()
+        except Exception as e:
+            logger.error(f"Erro ao compactar journal de clientes: {e}")
+        finally:
+            with self._lock:
+                self._compactando = False
+
+    def compactar(self) -> None:
+        """
+        Consolida o journal em um novo snapshot do CSV.
+
+        Escritores de qualquer processo aguardam na trava exclusiva; leitores
+        continuam sendo atendidos pelo índice em memória e, como o snapshot é
+        trocado com `os.replace`, nunca enxergam um arquivo pela metade.
+        """
+        with self.trava.exclusiva():
+            self._sincronizar()
+            with self._lock:
+                if self._assinatura is None:
+                    return
+                linhas = [dict(row) for row in self._linhas.values()]
+            self._gravar_snapshot(linhas)
+
+    def atualizar_em_lote(
+        self, campo: str, valores: dict[str, str], apenas_maiores: bool = False
+    ) -> int:
+        """
+        Atualiza um campo de vários clientes gravando um único snapshot novo.
+
+        O journal pendente é consolidado na mesma escrita. Com `apenas_maiores`,
+        os valores são comparados aos atuais já sob a trava exclusiva, então
+        escritas de outros processos desde a leitura do chamador são respeitadas.
+        Retorna quantos clientes foram atualizados.
+        """
+        with self.trava.exclusiva():
+            self._sincronizar()
+            with self._lock:
+                if self._assinatura is None:
+                    return 0
+                linhas = [dict(row) for row in self._linhas.values()]
+
+            atualizados = 0
+            for row in linhas:
+                valor = valores.get(row["cpf"])
+                if valor is None or campo not in row:
+                    continue
+                if apenas_maiores and float(row[campo]) >= float(valor):
+                    continue
+                row[campo] = valor
+                atualizados += 1
+            self._gravar_snapshot(linhas)
+        return atualizados
+
+    def _gravar_snapshot(self, linhas: list[dict[str, str]]) -> None:
+        """Troca o CSV por `linhas` e descarta o journal; exige a trava exclusiva."""
+        with escrita_atomica(self.csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CAMPOS_CLIENTE, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(linhas)
+
+        with self._lock:
+            self.journal.descartar_ate(self._offset_journal)
+            self._linhas = {row["cpf"]: row for row in linhas}
+            self._assinatura = self._assinatura_arquivo()
+            self._offset_journal = 0
+            self._entradas_journal = 0
+            self._alteracoes = []
+
+
+_indices: dict[Path, IndiceClientes] = {}
+_indices_lock = threading.Lock()
+
+
+def obter_indice_clientes(csv_path: str | Path) -> IndiceClientes:
+    """Retorna o índice compartilhado pelo processo para o arquivo informado."""
+    chave = Path(csv_path).resolve()
+    with _indices_lock:
+        indice = _indices.get(chave)
+        if indice is None:
+            indice = IndiceClientes(chave)
+            _indices[chave] = indice
+        return indice
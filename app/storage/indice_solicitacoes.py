@@ -0,0 +1,173 @@
+"""Índice por CPF e por data/hora do histórico de solicitações em CSV."""
+
+import copy
+import csv
+import logging
+import os
+import threading
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from app.storage.resumo_solicitacoes import ResumoSolicitacoes
+
+logger = logging.getLogger(__name__)
+
+
+class IndiceSolicitacoes:
+    """
+    Localiza as linhas do CSV de solicitações pela posição em bytes.
+
+    As consultas retornam as linhas como dicts de texto, no formato do CSV.
+
+    Guarda, para cada CPF, o offset e o tamanho das suas linhas e, em uma lista
+    ordenada, o par (data/hora ISO, posição) de cada linha, além dos agregados
+    diários das linhas já indexadas. O arquivo é só de append: a cada consulta
+    apenas os bytes gravados desde a última leitura são indexados, e consultas
+    leem somente as linhas selecionadas. Se o arquivo for substituído ou
+    truncado, o índice é reconstruído.
+
+    Datas/horas ISO 8601 sem fuso ordenam cronologicamente como texto, portanto
+    as buscas por intervalo comparam strings, sem converter as linhas.
+    """
+
+    def __init__(self, csv_path: str | Path):
+        self.csv_path = Path(csv_path)
+        self._lock = threading.Lock()
+        self._reiniciar(None)
+
+    def _reiniciar(self, identidade: tuple[int, int] | None) -> None:
+        self._identidade = identidade
+        self._offset = 0
+        self._campos: list[str] | None = None
+        self._por_cpf: dict[str, list[tuple[int, int]]] = {}
+        self._tempos: list[tuple[str, int, int]] = []
+        self._resumo = ResumoSolicitacoes()
+
+    @contextmanager
+    def _abrir(self):
+        """
+        Abre o arquivo e indexa as linhas novas.
+
+        As posições são lidas do mesmo descritor usado na indexação, de modo que
+        uma troca do arquivo durante a consulta não mistura conteúdos.
+        """
+        try:
+            f = open(self.csv_path, "rb")
+        except FileNotFoundError:
+            self._reiniciar(None)
+            yield None
+            return
+        with f:
+            self._sincronizar(f)
+            yield f
+
+    def _sincronizar(self, f: BinaryIO) -> None:
+        """Indexa as linhas completas gravadas desde a última leitura."""
+        stat = os.fstat(f.fileno())
+        identidade = (stat.st_dev, stat.st_ino)
+        if identidade != self._identidade or stat.st_size < self._offset:
+            self._reiniciar(identidade)
+        if stat.st_size == self._offset:
+            return
+
+        f.seek(self._offset)
+        dados = f.read(stat.st_size - self._offset)
+        # Ignora uma linha final incompleta de um append em andamento.
+        dados = dados[: dados.rfind(b"\n") + 1]
+
+        posicao = self._offset
+        for linha in dados.splitlines(keepends=True):
+            inicio = posicao
+            posicao += len(linha)
+            valores = next(csv.reader([linha.decode("utf-8")]), None)
+            if not valores:
+                continue
+            if self._campos is None:
+                self._campos = valores
+                self._col_cpf = valores.index("cpf_cliente")
+                self._col_data_hora = valores.index("data_hora_solicitacao")
+                continue
+
+            cpf = valores[self._col_cpf]
+            data_hora = valores[self._col_data_hora]
+            self._por_cpf.setdefault(cpf, []).append((inicio, len(linha)))
+            entrada = (data_hora, inicio, len(linha))
+            if not self._tempos or entrada >= self._tempos[-1]:
+                self._tempos.append(entrada)
+            else:
+                insort(self._tempos, entrada)
+            try:
+                self._resumo.adicionar_linha(dict(zip(self._campos, valores)))
+            except (KeyError, ValueError):
+                logger.warning(f"Solicitação com dados inválidos fora dos agregados: CPF={cpf}")
+        self._offset = posicao
+
+    def _ler(self, f: BinaryIO | None, posicoes: list[tuple[int, int]]) -> list[dict[str, str]]:
+        if f is None:
+            return []
+        linhas = []
+        for inicio, tamanho in posicoes:
+            f.seek(inicio)
+            valores = next(csv.reader([f.read(tamanho).decode("utf-8")]))
+            linhas.append(dict(zip(self._campos, valores)))
+        return linhas
+
+    def linhas_por_cpf(self, cpf: str) -> list[dict[str, str]]:
+        """Retorna as linhas do CPF na ordem de registro."""
+        with self._lock, self._abrir() as f:
+            return self._ler(f, self._por_cpf.get(cpf, []))
+
+    def linhas_periodo(
+        self,
+        desde: datetime | None = None,
+        ate: datetime | None = None,
+        cpf: str | None = None,
+    ) -> list[dict[str, str]]:
+        """
+        Retorna as linhas com `desde <= data_hora < ate`, em ordem cronológica.
+
+        Limites ausentes não restringem o intervalo. Com `cpf`, apenas as linhas
+        do cliente são lidas.
+        """
+        inicio_intervalo = desde.isoformat() if desde else None
+        fim_intervalo = ate.isoformat() if ate else None
+
+        with self._lock, self._abrir() as f:
+            if cpf is not None:
+                linhas = sorted(
+                    self._ler(f, self._por_cpf.get(cpf, [])),
+                    key=lambda row: row["data_hora_solicitacao"],
+                )
+                return [
+                    row
+                    for row in linhas
+                    if (inicio_intervalo or "") <= row["data_hora_solicitacao"]
+                    and (fim_intervalo is None or row["data_hora_solicitacao"] < fim_intervalo)
+                ]
+
+            i = bisect_left(self._tempos, (inicio_intervalo,)) if inicio_intervalo else 0
+            j = bisect_left(self._tempos, (fim_intervalo,)) if fim_intervalo else len(self._tempos)
+            return self._ler(f, [(inicio, tamanho) for _, inicio, tamanho in self._tempos[i:j]])
+
+    def resumo(self, desde: date | None = None, ate: date | None = None) -> ResumoSolicitacoes:
+        """Retorna uma cópia dos agregados diários entre `desde` e `ate`, inclusive."""
+        with self._lock, self._abrir():
+            return ResumoSolicitacoes(copy.deepcopy(self._resumo.recortar(desde, ate).dias))
+
+
+_indices: dict[Path, IndiceSolicitacoes] = {}
+_indices_lock = threading.Lock()
+
+
+def obter_indice_solicitacoes(csv_path: str | Path) -> IndiceSolicitacoes:
+    """Retorna o índice compartilhado pelo processo para o arquivo informado."""
+    chave = Path(csv_path).resolve()
+    with _indices_lock:
+        indice = _indices.get(chave)
+        if indice is None:
+            indice = IndiceSolicitacoes(chave)
+            _indices[chave] = indice
+        return indice
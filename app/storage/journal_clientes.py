@@ -0,0 +1,73 @@
+"""Journal append-only de atualizações pontuais da base de clientes."""
+
+import csv
+import io
+import os
+from datetime import datetime
+from pathlib import Path
+
+from app.storage.arquivos import escrita_atomica
+
+
+class JournalClientes:
+    """
+    Registra deltas `(cpf, campo, valor, ts)` em um arquivo append-only.
+
+    Cada atualização custa uma única escrita no fim do arquivo; os deltas são
+    aplicados sobre o snapshot do CSV na leitura e consolidados na compactação.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def tamanho(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def anexar(self, cpf: str, campo: str, valor: str) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow([cpf, campo, valor, datetime.now().isoformat()])
+        with open(self.path, "ab") as f:
+            f.write(buffer.getvalue().encode("utf-8"))
+
+    def ler_a_partir(self, offset: int) -> tuple[list[tuple[str, str, str]], int]:
+        """
+        Lê as entradas completas gravadas após `offset`.
+
+        Retorna as entradas `(cpf, campo, valor)` e o offset da última linha
+        completa, de modo que uma escrita em andamento seja lida na próxima vez.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                dados = f.read()
+        except FileNotFoundError:
+            return [], 0
+
+        fim = dados.rfind(b"\n") + 1
+        if fim == 0:
+            return [], offset
+
+        entradas = []
+        for row in csv.reader(io.StringIO(dados[:fim].decode("utf-8"), newline="")):
+            if len(row) >= 3:
+                entradas.append((row[0], row[1], row[2]))
+        return entradas, offset + fim
+
+    def descartar_ate(self, offset: int) -> None:
+        """
+        Remove as entradas já consolidadas no snapshot (até `offset`).
+
+        Entradas gravadas depois de `offset` são preservadas.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                restante = f.read()
+        except FileNotFoundError:
+            return
+
+        with escrita_atomica(self.path, "wb") as f:
+            f.write(restante)
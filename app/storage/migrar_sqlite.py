@@ -0,0 +1,126 @@
+"""
+Migração única dos CSVs de `app/data` para o backend SQLite.
+
+Uso:
+    python -m app.storage.migrar_sqlite [--destino app/data/banking.db] [--substituir]
+"""
+
+import argparse
+import csv
+import io
+import logging
+import time
+from itertools import chain, islice
+from pathlib import Path
+
+from app.storage.backends import DATA_DIR, obter_banco_sqlite
+from app.storage.indice_clientes import IndiceClientes
+from app.storage.particoes_solicitacoes import ParticoesSolicitacoes
+from app.storage.sqlite import SQL_INSERIR_CLIENTE, SQL_INSERIR_SOLICITACAO
+
+logger = logging.getLogger(__name__)
+
+
+class MigracaoError(Exception):
+    """Exceção lançada quando o destino da migração já contém dados."""
+
+    pass
+
+
+def _lotes(iteravel, tamanho: int):
+    iterador = iter(iteravel)
+    while lote := list(islice(iterador, tamanho)):
+        yield lote
+
+
+def migrar(
+    clientes_csv: str | Path,
+    solicitacoes_csv: str | Path,
+    destino: str | Path,
+    substituir: bool = False,
+    tamanho_lote: int = 50_000,
+) -> tuple[int, int]:
+    """
+    Copia clientes (com o journal aplicado) e solicitações, incluindo as
+    partições encerradas, para o SQLite.
+
+    Tudo acontece em uma única transação. Retorna a quantidade de clientes e de
+    solicitações migrados.
+    """
+    conn = obter_banco_sqlite(destino).conexao()
+
+    existentes = conn.execute(
+        "SELECT (SELECT COUNT(*) FROM clientes) + (SELECT COUNT(*) FROM solicitacoes)"
+    ).fetchone()[0]
+    if existentes and not substituir:
+        raise MigracaoError(
+            f"O banco {destino} já contém dados. Use --substituir para sobrescrevê-los."
+        )
+
+    clientes = (
+        (r["cpf"], r["nome"], r["data_nascimento"], int(r["score"]), float(r["limite_atual"]))
+        for r in IndiceClientes(Path(clientes_csv)).linhas()
+    )
+
+    total_clientes = 0
+    total_solicitacoes = 0
+    with conn:
+        if substituir:
+            conn.execute("DELETE FROM clientes")
+            conn.execute("DELETE FROM solicitacoes")
+            conn.execute("DELETE FROM resumo_solicitacoes_dia")
+
+        for lote in _lotes(clientes, tamanho_lote):
+            # rowcount não conta as linhas ignoradas pelo INSERT OR IGNORE.
+            total_clientes += conn.executemany(SQL_INSERIR_CLIENTE, lote).rowcount
+
+        encerradas = ParticoesSolicitacoes(solicitacoes_csv).iterar_linhas()
+        try:
+            f = open(solicitacoes_csv, encoding="utf-8", newline="")
+        except FileNotFoundError:
+            logger.warning(f"Arquivo de solicitações não encontrado: {solicitacoes_csv}")
+            f = io.StringIO()
+        with f:
+            solicitacoes = (
+                (
+                    r["cpf_cliente"],
+                    r["data_hora_solicitacao"],
+                    float(r["limite_atual"]),
+                    float(r["novo_limite_solicitado"]),
+                    r["status_pedido"],
+                    int(r["score"]) if r.get("score") else None,
+                )
+                for r in chain(encerradas, csv.DictReader(f))
+            )
+            for lote in _lotes(solicitacoes, tamanho_lote):
+                total_solicitacoes += conn.executemany(SQL_INSERIR_SOLICITACAO, lote).rowcount
+
+    return total_clientes, total_solicitacoes
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Migra os CSVs de app/data para SQLite.")
+    parser.add_argument("--clientes", default=DATA_DIR / "clientes.csv")
+    parser.add_argument("--solicitacoes", default=DATA_DIR / "solicitacoes_aumento_limite.csv")
+    parser.add_argument("--destino", default=DATA_DIR / "banking.db")
+    parser.add_argument(
+        "--substituir", action="store_true", help="apaga os dados existentes no destino"
+    )
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    try:
+        clientes, solicitacoes = migrar(
+            args.clientes, args.solicitacoes, args.destino, args.substituir
+        )
+    except MigracaoError as e:
+        parser.exit(1, f"{e}\n")
+
+    print(
+        f"Migrados {clientes} clientes e {solicitacoes} solicitações para {args.destino} "
+        f"em {time.perf_counter() - inicio:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
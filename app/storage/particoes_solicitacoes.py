@@ -0,0 +1,313 @@
+"""
+Particionamento por período do histórico de solicitações em CSV.
+
+O arquivo principal guarda apenas a partição aberta (o período corrente). As
+partições já encerradas ficam em `<arquivo>.particoes/`, comprimidas, cada uma
+com um resumo pré-calculado.
+
+Uso:
+    python -m app.storage.particoes_solicitacoes [--arquivo ARQUIVO] [--janela mes]
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import logging
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from datetime import date, datetime
+from pathlib import Path
+
+from app.config import settings
+from app.storage.arquivos import TravaArquivo, escrita_atomica
+from app.storage.resumo_solicitacoes import ResumoSolicitacoes
+
+logger = logging.getLogger(__name__)
+
+# Tamanho do prefixo da data/hora ISO que identifica a partição.
+TAMANHO_CHAVE = {"ano": 4, "mes": 7, "dia": 10}
+
+
+def chave_particao(data_hora: str, janela: str | None = None) -> str:
+    """Retorna a chave da partição de uma data/hora ISO (ex.: `2026-01` por mês)."""
+    return data_hora[: TAMANHO_CHAVE[janela or settings.solicitacoes_particao]]
+
+
+def resumir(linhas: list[dict[str, str]], chave: str) -> dict:
+    """Calcula o resumo de uma partição a partir das suas linhas."""
+    limites = [float(row["novo_limite_solicitado"]) for row in linhas]
+    datas = [row["data_hora_solicitacao"] for row in linhas]
+    return {
+        "particao": chave,
+        "inicio": min(datas),
+        "fim": max(datas),
+        "total": len(linhas),
+        "por_status": dict(Counter(row["status_pedido"] for row in linhas)),
+        "soma_novo_limite_solicitado": sum(limites),
+        "media_novo_limite_solicitado": sum(limites) / len(limites),
+        "cpfs_distintos": len({row["cpf_cliente"] for row in linhas}),
+        "por_dia": ResumoSolicitacoes.de_linhas(linhas).dias,
+    }
+
+
+class ParticoesSolicitacoes:
+    """
+    Partições encerradas do CSV de solicitações.
+
+    `rotacionar` move as linhas de períodos anteriores ao corrente do arquivo
+    principal para as suas partições e regrava o arquivo principal só com o
+    período aberto. Tudo acontece sob a trava exclusiva do arquivo, a mesma
+    usada pelo escritor em lote; leituras que combinam partições e arquivo
+    principal tomam a trava compartilhada.
+
+    Consultas por intervalo usam os resumos para descartar partições inteiras
+    sem abri-las; consultas por CPF usam o conjunto de CPFs de cada partição
+    (`<chave>.cpfs`, mantido em memória enquanto o arquivo não muda).
+    """
+
+    def __init__(self, csv_path: str | Path, janela: str | None = None):
+        self.csv_path = Path(csv_path)
+        self.janela = janela
+        self.diretorio = self.csv_path.with_suffix(".particoes")
+        self.trava = TravaArquivo(self.csv_path.with_suffix(".lock"))
+        self._lock = threading.Lock()
+        self._ultima_chave: str | None = None
+        self._rotacionando = False
+        self._cpfs: dict[str, tuple[int, frozenset[str]]] = {}
+
+    def _arquivo(self, chave: str) -> Path:
+        return self.diretorio / f"{chave}.csv.gz"
+
+    def _arquivo_resumo(self, chave: str) -> Path:
+        return self.diretorio / f"{chave}.resumo.json"
+
+    def _arquivo_cpfs(self, chave: str) -> Path:
+        return self.diretorio / f"{chave}.cpfs"
+
+    def existem(self) -> bool:
+        return self.diretorio.is_dir()
+
+    def resumos(self) -> list[dict]:
+        """Retorna os resumos das partições encerradas, em ordem cronológica."""
+        if not self.existem():
+            return []
+        resumos = []
+        for path in sorted(self.diretorio.glob("*.resumo.json")):
+            resumos.append(json.loads(path.read_text(encoding="utf-8")))
+        return resumos
+
+    def linhas(self, chave: str, filtro: str | None = None) -> Iterator[dict[str, str]]:
+        """
+        Percorre as linhas de uma partição.
+
+        Com `filtro`, só são convertidas as linhas cujo texto o contém, o que
+        permite buscar um CPF sem interpretar a partição inteira.
+        """
+        try:
+            f = gzip.open(self._arquivo(chave), "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            campos = next(csv.reader([f.readline().decode("utf-8")]), None)
+            if not campos:
+                return
+            agulha = filtro.encode("utf-8") if filtro else None
+            for linha in f:
+                if agulha is not None and agulha not in linha:
+                    continue
+                valores = next(csv.reader([linha.decode("utf-8")]), None)
+                if valores:
+                    yield dict(zip(campos, valores))
+
+    def iterar_linhas(self) -> Iterator[dict[str, str]]:
+        """Percorre as linhas de todas as partições encerradas."""
+        for resumo in self.resumos():
+            yield from self.linhas(resumo["particao"])
+
+    def linhas_periodo(
+        self, desde: datetime | None = None, ate: datetime | None = None
+    ) -> Iterator[dict[str, str]]:
+        """Percorre as linhas com `desde <= data_hora < ate`, pulando partições fora dele."""
+        inicio = desde.isoformat() if desde else None
+        fim = ate.isoformat() if ate else None
+        for resumo in self.resumos():
+            if (inicio and resumo["fim"] < inicio) or (fim and resumo["inicio"] >= fim):
+                continue
+            for row in self.linhas(resumo["particao"]):
+                data_hora = row["data_hora_solicitacao"]
+                if (inicio or "") <= data_hora and (fim is None or data_hora < fim):
+                    yield row
+
+    def cpfs(self, chave: str) -> frozenset[str]:
+        """CPFs presentes em uma partição."""
+        path = self._arquivo_cpfs(chave)
+        try:
+            versao = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Partição gravada antes do arquivo de CPFs: calculado uma vez a partir dela.
+            path = None
+            try:
+                versao = self._arquivo(chave).stat().st_mtime_ns
+            except FileNotFoundError:
+                return frozenset()
+        with self._lock:
+            cache = self._cpfs.get(chave)
+        if cache is not None and cache[0] == versao:
+            return cache[1]
+        if path is not None:
+            cpfs = frozenset(path.read_text(encoding="utf-8").split())
+        else:
+            cpfs = frozenset(row["cpf_cliente"] for row in self.linhas(chave))
+        with self._lock:
+            self._cpfs[chave] = (versao, cpfs)
+        return cpfs
+
+    def linhas_por_cpf(self, cpf: str) -> Iterator[dict[str, str]]:
+        """Percorre as linhas de um CPF, abrindo só as partições que o contêm."""
+        for resumo in self.resumos():
+            if cpf not in self.cpfs(resumo["particao"]):
+                continue
+            for row in self.linhas(resumo["particao"], filtro=cpf):
+                if row["cpf_cliente"] == cpf:
+                    yield row
+
+    def resumo(self, desde: date | None = None, ate: date | None = None) -> ResumoSolicitacoes:
+        """Soma os agregados diários das partições que cruzam o período (datas inclusivas)."""
+        inicio = desde.isoformat() if desde else ""
+        fim = ate.isoformat() if ate else None
+        total = ResumoSolicitacoes()
+        for resumo in self.resumos():
+            if resumo["fim"][:10] < inicio or (fim is not None and resumo["inicio"][:10] > fim):
+                continue
+            if "por_dia" in resumo:
+                dias = ResumoSolicitacoes(resumo["por_dia"])
+            else:
+                dias = ResumoSolicitacoes.de_linhas(self.linhas(resumo["particao"]))
+            total.combinar(dias.recortar(desde, ate))
+        return total
+
+    def agendar_rotacao(self, data_hora: datetime) -> None:
+        """
+        Inicia uma rotação em background quando o período da solicitação
+        registrada difere do último visto pelo processo.
+        """
+        chave = chave_particao(data_hora.isoformat(), self.janela)
+        with self._lock:
+            if chave == self._ultima_chave or self._rotacionando:
+                return
+            self._ultima_chave = chave
+            self._rotacionando = True
+        threading.Thread(target=self._rotacionar_em_background, daemon=True).start()
+
+    def _rotacionar_em_background(self) -> None:
+        try:
+            self.rotacionar()
+        except Exception as e:
+            logger.error(f"Erro ao rotacionar solicitações de {self.csv_path}: {e}")
+        finally:
+            with self._lock:
+                self._rotacionando = False
+
+    def rotacionar(self, referencia: datetime | None = None) -> list[str]:
+        """
+        Encerra as partições anteriores ao período de `referencia` (padrão: agora).
+
+        Retorna as chaves das partições criadas ou atualizadas.
+        """
+        atual = chave_particao((referencia or datetime.now()).isoformat(), self.janela)
+
+        with self.trava.exclusiva():
+            try:
+                with open(self.csv_path, encoding="utf-8", newline="") as f:
+                    reader = csv.DictReader(f)
+                    campos = reader.fieldnames
+                    linhas = list(reader)
+            except FileNotFoundError:
+                return []
+
+            encerradas: dict[str, list[dict[str, str]]] = {}
+            abertas = []
+            for row in linhas:
+                chave = chave_particao(row["data_hora_solicitacao"], self.janela)
+                if chave < atual:
+                    encerradas.setdefault(chave, []).append(row)
+                else:
+                    abertas.append(row)
+            if not encerradas:
+                return []
+
+            self.diretorio.mkdir(parents=True, exist_ok=True)
+            for chave, novas in sorted(encerradas.items()):
+                self._gravar_particao(chave, campos, novas)
+
+            with escrita_atomica(self.csv_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=campos)
+                writer.writeheader()
+                writer.writerows(abertas)
+
+        logger.info(f"Partições encerradas em {self.diretorio}: {', '.join(sorted(encerradas))}")
+        return sorted(encerradas)
+
+    def _gravar_particao(
+        self, chave: str, campos: list[str], novas: list[dict[str, str]]
+    ) -> None:
+        # Linhas já presentes (de uma rotação interrompida) não são duplicadas.
+        def identidade(row: dict[str, str]) -> tuple:
+            return tuple(row.get(campo) or "" for campo in campos)
+
+        existentes = list(self.linhas(chave))
+        vistas = {identidade(row) for row in existentes}
+        linhas = existentes + [row for row in novas if identidade(row) not in vistas]
+        linhas.sort(key=lambda row: row["data_hora_solicitacao"])
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=campos, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(linhas)
+        with escrita_atomica(self._arquivo(chave), "wb") as f:
+            f.write(gzip.compress(buffer.getvalue().encode("utf-8")))
+        cpfs = sorted({row["cpf_cliente"] for row in linhas})
+        with escrita_atomica(self._arquivo_cpfs(chave), "w", encoding="utf-8") as f:
+            f.write("\n".join(cpfs) + "\n")
+        with escrita_atomica(self._arquivo_resumo(chave), "w", encoding="utf-8") as f:
+            json.dump(resumir(linhas, chave), f, ensure_ascii=False)
+
+
+_particoes: dict[Path, ParticoesSolicitacoes] = {}
+_particoes_lock = threading.Lock()
+
+
+def obter_particoes_solicitacoes(csv_path: str | Path) -> ParticoesSolicitacoes:
+    """Retorna as partições compartilhadas pelo processo para o arquivo informado."""
+    chave = Path(csv_path).resolve()
+    with _particoes_lock:
+        particoes = _particoes.get(chave)
+        if particoes is None:
+            particoes = ParticoesSolicitacoes(chave)
+            _particoes[chave] = particoes
+        return particoes
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Encerra as partições de solicitações anteriores ao período corrente."
+    )
+    parser.add_argument(
+        "--arquivo",
+        default=Path(__file__).parent.parent / "data" / "solicitacoes_aumento_limite.csv",
+    )
+    parser.add_argument("--janela", choices=sorted(TAMANHO_CHAVE), default=None)
+    args = parser.parse_args(argv)
+
+    particoes = ParticoesSolicitacoes(args.arquivo, args.janela)
+    encerradas = particoes.rotacionar()
+    print(f"Partições encerradas: {', '.join(encerradas) or 'nenhuma'}")
+    for resumo in particoes.resumos():
+        print(json.dumps(resumo, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
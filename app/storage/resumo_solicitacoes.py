@@ -0,0 +1,165 @@
+"""Agregados diários das solicitações, atualizados a cada linha registrada."""
+
+from bisect import bisect_right
+from collections import Counter
+from datetime import date
+
+# Limites superiores (exclusivos) das faixas das distribuições de limite e de aumento.
+FAIXAS_LIMITE = (1_000.0, 2_000.0, 5_000.0, 10_000.0, 20_000.0, 50_000.0, 100_000.0)
+FAIXAS_AUMENTO = (1.25, 1.5, 2.0, 3.0, 5.0)
+
+
+def rotulos_faixas(faixas: tuple[float, ...]) -> list[str]:
+    """Rótulos das faixas `[..., a)`, `[a, b)`, ..., `[z, ...)`."""
+    rotulos = [f"<{faixas[0]:g}"]
+    rotulos += [f"{a:g}-{b:g}" for a, b in zip(faixas, faixas[1:])]
+    rotulos.append(f">={faixas[-1]:g}")
+    return rotulos
+
+
+def _novo_dia() -> dict:
+    return {
+        "por_status": {},
+        "por_score": {},
+        "limite_atual": [0] * (len(FAIXAS_LIMITE) + 1),
+        "novo_limite_solicitado": [0] * (len(FAIXAS_LIMITE) + 1),
+        "aumento": [0] * (len(FAIXAS_AUMENTO) + 1),
+        "soma_limite_atual": 0.0,
+        "soma_novo_limite_solicitado": 0.0,
+    }
+
+
+class ResumoSolicitacoes:
+    """
+    Contadores de solicitações por dia (`YYYY-MM-DD`).
+
+    Cada dia guarda as quantidades por status, por score e status (o score é
+    mapeado para faixas só na consulta) e os histogramas de limite atual, de
+    novo limite solicitado e da razão entre eles. Somar dias é barato, então
+    consultas por período não dependem do tamanho do histórico.
+    """
+
+    def __init__(self, dias: dict[str, dict] | None = None):
+        self.dias = dias or {}
+
+    def adicionar(
+        self,
+        data_hora: str,
+        status: str,
+        score: int | None,
+        limite_atual: float,
+        novo_limite: float,
+        quantidade: int = 1,
+    ) -> None:
+        self.adicionar_faixas(
+            data_hora[:10],
+            status,
+            score,
+            bisect_right(FAIXAS_LIMITE, limite_atual),
+            bisect_right(FAIXAS_LIMITE, novo_limite),
+            bisect_right(FAIXAS_AUMENTO, novo_limite / limite_atual) if limite_atual > 0 else None,
+            quantidade,
+            limite_atual * quantidade,
+            novo_limite * quantidade,
+        )
+
+    def adicionar_faixas(
+        self,
+        dia: str,
+        status: str,
+        score: int | None,
+        faixa_limite_atual: int,
+        faixa_novo_limite: int,
+        faixa_aumento: int | None,
+        quantidade: int,
+        soma_limite_atual: float,
+        soma_novo_limite: float,
+    ) -> None:
+        """Acrescenta solicitações já agregadas por faixa (índices de `FAIXAS_*`)."""
+        contadores = self.dias.setdefault(dia, _novo_dia())
+        contadores["por_status"][status] = contadores["por_status"].get(status, 0) + quantidade
+        por_score = contadores["por_score"].setdefault("" if score is None else str(score), {})
+        por_score[status] = por_score.get(status, 0) + quantidade
+        contadores["limite_atual"][faixa_limite_atual] += quantidade
+        contadores["novo_limite_solicitado"][faixa_novo_limite] += quantidade
+        if faixa_aumento is not None:
+            contadores["aumento"][faixa_aumento] += quantidade
+        contadores["soma_limite_atual"] += soma_limite_atual
+        contadores["soma_novo_limite_solicitado"] += soma_novo_limite
+
+    def adicionar_linha(self, row: dict[str, str]) -> None:
+        """Acrescenta uma linha do CSV de solicitações."""
+        score = row.get("score")
+        self.adicionar(
+            row["data_hora_solicitacao"],
+            row["status_pedido"],
+            int(score) if score else None,
+            float(row["limite_atual"]),
+            float(row["novo_limite_solicitado"]),
+        )
+
+    @classmethod
+    def de_linhas(cls, linhas) -> "ResumoSolicitacoes":
+        resumo = cls()
+        for row in linhas:
+            resumo.adicionar_linha(row)
+        return resumo
+
+    def combinar(self, outro: "ResumoSolicitacoes") -> None:
+        """Soma os contadores de `outro` a este resumo."""
+        for chave, dia in outro.dias.items():
+            destino = self.dias.setdefault(chave, _novo_dia())
+            for status, n in dia["por_status"].items():
+                destino["por_status"][status] = destino["por_status"].get(status, 0) + n
+            for score, contagem in dia["por_score"].items():
+                por_score = destino["por_score"].setdefault(score, {})
+                for status, n in contagem.items():
+                    por_score[status] = por_score.get(status, 0) + n
+            for campo in ("limite_atual", "novo_limite_solicitado", "aumento"):
+                destino[campo] = [a + b for a, b in zip(destino[campo], dia[campo])]
+            destino["soma_limite_atual"] += dia["soma_limite_atual"]
+            destino["soma_novo_limite_solicitado"] += dia["soma_novo_limite_solicitado"]
+
+    def recortar(self, desde: date | None = None, ate: date | None = None) -> "ResumoSolicitacoes":
+        """Retorna apenas os dias entre `desde` e `ate`, inclusive."""
+        inicio = desde.isoformat() if desde else ""
+        fim = ate.isoformat() if ate else None
+        return ResumoSolicitacoes(
+            {
+                chave: dia
+                for chave, dia in self.dias.items()
+                if inicio <= chave and (fim is None or chave <= fim)
+            }
+        )
+
+    def totais(self) -> dict:
+        """Soma todos os dias do resumo."""
+        por_status: Counter = Counter()
+        por_score: dict[int | None, Counter] = {}
+        limite_atual = [0] * (len(FAIXAS_LIMITE) + 1)
+        novo_limite = [0] * (len(FAIXAS_LIMITE) + 1)
+        aumento = [0] * (len(FAIXAS_AUMENTO) + 1)
+        soma_limite_atual = 0.0
+        soma_novo_limite = 0.0
+
+        for dia in self.dias.values():
+            por_status.update(dia["por_status"])
+            for score, contagem in dia["por_score"].items():
+                por_score.setdefault(int(score) if score else None, Counter()).update(contagem)
+            limite_atual = [a + b for a, b in zip(limite_atual, dia["limite_atual"])]
+            novo_limite = [a + b for a, b in zip(novo_limite, dia["novo_limite_solicitado"])]
+            aumento = [a + b for a, b in zip(aumento, dia["aumento"])]
+            soma_limite_atual += dia["soma_limite_atual"]
+            soma_novo_limite += dia["soma_novo_limite_solicitado"]
+
+        total = sum(por_status.values())
+        return {
+            "total": total,
+            "por_status": dict(por_status),
+            "por_score": {score: dict(contagem) for score, contagem in por_score.items()},
+            "limite_atual": dict(zip(rotulos_faixas(FAIXAS_LIMITE), limite_atual)),
+            "novo_limite_solicitado": dict(zip(rotulos_faixas(FAIXAS_LIMITE), novo_limite)),
+            "aumento": dict(zip(rotulos_faixas(FAIXAS_AUMENTO), aumento)),
+            "media_limite_atual": soma_limite_atual / total if total else None,
+            "media_novo_limite_solicitado": soma_novo_limite / total if total else None,
+        }
@@ -0,0 +1,112 @@
+"""Backend CSV do histórico de solicitações de aumento de limite."""
+
+import csv
+from datetime import date, datetime
+from pathlib import Path
+
+from app.models import SolicitacaoCredito, StatusSolicitacao
+from app.storage.base import SolicitacaoStorage
+from app.storage.escrita_em_lote import obter_escritor_em_lote
+from app.storage.indice_solicitacoes import obter_indice_solicitacoes
+from app.storage.particoes_solicitacoes import obter_particoes_solicitacoes
+from app.storage.resumo_solicitacoes import ResumoSolicitacoes
+
+CAMPOS_SOLICITACAO = [
+    "cpf_cliente",
+    "data_hora_solicitacao",
+    "limite_atual",
+    "novo_limite_solicitado",
+    "status_pedido",
+    "score",
+]
+
+
+def solicitacao_para_linha(solicitacao: SolicitacaoCredito) -> list:
+    return [
+        solicitacao.cpf_cliente,
+        solicitacao.data_hora_solicitacao.isoformat(),
+        solicitacao.limite_atual,
+        solicitacao.novo_limite_solicitado,
+        solicitacao.status_pedido.value,
+        "" if solicitacao.score is None else solicitacao.score,
+    ]
+
+
+def linha_para_solicitacao(row: dict[str, str]) -> SolicitacaoCredito:
+    return SolicitacaoCredito(
+        cpf_cliente=row["cpf_cliente"],
+        data_hora_solicitacao=datetime.fromisoformat(row["data_hora_solicitacao"]),
+        limite_atual=float(row["limite_atual"]),
+        novo_limite_solicitado=float(row["novo_limite_solicitado"]),
+        status_pedido=StatusSolicitacao(row["status_pedido"]),
+        score=int(row["score"]) if row.get("score") else None,
+    )
+
+
+class CsvSolicitacaoStorage(SolicitacaoStorage):
+    """
+    Solicitações gravadas em append em arquivos CSV particionados por período.
+
+    As gravações de todas as sessões passam pelo escritor em lote do arquivo,
+    que as agrupa em poucas escritas. O arquivo principal guarda o período
+    aberto; consultas por CPF, por intervalo e agregados usam o seu índice
+    compartilhado e, nas partições encerradas, os resumos de cada uma.
+    """
+
+    def __init__(self, csv_path: str | Path):
+        self.csv_path = Path(csv_path)
+        self.indice = obter_indice_solicitacoes(self.csv_path)
+        self.escritor = obter_escritor_em_lote(self.csv_path, CAMPOS_SOLICITACAO)
+        self.particoes = obter_particoes_solicitacoes(self.csv_path)
+
+    def anexar(self, solicitacao: SolicitacaoCredito) -> None:
+        """Grava a solicitação em lote com as demais e aguarda a confirmação."""
+        self.escritor.gravar(solicitacao_para_linha(solicitacao))
+        self.particoes.agendar_rotacao(solicitacao.data_hora_solicitacao)
+
+    def _ler_arquivo_principal(self) -> list[dict[str, str]]:
+        try:
+            with open(self.csv_path, encoding="utf-8", newline="") as f:
+                return list(csv.DictReader(f))
+        except FileNotFoundError:
+            return []
+
+    def listar(self) -> list[SolicitacaoCredito]:
+        if not self.particoes.existem():
+            return [linha_para_solicitacao(row) for row in self._ler_arquivo_principal()]
+        with self.particoes.trava.compartilhada():
+            linhas = list(self.particoes.iterar_linhas()) + self._ler_arquivo_principal()
+        return [linha_para_solicitacao(row) for row in linhas]
+
+    def listar_por_cpf(self, cpf: str) -> list[SolicitacaoCredito]:
+        if not self.particoes.existem():
+            return [linha_para_solicitacao(row) for row in self.indice.linhas_por_cpf(cpf)]
+        with self.particoes.trava.compartilhada():
+            linhas = list(self.particoes.linhas_por_cpf(cpf)) + self.indice.linhas_por_cpf(cpf)
+        return [linha_para_solicitacao(row) for row in linhas]
+
+    def listar_periodo(
+        self,
+        desde: datetime | None = None,
+        ate: datetime | None = None,
+        cpf: str | None = None,
+    ) -> list[SolicitacaoCredito]:
+        if not self.particoes.existem():
+            linhas = self.indice.linhas_periodo(desde, ate, cpf)
+        else:
+            with self.particoes.trava.compartilhada():
+                encerradas = self.particoes.linhas_periodo(desde, ate)
+                if cpf is not None:
+                    encerradas = (row for row in encerradas if row["cpf_cliente"] == cpf)
+                linhas = list(encerradas) + self.indice.linhas_periodo(desde, ate, cpf)
+            linhas.sort(key=lambda row: row["data_hora_solicitacao"])
+        return [linha_para_solicitacao(row) for row in linhas]
+
+    def resumo(self, desde: date | None = None, ate: date | None = None) -> ResumoSolicitacoes:
+        """Combina os agregados das partições encerradas com os do arquivo principal."""
+        if not self.particoes.existem():
+            return self.indice.resumo(desde, ate)
+        with self.particoes.trava.compartilhada():
+            resumo = self.particoes.resumo(desde, ate)
+            resumo.combinar(self.indice.resumo(desde, ate))
+        return resumo
@@ -0,0 +1,307 @@
+"""Backend SQLite embarcado para clientes e solicitações."""
+
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+from app.models import SolicitacaoCredito, StatusSolicitacao
+from app.storage.base import ClienteStorage, SolicitacaoStorage
+from app.storage.resumo_solicitacoes import FAIXAS_AUMENTO, FAIXAS_LIMITE, ResumoSolicitacoes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    cpf TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    data_nascimento TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    limite_atual REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS solicitacoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cpf_cliente TEXT NOT NULL,
+    data_hora_solicitacao TEXT NOT NULL,
+    limite_atual REAL NOT NULL,
+    novo_limite_solicitado REAL NOT NULL,
+    status_pedido TEXT NOT NULL,
+    score INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_solicitacoes_cpf ON solicitacoes (cpf_cliente);
+CREATE INDEX IF NOT EXISTS idx_solicitacoes_data_hora ON solicitacoes (data_hora_solicitacao);
+CREATE TABLE IF NOT EXISTS versao_clientes (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    versao INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO versao_clientes (id, versao) VALUES (1, 0);
+CREATE TRIGGER IF NOT EXISTS clientes_versao_insert AFTER INSERT ON clientes
+BEGIN UPDATE versao_clientes SET versao = versao + 1; END;
+CREATE TRIGGER IF NOT EXISTS clientes_versao_update AFTER UPDATE ON clientes
+BEGIN UPDATE versao_clientes SET versao = versao + 1; END;
+CREATE TRIGGER IF NOT EXISTS clientes_versao_delete AFTER DELETE ON clientes
+BEGIN UPDATE versao_clientes SET versao = versao + 1; END;
+"""
+
+
+def _faixa(expressao: str, faixas: tuple[float, ...]) -> str:
+    """Índice da faixa em SQL, igual a `bisect_right(faixas, valor)`."""
+    return "(" + " + ".join(f"({expressao} >= {limite!r})" for limite in faixas) + ")"
+
+
+def _colunas_resumo(linha: str) -> str:
+    """Chave do agregado diário para as colunas de `linha` ("NEW." ou "")."""
+    limite, novo = f"{linha}limite_atual", f"{linha}novo_limite_solicitado"
+    return (
+        f"substr({linha}data_hora_solicitacao, 1, 10), {linha}status_pedido, "
+        f"COALESCE({linha}score, -1), {_faixa(limite, FAIXAS_LIMITE)}, "
+        f"{_faixa(novo, FAIXAS_LIMITE)}, "
+        f"CASE WHEN {limite} > 0 THEN {_faixa(f'{novo} / {limite}', FAIXAS_AUMENTO)} ELSE -1 END"
+    )
+
+
+# Agregados diários das solicitações por status, score e faixas de limite e de
+# aumento (-1 para score ausente ou sem aumento calculável, já que NULLs não
+# colidem na chave), mantidos pelo trigger na mesma transação de cada INSERT.
+SCHEMA_RESUMO = f"""
+CREATE TABLE IF NOT EXISTS resumo_solicitacoes_dia (
+    dia TEXT NOT NULL,
+    status_pedido TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    faixa_limite_atual INTEGER NOT NULL,
+    faixa_novo_limite INTEGER NOT NULL,
+    faixa_aumento INTEGER NOT NULL,
+    quantidade INTEGER NOT NULL,
+    soma_limite_atual REAL NOT NULL,
+    soma_novo_limite REAL NOT NULL,
+    PRIMARY KEY (dia, status_pedido, score, faixa_limite_atual, faixa_novo_limite, faixa_aumento)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS solicitacoes_resumo_insert AFTER INSERT ON solicitacoes
+BEGIN
+    INSERT INTO resumo_solicitacoes_dia VALUES (
+        {_colunas_resumo("NEW.")}, 1, NEW.limite_atual, NEW.novo_limite_solicitado
+    )
+    ON CONFLICT (dia, status_pedido, score, faixa_limite_atual, faixa_novo_limite, faixa_aumento)
+    DO UPDATE SET
+        quantidade = quantidade + 1,
+        soma_limite_atual = soma_limite_atual + excluded.soma_limite_atual,
+        soma_novo_limite = soma_novo_limite + excluded.soma_novo_limite;
+END;
+"""
+# Preenche o agregado de bancos criados antes dele.
+SQL_RECONSTRUIR_RESUMO = (
+    f"INSERT INTO resumo_solicitacoes_dia SELECT {_colunas_resumo('')}, COUNT(*), "
+    "SUM(limite_atual), SUM(novo_limite_solicitado) FROM solicitacoes "
+    "GROUP BY 1, 2, 3, 4, 5, 6"
+)
+
+SQL_CLIENTE_POR_CPF = (
+    "SELECT cpf, nome, data_nascimento, score, limite_atual FROM clientes WHERE cpf = ?"
+)
+SQL_CLIENTES = (
+    "SELECT cpf, nome, data_nascimento, score, limite_atual FROM clientes ORDER BY rowid"
+)
+SQL_VERSAO_CLIENTES = "SELECT versao FROM versao_clientes WHERE id = 1"
+SQL_INSERIR_CLIENTE = (
+    "INSERT OR IGNORE INTO clientes (cpf, nome, data_nascimento, score, limite_atual) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+SQL_ATUALIZAR_CLIENTE = {
+    "score": "UPDATE clientes SET score = ? WHERE cpf = ?",
+    "limite_atual": "UPDATE clientes SET limite_atual = ? WHERE cpf = ?",
+}
+SQL_ATUALIZAR_CLIENTE_SE_MAIOR = {
+    "score": "UPDATE clientes SET score = ? WHERE cpf = ? AND score < ?",
+    "limite_atual": "UPDATE clientes SET limite_atual = ? WHERE cpf = ? AND limite_atual < ?",
+}
+SQL_INSERIR_SOLICITACAO = (
+    "INSERT INTO solicitacoes (cpf_cliente, data_hora_solicitacao, limite_atual, "
+    "novo_limite_solicitado, status_pedido, score) VALUES (?, ?, ?, ?, ?, ?)"
+)
+SQL_SOLICITACOES = (
+    "SELECT cpf_cliente, data_hora_solicitacao, limite_atual, novo_limite_solicitado, "
+    "status_pedido, score FROM solicitacoes ORDER BY id"
+)
+SQL_SOLICITACOES_POR_CPF = (
+    "SELECT cpf_cliente, data_hora_solicitacao, limite_atual, novo_limite_solicitado, "
+    "status_pedido, score FROM solicitacoes WHERE cpf_cliente = ? ORDER BY id"
+)
+# Limites ausentes são passados como NULL; datas ISO sem fuso ordenam como texto.
+SQL_SOLICITACOES_PERIODO = (
+    "SELECT cpf_cliente, data_hora_solicitacao, limite_atual, novo_limite_solicitado, "
+    "status_pedido, score FROM solicitacoes "
+    "WHERE (?1 IS NULL OR data_hora_solicitacao >= ?1) "
+    "AND (?2 IS NULL OR data_hora_solicitacao < ?2) "
+    "AND (?3 IS NULL OR cpf_cliente = ?3) "
+    "ORDER BY data_hora_solicitacao, id"
+)
+# Lê os agregados diários; o range usa a chave primária, que começa pelo dia.
+SQL_RESUMO_SOLICITACOES = (
+    "SELECT dia, status_pedido, score, faixa_limite_atual, faixa_novo_limite, faixa_aumento, "
+    "quantidade, soma_limite_atual, soma_novo_limite FROM resumo_solicitacoes_dia "
+    "WHERE (?1 IS NULL OR dia >= ?1) AND (?2 IS NULL OR dia <= ?2)"
+)
+
+
+class BancoSqlite:
+    """
+    Arquivo SQLite compartilhado pelos storages, com uma conexão por thread.
+
+    O banco opera em modo WAL, de forma que leitores não bloqueiam o escritor.
+    Todas as consultas usam SQL constante com parâmetros, aproveitando o cache
+    de statements preparados de cada conexão.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._local = threading.local()
+        with self.conexao() as conn:
+            conn.executescript(SCHEMA)
+            colunas = {row[1] for row in conn.execute("PRAGMA table_info(solicitacoes)")}
+            if "score" not in colunas:
+                conn.execute("ALTER TABLE solicitacoes ADD COLUMN score INTEGER")
+            tem_resumo = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'resumo_solicitacoes_dia'"
+            ).fetchone()
+            conn.executescript(SCHEMA_RESUMO)
+            if not tem_resumo:
+                conn.execute(SQL_RECONSTRUIR_RESUMO)
+
+    def conexao(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+
+def _linha_cliente(row: tuple) -> dict[str, str]:
+    cpf, nome, data_nascimento, score, limite_atual = row
+    return {
+        "cpf": cpf,
+        "nome": nome,
+        "data_nascimento": data_nascimento,
+        "score": str(score),
+        "limite_atual": f"{limite_atual:.2f}",
+    }
+
+
+def _linha_solicitacao(row: tuple) -> SolicitacaoCredito:
+    cpf, data_hora, limite_atual, novo_limite, status, score = row
+    return SolicitacaoCredito(
+        cpf_cliente=cpf,
+        data_hora_solicitacao=datetime.fromisoformat(data_hora),
+        limite_atual=limite_atual,
+        novo_limite_solicitado=novo_limite,
+        status_pedido=StatusSolicitacao(status),
+        score=score,
+    )
+
+
+class SqliteClienteStorage(ClienteStorage):
+    def __init__(self, banco: BancoSqlite):
+        self.banco = banco
+
+    def obter(self, cpf: str) -> dict[str, str] | None:
+        row = self.banco.conexao().execute(SQL_CLIENTE_POR_CPF, (cpf,)).fetchone()
+        return _linha_cliente(row) if row is not None else None
+
+    def contem(self, cpf: str) -> bool:
+        return self.obter(cpf) is not None
+
+    def linhas(self) -> list[dict[str, str]]:
+        return [_linha_cliente(row) for row in self.banco.conexao().execute(SQL_CLIENTES)]
+
+    def versao(self) -> str | None:
+        return str(self.banco.conexao().execute(SQL_VERSAO_CLIENTES).fetchone()[0])
+
+    def adicionar(self, row: dict[str, str]) -> bool:
+        with self.banco.conexao() as conn:
+            cursor = conn.execute(
+                SQL_INSERIR_CLIENTE,
+                (
+                    row["cpf"],
+                    row["nome"],
+                    row["data_nascimento"],
+                    int(row["score"]),
+                    float(row["limite_atual"]),
+                ),
+            )
+        return cursor.rowcount == 1
+
+    def atualizar_campo(self, cpf: str, campo: str, valor: str) -> bool:
+        with self.banco.conexao() as conn:
+            cursor = conn.execute(SQL_ATUALIZAR_CLIENTE[campo], (valor, cpf))
+        return cursor.rowcount == 1
+
+    def atualizar_em_lote(
+        self, campo: str, valores: dict[str, str], apenas_maiores: bool = False
+    ) -> int:
+        with self.banco.conexao() as conn:
+            if apenas_maiores:
+                cursor = conn.executemany(
+                    SQL_ATUALIZAR_CLIENTE_SE_MAIOR[campo],
+                    ((valor, cpf, valor) for cpf, valor in valores.items()),
+                )
+            else:
+                cursor = conn.executemany(
+                    SQL_ATUALIZAR_CLIENTE[campo], ((valor, cpf) for cpf, valor in valores.items())
+                )
+        return cursor.rowcount
+
+
+class SqliteSolicitacaoStorage(SolicitacaoStorage):
+    def __init__(self, banco: BancoSqlite):
+        self.banco = banco
+
+    def anexar(self, solicitacao: SolicitacaoCredito) -> None:
+        with self.banco.conexao() as conn:
+            conn.execute(
+                SQL_INSERIR_SOLICITACAO,
+                (
+                    solicitacao.cpf_cliente,
+                    solicitacao.data_hora_solicitacao.isoformat(),
+                    solicitacao.limite_atual,
+                    solicitacao.novo_limite_solicitado,
+                    solicitacao.status_pedido.value,
+                    solicitacao.score,
+                ),
+            )
+
+    def listar(self) -> list[SolicitacaoCredito]:
+        return [_linha_solicitacao(row) for row in self.banco.conexao().execute(SQL_SOLICITACOES)]
+
+    def listar_por_cpf(self, cpf: str) -> list[SolicitacaoCredito]:
+        cursor = self.banco.conexao().execute(SQL_SOLICITACOES_POR_CPF, (cpf,))
+        return [_linha_solicitacao(row) for row in cursor]
+
+    def listar_periodo(
+        self,
+        desde: datetime | None = None,
+        ate: datetime | None = None,
+        cpf: str | None = None,
+    ) -> list[SolicitacaoCredito]:
+        parametros = (
+            desde.isoformat() if desde else None,
+            ate.isoformat() if ate else None,
+            cpf,
+        )
+        cursor = self.banco.conexao().execute(SQL_SOLICITACOES_PERIODO, parametros)
+        return [_linha_solicitacao(row) for row in cursor]
+
+    def resumo(self, desde: date | None = None, ate: date | None = None) -> ResumoSolicitacoes:
+        """Lê os agregados diários do período, mantidos pelo banco a cada INSERT."""
+        parametros = (desde.isoformat() if desde else None, ate.isoformat() if ate else None)
+        resumo = ResumoSolicitacoes()
+        for row in self.banco.conexao().execute(SQL_RESUMO_SOLICITACOES, parametros):
+            dia, status, score, faixa_limite, faixa_novo, faixa_aumento, *valores = row
+            resumo.adicionar_faixas(
+                dia,
+                status,
+                None if score == -1 else score,
+                faixa_limite,
+                faixa_novo,
+                None if faixa_aumento == -1 else faixa_aumento,
+                *valores,
+            )
+        return resumo
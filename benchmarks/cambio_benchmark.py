@@ -0,0 +1,149 @@
+"""
+Benchmark das consultas de câmbio contra a SerpAPI simulada (replay).
+
+Mede vazão e latência (p50/p99) de `CambioService` com as respostas gravadas
+em `benchmarks/dados/serpapi_cotacoes.json`, sem rede, nos cenários:
+
+- frio: sem cache, toda consulta vai à API simulada;
+- quente: cotações em cache;
+- falha: API sempre falhando (timeout), com disjuntor e última cotação conhecida;
+- falha sem disjuntor: idem, esperando o timeout em toda consulta.
+
+Uso:
+    python -m benchmarks.cambio_benchmark --consultas 2000 --threads 16 --latencia 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+from app.services.cache_cotacoes import CacheCotacoes
+from app.services.cambio_service import (
+    MOEDAS_DISPONIVEIS,
+    CambioAPIIndisponivelError,
+    CambioService,
+)
+from app.services.disjuntor import Disjuntor
+from app.services.replay_cambio import TransporteReplay
+
+GRAVACOES = Path(__file__).parent / "dados" / "serpapi_cotacoes.json"
+
+
+def criar_service(
+    transporte: TransporteReplay, cache: CacheCotacoes, disjuntor: Disjuntor
+) -> CambioService:
+    return CambioService(
+        cache=cache,
+        cliente=httpx.Client(transport=transporte),
+        cliente_async=httpx.AsyncClient(transport=transporte),
+        disjuntor=disjuntor,
+    )
+
+
+def consultar_sync(service: CambioService, moedas: list[str], threads: int) -> tuple:
+    def consultar(moeda: str) -> tuple[float, bool]:
+        inicio = time.perf_counter()
+        try:
+            service.obter_cotacao_sync(moeda, "BRL")
+            ok = True
+        except CambioAPIIndisponivelError:
+            ok = False
+        return time.perf_counter() - inicio, ok
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        resultados = list(executor.map(consultar, moedas))
+    return time.perf_counter() - inicio, resultados
+
+
+def consultar_async(service: CambioService, moedas: list[str], concorrencia: int) -> tuple:
+    async def executar() -> list[tuple[float, bool]]:
+        semaforo = asyncio.Semaphore(concorrencia)
+
+        async def consultar(moeda: str) -> tuple[float, bool]:
+            async with semaforo:
+                inicio = time.perf_counter()
+                try:
+                    await service.obter_cotacao(moeda, "BRL")
+                    ok = True
+                except CambioAPIIndisponivelError:
+                    ok = False
+                return time.perf_counter() - inicio, ok
+
+        return await asyncio.gather(*(consultar(m) for m in moedas))
+
+    inicio = time.perf_counter()
+    resultados = asyncio.run(executar())
+    return time.perf_counter() - inicio, resultados
+
+
+def medir(nome: str, service, transporte, moedas: list[str], args) -> None:
+    consultar = consultar_async if args.modo == "async" else consultar_sync
+    requisicoes_antes = transporte.requisicoes
+    duracao, resultados = consultar(service, moedas, args.threads)
+    latencias = np.array([latencia for latencia, _ in resultados]) * 1000
+    falhas = sum(1 for _, ok in resultados if not ok)
+    p50, p99 = np.percentile(latencias, [50, 99])
+    print(
+        f"  {nome:<20} {len(moedas):>7} ops  {len(moedas) / duracao:>10.0f} ops/s  "
+        f"p50 {p50:>8.3f}ms  p99 {p99:>8.3f}ms  "
+        f"API {transporte.requisicoes - requisicoes_antes:>6}  falhas {falhas:>5}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark das consultas de câmbio (replay).")
+    parser.add_argument("--consultas", type=int, default=2_000)
+    parser.add_argument("--threads", type=int, default=16, help="threads ou tasks simultâneas")
+    parser.add_argument("--latencia", type=float, default=0.05, help="latência da API (s)")
+    parser.add_argument("--variacao", type=float, default=0.02, help="variação da latência (s)")
+    parser.add_argument("--timeout", type=float, default=0.5, help="espera até o timeout (s)")
+    parser.add_argument("--modo", choices=["sync", "async"], default="sync")
+    parser.add_argument("--gravacoes", default=str(GRAVACOES))
+    args = parser.parse_args(argv)
+
+    # Os avisos de falha e de cotação desatualizada inundariam a saída.
+    logging.basicConfig(level=logging.CRITICAL)
+
+    codigos = list(MOEDAS_DISPONIVEIS)
+    moedas = [codigos[i % len(codigos)] for i in range(args.consultas)]
+    ok = TransporteReplay.de_arquivo(
+        args.gravacoes, latencia=args.latencia, variacao=args.variacao, semente=1
+    )
+    falhando = TransporteReplay.de_arquivo(
+        args.gravacoes, latencia=args.timeout, taxa_erro=1.0, erro="timeout"
+    )
+    print(
+        f"{args.consultas} consultas, {args.threads} simultâneas ({args.modo}), "
+        f"latência {args.latencia * 1000:.0f}ms ± {args.variacao * 1000:.0f}ms"
+    )
+
+    frio = criar_service(ok, CacheCotacoes(ttl=0, janela_stale=0), Disjuntor())
+    medir("frio", frio, ok, moedas, args)
+
+    quente = criar_service(ok, CacheCotacoes(ttl=3600, janela_stale=0), Disjuntor())
+    for codigo in codigos:
+        quente.obter_cotacao_sync(codigo)
+    medir("quente", quente, ok, moedas, args)
+
+    # Cache já expirado, mas com a última cotação conhecida de cada moeda.
+    cache = CacheCotacoes(ttl=0, janela_stale=0)
+    aquecer = criar_service(ok, cache, Disjuntor())
+    for codigo in codigos:
+        aquecer.obter_cotacao_sync(codigo)
+    falha = criar_service(falhando, cache, Disjuntor())
+    medir("falha", falha, falhando, moedas, args)
+
+    sem_disjuntor = criar_service(falhando, cache, Disjuntor(falhas_para_abrir=10**9))
+    amostra = moedas[: max(args.threads * 4, 1)]
+    medir("falha sem disjuntor", sem_disjuntor, falhando, amostra, args)
+
+
+if __name__ == "__main__":
+    main()
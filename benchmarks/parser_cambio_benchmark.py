@@ -0,0 +1,104 @@
+"""
+Micro-benchmark da extração de cotações das respostas da SerpAPI.
+
+Compara o parser atual (`SerpApiProvedor.interpretar`) com a extração antiga
+(troca de vírgula por ponto + regex sobre o texto) em um corpus de respostas
+capturadas com o valor esperado (`benchmarks/dados/serpapi_respostas.json`),
+mais as gravações usadas no replay. Mostra o tempo por resposta, os acertos e
+o ramo da resposta usado em cada caso.
+
+Uso:
+    python -m benchmarks.parser_cambio_benchmark --repeticoes 20000
+"""
+
+import argparse
+import json
+import math
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+from app.services.provedores_cambio import SerpApiProvedor
+
+DADOS = Path(__file__).parent / "dados"
+
+
+def extrair_legado(dados: dict) -> float | None:
+    """Extração anterior ao parser por ramos, mantida aqui só para comparação."""
+
+    def extrair_valor(texto: str) -> float | None:
+        match = re.search(r"(\d+\.?\d*)", texto.replace(",", "."))
+        return float(match.group(1)) if match else None
+
+    valor = None
+    if "answer_box" in dados:
+        answer = dados["answer_box"]
+        if "result" in answer:
+            valor = extrair_valor(answer["result"])
+        elif "answer" in answer:
+            valor = extrair_valor(answer["answer"])
+    if valor is None and "knowledge_graph" in dados:
+        if "description" in dados["knowledge_graph"]:
+            valor = extrair_valor(dados["knowledge_graph"]["description"])
+    if valor is None and dados.get("organic_results"):
+        valor = extrair_valor(dados["organic_results"][0].get("snippet", ""))
+    return valor
+
+
+def carregar_corpus(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def medir(nome: str, extrair, respostas: list[dict], repeticoes: int) -> None:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for resposta in respostas:
+            extrair(resposta)
+    duracao = time.perf_counter() - inicio
+    total = repeticoes * len(respostas)
+    print(f"  {nome:<10} {total:>9} respostas  {duracao / total * 1e6:>8.3f} µs/resposta")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark do parser de cotações.")
+    parser.add_argument("--repeticoes", type=int, default=20_000)
+    parser.add_argument("--corpus", default=str(DADOS / "serpapi_respostas.json"))
+    args = parser.parse_args(argv)
+
+    corpus = carregar_corpus(Path(args.corpus))
+    gravacoes = carregar_corpus(DADOS / "serpapi_cotacoes.json")
+    respostas = [caso["resposta"] for caso in corpus] + list(gravacoes.values())
+    provedor = SerpApiProvedor()
+
+    print(f"Corpus: {len(corpus)} respostas rotuladas + {len(gravacoes)} gravações do replay")
+    medir("legado", extrair_legado, respostas, args.repeticoes)
+    medir("atual", provedor.interpretar, respostas, args.repeticoes)
+
+    def confere(valor, esperado) -> bool:
+        if valor is None or esperado is None:
+            return valor is esperado
+        return math.isclose(valor, esperado, rel_tol=1e-9)
+
+    print("\nAcertos no corpus rotulado:")
+    acertos = Counter()
+    for caso in corpus:
+        legado = extrair_legado(caso["resposta"])
+        atual = provedor.interpretar(caso["resposta"])
+        acertos["legado"] += confere(legado, caso["esperado"])
+        acertos["atual"] += confere(atual.valor, caso["esperado"])
+        print(
+            f"  {caso['descricao']:<40} esperado {caso['esperado']!s:>10}  "
+            f"legado {legado!s:>10}  atual {atual.valor!s:>10}  ({atual.ramo})"
+        )
+    print(f"  legado: {acertos['legado']}/{len(corpus)}  atual: {acertos['atual']}/{len(corpus)}")
+
+    ramos = Counter(provedor.interpretar(r).ramo for r in respostas)
+    print("\nRamos usados:")
+    for ramo, quantidade in ramos.most_common():
+        print(f"  {ramo!s:<40} {quantidade:>4}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark dos backends de armazenamento (CSV x SQLite).
+
+Gera uma base sintética, migra para SQLite e mede as operações usadas pelos
+serviços: carga inicial, busca por CPF, atualização de limite, registro de
+solicitação e histórico por CPF.
+
+Uso:
+    python -m benchmarks.storage_benchmark --clientes 1000000 --solicitacoes 10000000
+"""
+
+import argparse
+import csv
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.models import SolicitacaoCredito, StatusSolicitacao
+from app.services import ClienteService, SolicitacaoService
+from app.storage.backends import obter_banco_sqlite
+from app.storage.indice_clientes import CAMPOS_CLIENTE, IndiceClientes
+from app.storage.migrar_sqlite import migrar
+from app.storage.solicitacoes_csv import CAMPOS_SOLICITACAO, CsvSolicitacaoStorage
+from app.storage.sqlite import SqliteClienteStorage, SqliteSolicitacaoStorage
+
+
+def gerar_base(diretorio: Path, num_clientes: int, num_solicitacoes: int) -> tuple[Path, Path]:
+    rng = random.Random(42)
+    clientes_csv = diretorio / "clientes.csv"
+    solicitacoes_csv = diretorio / "solicitacoes.csv"
+
+    with open(clientes_csv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CAMPOS_CLIENTE)
+        for i in range(num_clientes):
+            writer.writerow([
+                f"{i:011d}",
+                f"Cliente {i}",
+                f"{rng.randint(1950, 2005)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                rng.randint(0, 1000),
+                f"{rng.choice([500, 2000, 5000, 15000, 50000]):.2f}",
+            ])
+
+    inicio = datetime(2025, 1, 1)
+    status = [s.value for s in StatusSolicitacao]
+    with open(solicitacoes_csv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CAMPOS_SOLICITACAO)
+        for i in range(num_solicitacoes):
+            writer.writerow([
+                f"{rng.randrange(num_clientes):011d}",
+                (inicio + timedelta(seconds=i * 3)).isoformat(),
+                5000.0,
+                float(rng.choice([10000, 15000, 25000, 50000])),
+                rng.choice(status),
+            ])
+
+    return clientes_csv, solicitacoes_csv
+
+
+def medir(nome: str, operacoes: int, funcao) -> None:
+    inicio = time.perf_counter()
+    funcao()
+    duracao = time.perf_counter() - inicio
+    taxa = operacoes / duracao if duracao else float("inf")
+    print(f"  {nome:<28} {operacoes:>8} ops  {duracao:>9.3f}s  {taxa:>12.0f} ops/s")
+
+
+def executar(backend: str, clientes, solicitacoes, args, cpfs: list[str]) -> None:
+    print(f"\n[{backend}]")
+    cliente_service = ClienteService(storage=clientes)
+    solicitacao_service = SolicitacaoService(storage=solicitacoes)
+
+    medir("carga inicial", 1, lambda: cliente_service.buscar_por_cpf(cpfs[0]))
+    medir("buscar_por_cpf", len(cpfs), lambda: [cliente_service.buscar_por_cpf(c) for c in cpfs])
+
+    atualizacoes = cpfs[: args.escritas]
+    medir(
+        "atualizar_limite",
+        len(atualizacoes),
+        lambda: [cliente_service.atualizar_limite(c, 20000.0) for c in atualizacoes],
+    )
+
+    novas = [
+        SolicitacaoCredito(
+            cpf_cliente=c,
+            data_hora_solicitacao=datetime.now(),
+            limite_atual=5000.0,
+            novo_limite_solicitado=15000.0,
+            status_pedido=StatusSolicitacao.APROVADO,
+        )
+        for c in atualizacoes
+    ]
+    medir("registrar solicitacao", len(novas), lambda: [solicitacoes.anexar(s) for s in novas])
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        medir(
+            f"registrar ({args.threads} threads)",
+            len(novas),
+            lambda: list(executor.map(solicitacoes.anexar, novas)),
+        )
+
+    historico = cpfs[: args.consultas_historico]
+    medir(
+        "listar_por_cpf",
+        len(historico),
+        lambda: [solicitacao_service.listar_por_cpf(c) for c in historico],
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compara os backends CSV e SQLite.")
+    parser.add_argument("--clientes", type=int, default=1_000_000)
+    parser.add_argument("--solicitacoes", type=int, default=10_000_000)
+    parser.add_argument("--buscas", type=int, default=10_000)
+    parser.add_argument("--escritas", type=int, default=1_000)
+    parser.add_argument("--consultas-historico", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--diretorio", help="reaproveita/gera a base neste diretório")
+    args = parser.parse_args(argv)
+
+    diretorio = Path(args.diretorio or tempfile.mkdtemp(prefix="storage_benchmark_"))
+    diretorio.mkdir(parents=True, exist_ok=True)
+    print(f"Base em {diretorio}: {args.clientes} clientes, {args.solicitacoes} solicitações")
+
+    inicio = time.perf_counter()
+    clientes_csv, solicitacoes_csv = gerar_base(diretorio, args.clientes, args.solicitacoes)
+    print(f"Geração da base: {time.perf_counter() - inicio:.2f}s")
+
+    banco_path = diretorio / "banking.db"
+    inicio = time.perf_counter()
+    migrar(clientes_csv, solicitacoes_csv, banco_path, substituir=True)
+    print(f"Migração CSV -> SQLite: {time.perf_counter() - inicio:.2f}s")
+
+    rng = random.Random(7)
+    cpfs = [f"{rng.randrange(args.clientes):011d}" for _ in range(args.buscas)]
+
+    executar(
+        "csv",
+        IndiceClientes(clientes_csv),
+        CsvSolicitacaoStorage(solicitacoes_csv),
+        args,
+        cpfs,
+    )
+    banco = obter_banco_sqlite(banco_path)
+    executar(
+        "sqlite",
+        SqliteClienteStorage(banco),
+        SqliteSolicitacaoStorage(banco),
+        args,
+        cpfs,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Fixtures compartilhadas para testes."""
 
+import shutil
 import tempfile
 from datetime import date
 from pathlib import Path
@@ -11,6 +12,13 @@ from app.models.solicitacao import SolicitacaoCredito, StatusSolicitacao
 from datetime import datetime
 
 
+def _remover_derivados(temp_path: str) -> None:
+    """Remove journal, trava e snapshot colunar gerados ao lado do CSV de clientes."""
+    Path(temp_path).with_suffix(".journal").unlink(missing_ok=True)
+    Path(temp_path).with_suffix(".lock").unlink(missing_ok=True)
+    shutil.rmtree(Path(temp_path).with_suffix(".colunar"), ignore_errors=True)
+
+
 @pytest.fixture
 def cliente_valido():
     """Cliente válido para testes."""
@@ -71,6 +79,7 @@ def temp_csv_clientes():
     yield temp_path
 
     Path(temp_path).unlink(missing_ok=True)
+    _remover_derivados(temp_path)
 
 
 @pytest.fixture
@@ -103,6 +112,8 @@ def temp_csv_solicitacoes():
     yield temp_path
 
     Path(temp_path).unlink(missing_ok=True)
+    Path(temp_path).with_suffix(".lock").unlink(missing_ok=True)
+    shutil.rmtree(Path(temp_path).with_suffix(".particoes"), ignore_errors=True)
 
 
 @pytest.fixture
@@ -115,3 +126,4 @@ def temp_csv_vazio():
     yield temp_path
 
     Path(temp_path).unlink(missing_ok=True)
+    _remover_derivados(temp_path)
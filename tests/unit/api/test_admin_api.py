@@ -202,6 +202,159 @@ class TestListarClientesAPI:
         assert len(data) == 0
 
 
+    @patch("app.api.admin.ClienteService")
+    def test_listar_clientes_paginado(self, mock_service_class):
+        """Deve repassar cursor e filtros e informar o próximo cursor quando a página vem cheia."""
+        mock_service = MagicMock()
+        mock_service.iterar.return_value = iter(
+            [
+                Cliente(
+                    cpf="12345678901",
+                    nome="João Silva",
+                    data_nascimento=date(1990, 1, 1),
+                    score=750,
+                    limite_atual=15000.00,
+                ),
+                Cliente(
+                    cpf="98765432100",
+                    nome="Maria Santos",
+                    data_nascimento=date(1985, 5, 15),
+                    score=750,
+                    limite_atual=15000.00,
+                ),
+            ]
+        )
+        mock_service_class.return_value = mock_service
+
+        response = client.get("/admin/clientes?limit=1&after_cpf=11111111111&score_min=700")
+
+        assert response.status_code == 200
+        assert [c["cpf"] for c in response.json()] == ["12345678901"]
+        assert response.headers["X-Proximo-Cursor"] == "12345678901"
+        mock_service.iterar.assert_called_once_with(
+            "11111111111", 700, None, None, None, None
+        )
+        mock_service.listar_todos.assert_not_called()
+
+    @patch("app.api.admin.ClienteService")
+    def test_listar_clientes_cursor_invalido(self, mock_service_class):
+        """Deve retornar 400 quando o cursor não é um CPF."""
+        for cursor in ("ç", "abc", "١٢٣"):
+            response = client.get("/admin/clientes", params={"after_cpf": cursor})
+
+            assert response.status_code == 400
+            assert "Cursor inválido" in response.json()["detail"]
+        mock_service_class.return_value.iterar.assert_not_called()
+
+    @patch("app.api.admin.ClienteService")
+    def test_listar_clientes_ndjson(self, mock_service_class):
+        """Deve transmitir um cliente por linha no formato NDJSON."""
+        mock_service = MagicMock()
+        mock_service.iterar.return_value = iter(
+            [
+                Cliente(
+                    cpf="12345678901",
+                    nome="João Silva",
+                    data_nascimento=date(1990, 1, 1),
+                    score=750,
+                    limite_atual=15000.00,
+                ),
+            ]
+        )
+        mock_service_class.return_value = mock_service
+
+        response = client.get("/admin/clientes?formato=ndjson&nome_prefixo=jo")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        linhas = response.text.splitlines()
+        assert len(linhas) == 1
+        assert '"cpf":"12345678901"' in linhas[0]
+
+    def test_listar_clientes_limit_invalido(self):
+        """Deve rejeitar limit fora do intervalo permitido."""
+        response = client.get("/admin/clientes?limit=0")
+
+        assert response.status_code == 422
+
+
+class TestEstatisticasClientesAPI:
+    """Testes para GET /admin/clientes/estatisticas."""
+
+    @patch("app.api.admin.ClienteService")
+    def test_estatisticas_com_filtros(self, mock_service_class):
+        """Deve repassar os filtros e retornar os agregados."""
+        mock_service = MagicMock()
+        mock_service.estatisticas.return_value = {
+            "total": 1,
+            "score_medio": 750.0,
+            "score_minimo": 750,
+            "score_maximo": 750,
+            "limite_total": 15000.0,
+            "limite_medio": 15000.0,
+            "limite_minimo": 15000.0,
+            "limite_maximo": 15000.0,
+        }
+        mock_service_class.return_value = mock_service
+
+        response = client.get("/admin/clientes/estatisticas?score_min=700&limite_max=20000")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        mock_service.estatisticas.assert_called_once_with(700, None, None, 20000.0)
+
+    @patch("app.api.admin.ClienteService")
+    def test_estatisticas_carteira_vazia(self, mock_service_class):
+        """Deve retornar total zero quando nenhum cliente atende aos filtros."""
+        mock_service = MagicMock()
+        mock_service.estatisticas.return_value = {"total": 0}
+        mock_service_class.return_value = mock_service
+
+        response = client.get("/admin/clientes/estatisticas")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+        assert response.json()["score_medio"] is None
+
+
+class TestEstatisticasSolicitacoesAPI:
+    """Testes para GET /admin/solicitacoes/stats."""
+
+    @patch("app.api.admin.SolicitacaoService")
+    def test_estatisticas_periodo(self, mock_service_class):
+        """Deve repassar o período e retornar os indicadores."""
+        mock_service = MagicMock()
+        mock_service.estatisticas.return_value = {
+            "total": 2,
+            "por_status": {"aprovado": 1, "rejeitado": 1},
+            "taxa_aprovacao": 0.5,
+            "media_limite_atual": 3500.0,
+            "media_novo_limite_solicitado": 30000.0,
+            "por_faixa_score": [
+                {
+                    "faixa": "700-849",
+                    "score_minimo": 700,
+                    "score_maximo": 849,
+                    "total": 2,
+                    "aprovados": 1,
+                    "rejeitados": 1,
+                    "taxa_aprovacao": 0.5,
+                }
+            ],
+            "distribuicao_limite_atual": {"<1000": 0},
+            "distribuicao_novo_limite_solicitado": {"<1000": 0},
+            "distribuicao_aumento": {"<1.25": 0},
+        }
+        mock_service_class.return_value = mock_service
+
+        response = client.get("/admin/solicitacoes/stats?desde=2026-01-01&ate=2026-01-31")
+
+        assert response.status_code == 200
+        assert response.json()["taxa_aprovacao"] == 0.5
+        assert response.json()["por_faixa_score"][0]["faixa"] == "700-849"
+        mock_service.estatisticas.assert_called_once_with(date(2026, 1, 1), date(2026, 1, 31))
+
+
 class TestListarSolicitacoesAPI:
     """Testes para GET /admin/solicitacoes."""
 
@@ -0,0 +1,50 @@
+"""Testes unitários para as rotas da API de Crédito."""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import CreditoService
+
+client = TestClient(app)
+
+PERFIL = {
+    "renda_mensal": 10000.0,
+    "tipo_emprego": "CLT",
+    "despesas_mensais": 2000.0,
+    "num_dependentes": 0,
+    "dividas_atuais": 0,
+}
+
+
+class TestSimularCreditoAPI:
+    """Testes para POST /credito/simular."""
+
+    def test_simular_retorna_score_faixa_e_limite(self):
+        """Deve retornar score, faixa e limite máximo do perfil."""
+        response = client.post("/credito/simular", json=PERFIL)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "score": 649,
+            "score_minimo": 500,
+            "score_maximo": 699,
+            "limite_maximo": 5000.0,
+        }
+
+    def test_simular_perfil_equivalente_usa_cache(self):
+        """Deve responder perfis equivalentes a partir do cache."""
+        client.post("/credito/simular", json=PERFIL)
+        acertos = CreditoService.estatisticas_simulacao()["acertos"]
+
+        equivalente = {**PERFIL, "tipo_emprego": " formal ", "dividas_atuais": 0.0}
+        response = client.post("/credito/simular", json=equivalente)
+
+        assert response.json()["score"] == 649
+        assert CreditoService.estatisticas_simulacao()["acertos"] == acertos + 1
+
+    def test_simular_tipo_emprego_invalido(self):
+        """Deve retornar 400 para tipo de emprego inválido."""
+        response = client.post("/credito/simular", json={**PERFIL, "tipo_emprego": "estagio"})
+
+        assert response.status_code == 400
+        assert "Tipo de emprego invalido" in response.json()["detail"]
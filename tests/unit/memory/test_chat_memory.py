@@ -0,0 +1,73 @@
+"""Testes unitários para a persistência dos turnos da conversa."""
+
+from pymongo import WriteConcern
+
+from app.config import settings
+from app.memory import ChatMemory, fechar_clientes_mongo
+
+
+class ColecaoFake:
+    """Coleção em memória que registra as chamadas de escrita."""
+
+    def __init__(self):
+        self.chamadas = []
+
+    def insert_one(self, doc):
+        self.chamadas.append(("insert_one", [doc]))
+
+    def insert_many(self, docs, ordered=True):
+        self.chamadas.append(("insert_many", list(docs), ordered))
+
+
+def _memoria() -> tuple[ChatMemory, ColecaoFake]:
+    memoria = ChatMemory("triagem", "conversa-1")
+    colecao = memoria._collection = ColecaoFake()
+    return memoria, colecao
+
+
+class TestChatMemory:
+    """Testes para a gravação das mensagens de um turno."""
+
+    def test_turno_em_uma_escrita(self):
+        """Deve gravar pergunta e resposta, em ordem, com um único insert_many."""
+        memoria, colecao = _memoria()
+
+        memoria.add_turn("Qual meu limite?", "Seu limite é R$ 5.000,00.")
+
+        assert len(colecao.chamadas) == 1
+        metodo, docs, ordered = colecao.chamadas[0]
+        assert (metodo, ordered) == ("insert_many", True)
+        assert [d["message"] for d in docs] == [
+            {"type": "human", "content": "Qual meu limite?"},
+            {"type": "ai", "content": "Seu limite é R$ 5.000,00."},
+        ]
+        assert docs[0]["session_id"] == "triagem:conversa-1"
+
+    def test_erro_ao_salvar_nao_propaga(self):
+        """Falhas do banco devem ser registradas sem interromper a conversa."""
+        memoria, colecao = _memoria()
+
+        def falhar(*args, **kwargs):
+            raise RuntimeError("sem conexão")
+
+        colecao.insert_many = falhar
+        memoria.add_turn("oi", "olá")
+
+    def test_write_concern_configuravel(self, monkeypatch):
+        """Deve aplicar o write concern de settings ou o informado à coleção."""
+        monkeypatch.setattr(settings, "mongo_escrita_w", "majority")
+        monkeypatch.setattr(settings, "mongo_escrita_journal", True)
+        try:
+            padrao = ChatMemory("triagem", "c").collection.write_concern
+            informado = ChatMemory("triagem", "c", WriteConcern(w=0)).collection.write_concern
+        finally:
+            fechar_clientes_mongo()
+
+        assert padrao.document == {"w": "majority", "j": True}
+        assert informado.document == {"w": 0}
+
+    def test_numero_de_nos(self, monkeypatch):
+        """Valores numéricos de MONGO_ESCRITA_W devem ser número de nós."""
+        monkeypatch.setattr(settings, "mongo_escrita_w", "2")
+
+        assert ChatMemory("triagem", "c").write_concern.document == {"w": 2}
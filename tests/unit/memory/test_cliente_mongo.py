@@ -0,0 +1,50 @@
+"""Testes unitários para os clientes MongoDB compartilhados."""
+
+import pytest
+
+from app.config import settings
+from app.memory import ChatMemory, fechar_clientes_mongo, get_memory, obter_cliente_mongo
+
+
+@pytest.fixture(autouse=True)
+def clientes():
+    # O MongoClient não conecta na criação; nenhum teste depende de um servidor.
+    fechar_clientes_mongo()
+    yield
+    fechar_clientes_mongo()
+
+
+class TestClienteMongo:
+    """Testes para o registro de clientes MongoDB."""
+
+    def test_cliente_compartilhado_por_uri(self):
+        """Deve retornar o mesmo cliente para a mesma URI."""
+        assert obter_cliente_mongo() is obter_cliente_mongo(settings.mongo_uri)
+        assert obter_cliente_mongo("mongodb://outro:27017") is not obter_cliente_mongo()
+
+    def test_pool_configurado(self, monkeypatch):
+        """Deve criar o cliente com os limites do pool definidos em settings."""
+        monkeypatch.setattr(settings, "mongo_pool_max", 7)
+        monkeypatch.setattr(settings, "mongo_pool_min", 2)
+
+        opcoes = obter_cliente_mongo().options.pool_options
+
+        assert (opcoes.max_pool_size, opcoes.min_pool_size) == (7, 2)
+
+    def test_fechar_recria_no_proximo_uso(self):
+        """Depois de fechados, um novo cliente deve ser criado sob demanda."""
+        cliente = obter_cliente_mongo()
+        fechar_clientes_mongo()
+
+        assert obter_cliente_mongo() is not cliente
+
+    def test_memorias_usam_cliente_compartilhado(self):
+        """Memórias de sessões e agentes diferentes devem usar o mesmo cliente."""
+        triagem = get_memory("triagem", "conversa-1")
+        credito = ChatMemory("credito", "conversa-2")
+
+        assert triagem.collection.database.client is obter_cliente_mongo()
+        assert credito.collection.database.client is obter_cliente_mongo()
+
+        triagem.close()
+        assert credito.collection.database.client is obter_cliente_mongo()
@@ -0,0 +1,667 @@
+"""Testes unitários para CambioService e o cache de cotações."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.models import Cotacao
+from app.services import http_cambio
+from app.services.atualizador_cotacoes import AtualizadorCotacoes
+from app.services.cache_cotacoes import CacheCotacoes
+from app.services.cambio_service import (
+    MOEDAS_DISPONIVEIS,
+    CambioAPIIndisponivelError,
+    CambioService,
+)
+from app.services.disjuntor import Disjuntor
+from app.storage import HistoricoCotacoes
+
+
+class Relogio:
+    """Relógio controlado manualmente."""
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+def _resposta_serpapi(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"answer_box": {"result": "5,12 Real brasileiro"}})
+
+
+def _cotacao(valor: float, moeda: str = "USD") -> Cotacao:
+    return Cotacao(
+        moeda_origem=moeda, moeda_destino="BRL", valor=valor, data_consulta=datetime.now()
+    )
+
+
+class TestCacheCotacoes:
+    """Testes para CacheCotacoes."""
+
+    def test_serve_do_cache_dentro_do_ttl(self):
+        """Deve buscar uma única vez enquanto a cotação está dentro do TTL."""
+        relogio = Relogio()
+        cache = CacheCotacoes(ttl=60, janela_stale=0, relogio=relogio)
+        chamadas = []
+
+        def buscar():
+            chamadas.append(1)
+            return _cotacao(5.0)
+
+        cache.obter(("USD", "BRL"), buscar)
+        relogio.agora = 59
+        cache.obter(("USD", "BRL"), buscar)
+        relogio.agora = 61
+        cache.obter(("USD", "BRL"), buscar)
+
+        assert len(chamadas) == 2
+
+    def test_stale_while_revalidate(self):
+        """Deve servir a cotação antiga e atualizar uma vez em background."""
+        relogio = Relogio()
+        cache = CacheCotacoes(ttl=60, janela_stale=300, relogio=relogio)
+        cache.obter(("USD", "BRL"), lambda: _cotacao(5.0))
+        liberar = threading.Event()
+        chamadas = []
+
+        def buscar_lento():
+            chamadas.append(1)
+            liberar.wait(5)
+            return _cotacao(5.5)
+
+        relogio.agora = 100
+        assert cache.obter(("USD", "BRL"), buscar_lento).valor == 5.0
+        assert cache.obter(("USD", "BRL"), buscar_lento).valor == 5.0
+        liberar.set()
+        for _ in range(500):
+            if cache.ultima(("USD", "BRL")).valor == 5.5:
+                break
+            time.sleep(0.01)
+
+        assert cache.obter(("USD", "BRL"), buscar_lento).valor == 5.5
+        assert len(chamadas) == 1
+
+    def test_apos_janela_stale_busca_de_novo(self):
+        """Deve esperar uma nova busca quando a cotação passou da janela stale."""
+        relogio = Relogio()
+        cache = CacheCotacoes(ttl=60, janela_stale=300, relogio=relogio)
+        cache.obter(("USD", "BRL"), lambda: _cotacao(5.0))
+
+        relogio.agora = 400
+
+        assert cache.obter(("USD", "BRL"), lambda: _cotacao(6.0)).valor == 6.0
+
+
+
+class TestCacheCotacoesSingleFlight:
+    """Testes para a deduplicação de buscas concorrentes do mesmo par."""
+
+    def test_threads_concorrentes_fazem_uma_busca(self):
+        """Deve fazer uma única busca para várias threads pedindo o mesmo par."""
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+        liberar = threading.Event()
+        chamadas = []
+        resultados = []
+
+        def buscar():
+            chamadas.append(1)
+            liberar.wait(5)
+            return _cotacao(5.0)
+
+        threads = [
+            threading.Thread(
+                target=lambda: resultados.append(cache.obter(("USD", "BRL"), buscar))
+            )
+            for _ in range(20)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        liberar.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(chamadas) == 1
+        assert len(resultados) == 20
+        assert all(r is resultados[0] for r in resultados)
+
+    def test_erro_propagado_e_proxima_chamada_busca_de_novo(self):
+        """Deve entregar o erro a quem espera e não guardar a busca que falhou."""
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+        liberar = threading.Event()
+        erros = []
+
+        def buscar_falha():
+            liberar.wait(5)
+            raise RuntimeError("API fora")
+
+        def consultar():
+            try:
+                cache.obter(("USD", "BRL"), buscar_falha)
+            except RuntimeError as e:
+                erros.append(e)
+
+        threads = [threading.Thread(target=consultar) for _ in range(5)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        liberar.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(erros) == 5
+        assert cache.obter(("USD", "BRL"), lambda: _cotacao(5.0)).valor == 5.0
+
+    @pytest.mark.asyncio
+    async def test_tasks_asyncio_fazem_uma_busca(self):
+        """Deve fazer uma única busca para várias tasks pedindo o mesmo par."""
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+        chamadas = []
+
+        async def buscar():
+            chamadas.append(1)
+            await asyncio.sleep(0.05)
+            return _cotacao(5.0)
+
+        resultados = await asyncio.gather(
+            *(cache.obter_async(("USD", "BRL"), buscar) for _ in range(20))
+        )
+
+        assert len(chamadas) == 1
+        assert all(r is resultados[0] for r in resultados)
+
+    @pytest.mark.asyncio
+    async def test_task_aguarda_busca_iniciada_por_thread(self):
+        """Uma task deve aguardar, sem bloquear o loop, a busca feita por uma thread."""
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+        iniciou = threading.Event()
+        liberar = threading.Event()
+
+        def buscar_sync():
+            iniciou.set()
+            liberar.wait(5)
+            return _cotacao(5.0)
+
+        async def buscar_async():
+            raise AssertionError("não deveria buscar de novo")
+
+        thread = threading.Thread(target=cache.obter, args=(("USD", "BRL"), buscar_sync))
+        thread.start()
+        iniciou.wait(5)
+        espera = asyncio.create_task(cache.obter_async(("USD", "BRL"), buscar_async))
+        await asyncio.sleep(0.01)
+        assert not espera.done()
+
+        liberar.set()
+        assert (await espera).valor == 5.0
+        thread.join(5)
+
+    @pytest.mark.asyncio
+    async def test_cancelar_quem_espera_nao_cancela_a_busca(self):
+        """Cancelar uma task que aguarda não deve afetar a busca compartilhada."""
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+        liberar = asyncio.Event()
+
+        async def buscar():
+            await liberar.wait()
+            return _cotacao(5.0)
+
+        lider = asyncio.create_task(cache.obter_async(("USD", "BRL"), buscar))
+        await asyncio.sleep(0)
+        seguidor = asyncio.create_task(cache.obter_async(("USD", "BRL"), buscar))
+        await asyncio.sleep(0)
+        seguidor.cancel()
+        liberar.set()
+
+        assert (await lider).valor == 5.0
+        with pytest.raises(asyncio.CancelledError):
+            await seguidor
+
+    @pytest.mark.asyncio
+    async def test_chamada_sincrona_no_loop_nao_espera_o_lider(self):
+        """Uma chamada síncrona no loop não deve bloquear esperando a busca assíncrona."""
+        relogio = Relogio()
+        cache = CacheCotacoes(ttl=60, janela_stale=0, relogio=relogio)
+        cache.obter(("USD", "BRL"), lambda: _cotacao(4.0))
+        relogio.agora += 61
+        liberar = asyncio.Event()
+
+        async def buscar():
+            await liberar.wait()
+            return _cotacao(5.0)
+
+        lider = asyncio.create_task(cache.atualizar_async(("USD", "BRL"), buscar))
+        await asyncio.sleep(0)
+
+        # Expirada e com a busca em andamento: recebe a última cotação, marcada.
+        ultima = cache.obter(("USD", "BRL"), lambda: _cotacao(6.0))
+        assert (ultima.valor, ultima.desatualizada) == (4.0, True)
+
+        # Sem cotação conhecida, faz a própria busca em vez de esperar.
+        lider_eur = asyncio.create_task(cache.atualizar_async(("EUR", "BRL"), buscar))
+        await asyncio.sleep(0)
+        assert cache.obter(("EUR", "BRL"), lambda: _cotacao(6.0, "EUR")).valor == 6.0
+
+        liberar.set()
+        assert (await lider).valor == 5.0
+        await lider_eur
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("falhar", [False, True])
+    async def test_lider_cancelado(self, falhar):
+        """Quem espera uma busca cancelada deve tentar de novo, sem receber CancelledError."""
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+
+        async def buscar_lider():
+            await asyncio.Event().wait()
+
+        async def buscar_seguidor():
+            if falhar:
+                raise CambioAPIIndisponivelError("indisponível")
+            return _cotacao(5.0)
+
+        lider = asyncio.create_task(cache.obter_async(("USD", "BRL"), buscar_lider))
+        await asyncio.sleep(0)
+        seguidor = asyncio.create_task(cache.obter_async(("USD", "BRL"), buscar_seguidor))
+        await asyncio.sleep(0)
+        lider.cancel()
+
+        if falhar:
+            with pytest.raises(CambioAPIIndisponivelError):
+                await seguidor
+        else:
+            assert (await seguidor).valor == 5.0
+        with pytest.raises(asyncio.CancelledError):
+            await lider
+
+class TestCambioServiceCache:
+    """Testes para o uso do cache por CambioService."""
+
+    def test_obter_cotacao_usa_cache_por_par(self):
+        """Deve consultar a API uma vez por par e normalizar os códigos."""
+        service = CambioService(cache=CacheCotacoes(ttl=60, janela_stale=0))
+
+        with patch.object(
+            CambioService, "_buscar_cotacao", side_effect=lambda o, d: _cotacao(5.0, o)
+        ) as buscar:
+            service.obter_cotacao_sync("usd", "brl")
+            service.obter_cotacao_sync("USD", "BRL")
+            service.obter_cotacao_sync("EUR", "BRL")
+
+        assert [c.args for c in buscar.call_args_list] == [("USD", "BRL"), ("EUR", "BRL")]
+
+
+class TestCambioServiceHTTP:
+    """Testes para as consultas HTTP sobre os clientes compartilhados."""
+
+    def test_obter_cotacao_sync_reaproveita_cliente(self):
+        """Deve fazer as consultas pelo mesmo cliente, sem abrir um novo por chamada."""
+        requisicoes = []
+
+        def responder(request):
+            requisicoes.append(request)
+            return _resposta_serpapi(request)
+
+        cliente = httpx.Client(transport=httpx.MockTransport(responder))
+        service = CambioService(cache=CacheCotacoes(ttl=0, janela_stale=0), cliente=cliente)
+
+        assert service.obter_cotacao_sync("USD", "BRL").valor == 5.12
+        assert service.obter_cotacao_sync("EUR", "BRL").valor == 5.12
+
+        assert [r.url.params["q"] for r in requisicoes] == ["1 USD to BRL", "1 EUR to BRL"]
+        assert not cliente.is_closed
+
+    @pytest.mark.asyncio
+    async def test_obter_cotacao_async(self):
+        """Deve consultar pelo cliente assíncrono e guardar no cache."""
+        cliente_async = httpx.AsyncClient(transport=httpx.MockTransport(_resposta_serpapi))
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+        service = CambioService(cache=cache, cliente_async=cliente_async)
+
+        cotacao = await service.obter_cotacao("usd", "brl")
+
+        assert (cotacao.moeda_origem, cotacao.valor) == ("USD", 5.12)
+        assert cache.ultima(("USD", "BRL")) is cotacao
+        await cliente_async.aclose()
+
+    @pytest.mark.asyncio
+    async def test_erro_http_async(self):
+        """Deve converter erros HTTP em CambioAPIIndisponivelError."""
+        cliente_async = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        service = CambioService(
+            cache=CacheCotacoes(ttl=60, janela_stale=0),
+            cliente_async=cliente_async,
+            disjuntor=Disjuntor(),
+        )
+
+        with pytest.raises(CambioAPIIndisponivelError):
+            await service.obter_cotacao("USD", "BRL")
+        await cliente_async.aclose()
+
+    @pytest.mark.asyncio
+    async def test_clientes_compartilhados_e_fechamento(self):
+        """Deve reutilizar os clientes compartilhados e recriá-los após o fechamento."""
+        http_cambio.abrir_clientes_http()
+        cliente = http_cambio.obter_cliente_http()
+        assert http_cambio.obter_cliente_http() is cliente
+
+        await http_cambio.fechar_clientes_http()
+
+        assert cliente.is_closed
+        novo = http_cambio.obter_cliente_http()
+        assert novo is not cliente
+        await http_cambio.fechar_clientes_http()
+
+
+class TestCambioServiceLote:
+    """Testes para a consulta de várias moedas e as cotações cruzadas."""
+
+    VALORES = {"USD": 5.0, "EUR": 6.0, "GBP": 7.5}
+
+    def _buscar(self, origem, destino):
+        if origem not in self.VALORES:
+            raise CambioAPIIndisponivelError("indisponível")
+        return _cotacao(self.VALORES[origem], origem)
+
+    def test_lote_em_brl(self):
+        """Deve retornar cada moeda em BRL, omitindo as indisponíveis."""
+        service = CambioService(cache=CacheCotacoes(ttl=60, janela_stale=0))
+
+        with patch.object(CambioService, "_buscar_cotacao", side_effect=self._buscar):
+            cotacoes = service.obter_cotacoes_sync(["usd", "EUR", "USD", "XYZ"])
+
+        assert {codigo: c.valor for codigo, c in cotacoes.items()} == {"USD": 5.0, "EUR": 6.0}
+
+    def test_cotacao_cruzada_via_brl(self):
+        """Deve derivar EUR→GBP de EUR→BRL e GBP→BRL, sem consultar o par cruzado."""
+        service = CambioService(cache=CacheCotacoes(ttl=60, janela_stale=0))
+
+        with patch.object(
+            CambioService, "_buscar_cotacao", side_effect=self._buscar
+        ) as buscar:
+            cotacoes = service.obter_cotacoes_sync(["EUR", "BRL", "GBP"], "gbp")
+
+        assert {par.args for par in buscar.call_args_list} == {("EUR", "BRL"), ("GBP", "BRL")}
+        assert cotacoes["EUR"].moeda_destino == "GBP"
+        assert cotacoes["EUR"].valor == pytest.approx(0.8)
+        assert cotacoes["BRL"].valor == pytest.approx(1 / 7.5)
+        assert "GBP" not in cotacoes
+
+    def test_paralelismo_limitado(self):
+        """Não deve ter mais buscas simultâneas que CAMBIO_LOTE_PARALELISMO."""
+        service = CambioService(cache=CacheCotacoes(ttl=60, janela_stale=0))
+        ativas = []
+        maximo = []
+        lock = threading.Lock()
+
+        def buscar(origem, destino):
+            with lock:
+                ativas.append(origem)
+                maximo.append(len(ativas))
+            time.sleep(0.02)
+            with lock:
+                ativas.remove(origem)
+            return _cotacao(1.0, origem)
+
+        moedas = ["USD", "EUR", "GBP", "ARS", "CAD", "AUD", "JPY", "CHF", "CNY", "BTC"]
+        with (
+            patch("app.services.cambio_service.settings.cambio_lote_paralelismo", 3),
+            patch.object(CambioService, "_buscar_cotacao", side_effect=buscar),
+        ):
+            cotacoes = service.obter_cotacoes_sync(moedas)
+
+        assert len(cotacoes) == 10
+        assert max(maximo) <= 3
+
+    @pytest.mark.asyncio
+    async def test_lote_async(self):
+        """A versão assíncrona deve consultar os pares X→BRL e cruzar as cotações."""
+        service = CambioService(cache=CacheCotacoes(ttl=60, janela_stale=0))
+
+        async def buscar(origem, destino):
+            return self._buscar(origem, destino)
+
+        with patch.object(CambioService, "_buscar_cotacao_async", side_effect=buscar):
+            cotacoes = await service.obter_cotacoes(["USD", "EUR"], "EUR")
+
+        assert list(cotacoes) == ["USD"]
+        assert cotacoes["USD"].valor == pytest.approx(5.0 / 6.0)
+
+
+class TestAtualizadorCotacoes:
+    """Testes para a atualização periódica das cotações."""
+
+    @pytest.mark.asyncio
+    async def test_ciclo_aquece_cache_e_registra_historico(self, tmp_path):
+        """Deve buscar as moedas mesmo em cache, guardá-las e registrá-las no histórico."""
+        cache = CacheCotacoes(ttl=60, janela_stale=0)
+        cache.obter(("USD", "BRL"), lambda: _cotacao(4.0))
+        service = CambioService(cache=cache)
+        historico = HistoricoCotacoes(tmp_path / "cotacoes.db")
+        atualizador = AtualizadorCotacoes(service, historico, moedas=["USD", "EUR", "XYZ"])
+
+        async def buscar(origem, destino):
+            if origem == "XYZ":
+                raise CambioAPIIndisponivelError("indisponível")
+            return _cotacao(5.0, origem)
+
+        with patch.object(CambioService, "_buscar_cotacao_async", side_effect=buscar):
+            cotacoes = await atualizador.executar_ciclo()
+
+        assert sorted(c.moeda_origem for c in cotacoes) == ["EUR", "USD"]
+        assert cache.ultima(("USD", "BRL")).valor == 5.0
+        assert [c.valor for c in historico.ultimas("EUR")] == [5.0]
+
+    @pytest.mark.asyncio
+    async def test_iniciar_e_parar(self, tmp_path):
+        """Deve executar ciclos periodicamente até ser parado."""
+        historico = HistoricoCotacoes(tmp_path / "cotacoes.db")
+        atualizador = AtualizadorCotacoes(
+            CambioService(cache=CacheCotacoes(ttl=0, janela_stale=0)),
+            historico,
+            moedas=["USD"],
+            intervalo=0.01,
+        )
+        ciclos = []
+
+        async def buscar(origem, destino):
+            ciclos.append(1)
+            return _cotacao(5.0 + len(ciclos), origem)
+
+        with patch.object(CambioService, "_buscar_cotacao_async", side_effect=buscar):
+            atualizador.iniciar()
+            for _ in range(200):
+                if len(ciclos) >= 3:
+                    break
+                await asyncio.sleep(0.01)
+            await atualizador.parar()
+
+        assert len(ciclos) >= 3
+        assert len(historico.ultimas("USD", n=10)) >= 2
+
+
+    @pytest.mark.asyncio
+    async def test_sem_moedas_atualiza_so_pares_consultados(self, tmp_path):
+        """Sem moedas fixas, deve atualizar só os pares X→BRL consultados na janela."""
+        relogio = Relogio()
+        cache = CacheCotacoes(ttl=60, janela_stale=0, relogio=relogio)
+        service = CambioService(cache=cache)
+        atualizador = AtualizadorCotacoes(
+            service, HistoricoCotacoes(tmp_path / "cotacoes.db"), janela=600, moedas_base=[]
+        )
+
+        async def buscar(origem, destino):
+            return _cotacao(5.0, origem)
+
+        with patch.object(
+            CambioService, "_buscar_cotacao_async", side_effect=buscar
+        ) as buscar_mock:
+            assert await atualizador.executar_ciclo() == []
+            buscar_mock.assert_not_called()
+
+            cache.obter(("USD", "BRL"), lambda: _cotacao(4.0))
+            cache.obter(("EUR", "USD"), lambda: _cotacao(1.1, "EUR"))
+            assert atualizador.moedas_do_ciclo() == ["USD"]
+            await atualizador.executar_ciclo()
+            assert buscar_mock.call_count == 1
+
+            relogio.agora += 601
+            assert atualizador.moedas_do_ciclo() == []
+
+    @pytest.mark.asyncio
+    async def test_moedas_base_atualizadas_apos_periodo_ocioso(self, tmp_path):
+        """Sem consultas na janela, deve continuar atualizando as moedas base."""
+        relogio = Relogio()
+        cache = CacheCotacoes(ttl=60, janela_stale=0, relogio=relogio)
+        service = CambioService(cache=cache)
+        atualizador = AtualizadorCotacoes(
+            service,
+            HistoricoCotacoes(tmp_path / "cotacoes.db"),
+            janela=600,
+            moedas_base=["USD", "EUR"],
+        )
+
+        async def buscar(origem, destino):
+            return _cotacao(5.0, origem)
+
+        cache.obter(("GBP", "BRL"), lambda: _cotacao(7.0, "GBP"))
+        assert atualizador.moedas_do_ciclo() == ["EUR", "GBP", "USD"]
+
+        relogio.agora += 601
+        assert atualizador.moedas_do_ciclo() == ["EUR", "USD"]
+        with patch.object(CambioService, "_buscar_cotacao_async", side_effect=buscar):
+            cotacoes = await atualizador.executar_ciclo()
+
+        assert sorted(c.moeda_origem for c in cotacoes) == ["EUR", "USD"]
+        assert cache.ultima(("USD", "BRL")).valor == 5.0
+
+    def test_moedas_base_padrao_sao_as_oferecidas(self, tmp_path):
+        """Sem configuração, as moedas base devem ser as oferecidas pelo agente."""
+        atualizador = AtualizadorCotacoes(
+            CambioService(cache=CacheCotacoes()), HistoricoCotacoes(tmp_path / "cotacoes.db")
+        )
+        assert atualizador.moedas_do_ciclo() == sorted(MOEDAS_DISPONIVEIS)
+
+    @pytest.mark.asyncio
+    async def test_um_processo_atualiza_por_vez(self, tmp_path):
+        """Só o atualizador que obtém a trava do histórico deve executar ciclos."""
+        historico = HistoricoCotacoes(tmp_path / "cotacoes.db")
+        ciclos = []
+
+        def criar(nome):
+            atualizador = AtualizadorCotacoes(
+                CambioService(cache=CacheCotacoes(ttl=0, janela_stale=0)),
+                historico,
+                moedas=["USD"],
+                intervalo=0.01,
+            )
+
+            async def ciclo():
+                ciclos.append(nome)
+                return []
+
+            atualizador.executar_ciclo = ciclo
+            return atualizador
+
+        primeiro, segundo = criar("primeiro"), criar("segundo")
+        primeiro.iniciar()
+        await asyncio.sleep(0.02)
+        segundo.iniciar()
+        await asyncio.sleep(0.05)
+        assert set(ciclos) == {"primeiro"}
+        await primeiro.parar()
+
+        # Com a trava liberada, o outro assume.
+        ciclos.clear()
+        await asyncio.sleep(0.05)
+        await segundo.parar()
+        assert ciclos and set(ciclos) == {"segundo"}
+
+
+class TestCambioServiceDisjuntor:
+    """Testes para o disjuntor da API e o uso da última cotação conhecida."""
+
+    def _service(self, responder, relogio=None):
+        relogio = relogio or Relogio()
+        cliente = httpx.Client(transport=httpx.MockTransport(responder))
+        return CambioService(
+            cache=CacheCotacoes(ttl=60, janela_stale=0, relogio=relogio),
+            cliente=cliente,
+            disjuntor=Disjuntor(falhas_para_abrir=2, tempo_aberto=30, relogio=relogio),
+        )
+
+    def test_falha_rapido_com_disjuntor_aberto(self):
+        """Com o disjuntor aberto, não deve chamar a API."""
+        chamadas = []
+
+        def responder(request):
+            chamadas.append(request)
+            return httpx.Response(503)
+
+        service = self._service(responder)
+        for _ in range(2):
+            with pytest.raises(CambioAPIIndisponivelError):
+                service.obter_cotacao_sync("USD", "BRL")
+        assert service.disjuntor.estado == Disjuntor.ABERTO
+
+        with pytest.raises(CambioAPIIndisponivelError):
+            service.obter_cotacao_sync("EUR", "BRL")
+
+        assert len(chamadas) == 2
+
+    def test_usa_ultima_cotacao_conhecida_marcada(self):
+        """Deve responder com a última cotação do par, marcada como desatualizada."""
+        fora_do_ar = []
+
+        def responder(request):
+            return httpx.Response(503) if fora_do_ar else _resposta_serpapi(request)
+
+        relogio = Relogio()
+        service = self._service(responder, relogio)
+        assert service.obter_cotacao_sync("USD", "BRL").desatualizada is False
+
+        fora_do_ar.append(True)
+        relogio.agora = 3600
+        cotacao = service.obter_cotacao_sync("USD", "BRL")
+
+        assert (cotacao.valor, cotacao.desatualizada) == (5.12, True)
+        assert service.cache.ultima(("USD", "BRL")).desatualizada is False
+
+    def test_teste_meio_aberto_fecha_o_disjuntor(self):
+        """Um teste bem-sucedido após o tempo aberto deve fechar o disjuntor."""
+        fora_do_ar = [True]
+
+        def responder(request):
+            return httpx.Response(503) if fora_do_ar else _resposta_serpapi(request)
+
+        relogio = Relogio()
+        service = self._service(responder, relogio)
+        for _ in range(2):
+            with pytest.raises(CambioAPIIndisponivelError):
+                service.obter_cotacao_sync("USD", "BRL")
+
+        fora_do_ar.clear()
+        relogio.agora = 30
+
+        assert service.obter_cotacao_sync("USD", "BRL").valor == 5.12
+        assert service.disjuntor.estado == Disjuntor.FECHADO
+
+    def test_cotacao_cruzada_herda_marcador(self):
+        """A cotação cruzada deve ser desatualizada se uma das pontas for."""
+        em_brl = {
+            "EUR": _cotacao(6.0, "EUR").model_copy(update={"desatualizada": True}),
+            "GBP": _cotacao(7.5, "GBP"),
+        }
+
+        cotacoes = CambioService._montar_lote(["EUR"], "GBP", em_brl)
+
+        assert cotacoes["EUR"].desatualizada is True
@@ -0,0 +1,60 @@
+"""Testes unitários para CreditoService."""
+
+import pytest
+
+from app.services import CreditoService
+from app.services.credito_service import SimulacaoInvalidaError
+from app.services.score_service import ScoreService, TipoEmprego
+
+
+class TestCreditoServiceSimular:
+    """Testes para a simulação de score e limite."""
+
+    def test_simular_nao_grava_solicitacao(self, temp_csv_score_limite, tmp_path):
+        """Deve calcular score e limite sem registrar nada."""
+        solicitacoes = tmp_path / "solicitacoes.csv"
+        service = CreditoService(str(solicitacoes), temp_csv_score_limite)
+
+        simulacao = service.simular(25000.0, "CLT", 8000.0, 2, 0)
+
+        assert simulacao["score"] == 553
+        assert simulacao["limite_maximo"] == 5000.0
+        assert not solicitacoes.exists()
+
+    def test_normalizar_perfil(self):
+        """Deve reduzir perfis equivalentes à mesma chave."""
+        chave = CreditoService.normalizar_perfil(5000.001, "pj", 1500.0, 5, 300.0)
+
+        assert chave == (5000.0, TipoEmprego.AUTONOMO, 1500.0, 3, True)
+        assert CreditoService.normalizar_perfil(5000.0, " PJ ", 1500.0, 3, 1.0) == chave
+
+    @pytest.mark.parametrize(
+        "perfil",
+        [
+            (0.0, "CLT", 100.0, 0, 0.0),
+            (5000.0, "CLT", -1.0, 0, 0.0),
+            (5000.0, "estagio", 100.0, 0, 0.0),
+            (5000.0, "CLT", 100.0, -1, 0.0),
+        ],
+    )
+    def test_perfil_invalido(self, perfil):
+        """Deve rejeitar renda, despesas, emprego ou dependentes inválidos."""
+        with pytest.raises(SimulacaoInvalidaError):
+            CreditoService.normalizar_perfil(*perfil)
+
+    def test_calcular_score_usa_valores_informados(self, temp_csv_score_limite, tmp_path):
+        """O score gravado deve vir dos valores brutos, sem arredondar nem limitar dependentes."""
+        service = CreditoService(str(tmp_path / "solicitacoes.csv"), temp_csv_score_limite)
+        score_service = ScoreService()
+
+        score = service.calcular_score(5000.004, "CLT", 1500.006, 5, 0.0)
+
+        assert score == score_service.calcular_score(
+            renda_mensal=5000.004,
+            tipo_emprego=TipoEmprego.FORMAL,
+            despesas_fixas=1500.006,
+            num_dependentes=5,
+            tem_dividas=False,
+        )
+        with pytest.raises(SimulacaoInvalidaError):
+            service.calcular_score(5000.0, "estagio", 100.0, 0, 0.0)
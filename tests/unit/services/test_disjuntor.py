@@ -0,0 +1,71 @@
+"""Testes unitários para o disjuntor."""
+
+from app.services.disjuntor import Disjuntor, obter_disjuntor
+
+
+class Relogio:
+    """Relógio controlado manualmente."""
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+class TestDisjuntor:
+    """Testes para as transições de estado do disjuntor."""
+
+    def test_abre_apos_falhas_consecutivas(self):
+        """Deve abrir só após K falhas seguidas e recusar chamadas enquanto aberto."""
+        disjuntor = Disjuntor(falhas_para_abrir=3, tempo_aberto=30, relogio=Relogio())
+
+        disjuntor.registrar_falha()
+        disjuntor.registrar_falha()
+        disjuntor.registrar_sucesso()
+        disjuntor.registrar_falha()
+        disjuntor.registrar_falha()
+        assert disjuntor.estado == Disjuntor.FECHADO
+
+        disjuntor.registrar_falha()
+
+        assert disjuntor.estado == Disjuntor.ABERTO
+        assert disjuntor.permitir() is False
+
+    def test_meio_aberto_libera_uma_chamada_de_teste(self):
+        """Após o tempo aberto, deve liberar um único teste e fechar se ele funcionar."""
+        relogio = Relogio()
+        disjuntor = Disjuntor(falhas_para_abrir=1, tempo_aberto=30, relogio=relogio)
+        disjuntor.registrar_falha()
+
+        relogio.agora = 30
+        assert disjuntor.permitir() is True
+        assert disjuntor.estado == Disjuntor.MEIO_ABERTO
+        assert disjuntor.permitir() is False
+
+        disjuntor.registrar_sucesso()
+
+        assert disjuntor.estado == Disjuntor.FECHADO
+        assert disjuntor.permitir() is True
+
+    def test_falha_no_teste_reabre(self):
+        """Deve voltar a abrir, por mais um período, se o teste falhar."""
+        relogio = Relogio()
+        disjuntor = Disjuntor(falhas_para_abrir=5, tempo_aberto=30, relogio=relogio)
+        for _ in range(5):
+            disjuntor.registrar_falha()
+
+        relogio.agora = 31
+        assert disjuntor.permitir() is True
+        disjuntor.registrar_falha()
+
+        assert disjuntor.estado == Disjuntor.ABERTO
+        relogio.agora = 60
+        assert disjuntor.permitir() is False
+        relogio.agora = 61
+        assert disjuntor.permitir() is True
+
+    def test_disjuntor_compartilhado_por_nome(self):
+        """Deve retornar o mesmo disjuntor para o mesmo serviço."""
+        assert obter_disjuntor("teste") is obter_disjuntor("teste")
+        assert obter_disjuntor("teste") is not obter_disjuntor("outro")
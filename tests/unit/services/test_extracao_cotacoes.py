@@ -0,0 +1,100 @@
+"""Testes unitários para a extração de cotações das respostas dos provedores."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.extracao_cotacoes import converter_numero, numero_do_campo, numero_no_texto
+from app.services.provedores_cambio import SerpApiProvedor
+
+GRAVACOES = Path(__file__).parents[3] / "benchmarks" / "dados" / "serpapi_cotacoes.json"
+
+
+class TestConverterNumero:
+    """Testes para a conversão de números conforme o locale."""
+
+    @pytest.mark.parametrize(
+        "texto,decimal,esperado",
+        [
+            ("5,43", ",", 5.43),
+            ("5.123,45", ",", 5123.45),
+            ("5,123.45", ",", 5123.45),
+            ("1.234", ",", 1234.0),
+            ("1.234.567", ",", 1234567.0),
+            ("0.185", ",", 0.185),
+            ("0,0046", ",", 0.0046),
+            ("620 123,45", ",", 620123.45),
+            ("1,234", ".", 1234.0),
+            ("5,43", ".", 5.43),
+            ("12345,6", ",", 12345.6),
+        ],
+    )
+    def test_formatos(self, texto, decimal, esperado):
+        """Deve interpretar separadores de milhar e decimal pelo locale."""
+        assert converter_numero(texto, decimal) == pytest.approx(esperado)
+
+    @pytest.mark.parametrize("texto", ["abc", "", "1.2.3", "1.234,5.6"])
+    def test_invalidos(self, texto):
+        """Deve retornar None para textos que não são números."""
+        assert converter_numero(texto) is None
+
+
+class TestNumeroNoTexto:
+    """Testes para a extração de números de textos livres."""
+
+    def test_numero_apos_igualdade(self):
+        """Deve preferir o número após "igual a" ou "=" ao primeiro número."""
+        assert numero_no_texto("1 Euro igual a 6,32 Real brasileiro") == 6.32
+        assert numero_no_texto("1 ARS = 0,0046 BRL") == 0.0046
+
+    def test_primeiro_numero(self):
+        """Sem igualdade, deve usar o primeiro número do texto."""
+        assert numero_no_texto("620.123,45 Real brasileiro") == 620123.45
+        assert numero_no_texto("sem cotação") is None
+
+    def test_campos(self):
+        """Deve aceitar números e textos, ignorando booleanos e não finitos."""
+        assert numero_do_campo(5) == 5.0
+        assert numero_do_campo("7,28") == 7.28
+        assert numero_do_campo(True) is None
+        assert numero_do_campo(float("nan")) is None
+        assert numero_do_campo(None) is None
+
+
+class TestSerpApiProvedor:
+    """Testes para a interpretação das respostas da SerpAPI."""
+
+    def test_prefere_campo_estruturado(self):
+        """Deve usar o campo numérico antes do texto e registrar o ramo."""
+        provedor = SerpApiProvedor()
+        dados = {
+            "answer_box": {"extracted_value": 5.1234, "result": "5,12 Real brasileiro"},
+            "organic_results": [{"snippet": "Dólar hoje: 5,20"}],
+        }
+
+        assert provedor.extrair_cotacao(dados) == 5.1234
+        assert provedor.ramos == {"answer_box.extracted_value": 1}
+
+    def test_recorre_aos_textos(self):
+        """Deve recorrer ao knowledge graph e aos snippets sem valor no answer box."""
+        provedor = SerpApiProvedor()
+
+        extracao = provedor.interpretar(
+            {"answer_box": {"result": "indisponível"}, "organic_results": [{"snippet": "= 0,19"}]}
+        )
+
+        assert extracao == (0.19, "organic_results.0.snippet")
+        assert provedor.interpretar({}) == (None, None)
+
+    def test_gravacoes_do_replay(self):
+        """Deve extrair os valores das respostas gravadas em formato pt-BR."""
+        provedor = SerpApiProvedor()
+        gravacoes = json.loads(GRAVACOES.read_text(encoding="utf-8"))
+
+        valores = {q: provedor.interpretar(dados).valor for q, dados in gravacoes.items()}
+
+        assert valores["1 BTC to BRL"] == pytest.approx(620123.45)
+        assert valores["1 ARS to BRL"] == pytest.approx(0.0046)
+        assert valores["1 CNY to BRL"] == pytest.approx(0.7562)
+        assert all(valores.values())
@@ -0,0 +1,125 @@
+"""Testes unitários para a tabela de faixas de score."""
+
+import logging
+import os
+
+import numpy as np
+import pytest
+
+from app.services.faixas_score import (
+    FaixasScoreInvalidasError,
+    TabelaFaixasScore,
+    obter_tabela_faixas_score,
+)
+
+CABECALHO = "score_minimo,score_maximo,limite_maximo\n"
+FAIXAS = "0,299,500.00\n300,499,2000.00\n500,699,5000.00\n700,1000,20000.00\n"
+
+
+def _escrever(path, conteudo, mtime_ns=None):
+    path.write_text(CABECALHO + conteudo, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestTabelaFaixasScoreConsulta:
+    """Testes para a busca da faixa de um score."""
+
+    def test_limite_nas_bordas_das_faixas(self, tmp_path):
+        """Deve retornar o limite da faixa que contém o score, inclusive nas bordas."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, FAIXAS)
+        tabela = TabelaFaixasScore(path)
+
+        assert tabela.limite_maximo(0) == 500.0
+        assert tabela.limite_maximo(299) == 500.0
+        assert tabela.limite_maximo(300) == 2000.0
+        assert tabela.limite_maximo(1000) == 20000.0
+        assert tabela.faixa(650) == (500, 699, 5000.0)
+
+    def test_score_fora_da_tabela(self, tmp_path):
+        """Deve retornar 0.0 para scores fora das faixas."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, FAIXAS)
+        tabela = TabelaFaixasScore(path)
+
+        assert tabela.limite_maximo(-1) == 0.0
+        assert tabela.limite_maximo(1001) == 0.0
+        assert tabela.faixa(1001) is None
+
+    def test_arquivo_inexistente(self, tmp_path):
+        """Deve se comportar como tabela vazia quando o arquivo não existe."""
+        tabela = TabelaFaixasScore(tmp_path / "inexistente.csv")
+
+        assert tabela.faixas() == []
+        assert tabela.limite_maximo(500) == 0.0
+        assert tabela.limites_para([1, 2]).tolist() == [0.0, 0.0]
+
+    def test_faixas_fora_de_ordem_no_arquivo(self, tmp_path):
+        """Deve ordenar as faixas pelo score mínimo."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, "300,1000,2000.00\n0,299,500.00\n")
+
+        assert TabelaFaixasScore(path).faixas() == [(0, 299, 500.0), (300, 1000, 2000.0)]
+
+    def test_limites_para_igual_ao_escalar(self, tmp_path):
+        """A versão vetorizada deve coincidir com a busca escalar."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, FAIXAS)
+        tabela = TabelaFaixasScore(path)
+        scores = np.arange(-5, 1010)
+
+        esperado = [tabela.limite_maximo(int(s)) for s in scores]
+        assert tabela.limites_para(scores).tolist() == esperado
+
+    def test_tabela_compartilhada_por_caminho(self, tmp_path):
+        """Deve retornar a mesma tabela para o mesmo arquivo."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, FAIXAS)
+
+        assert obter_tabela_faixas_score(path) is obter_tabela_faixas_score(str(path))
+
+
+class TestTabelaFaixasScoreValidacao:
+    """Testes para a validação e a recarga das faixas."""
+
+    @pytest.mark.parametrize(
+        "conteudo",
+        [
+            "0,299,500.00\n250,1000,2000.00\n",
+            "0,299,500.00\n400,1000,2000.00\n",
+            "0,299,500.00\n700,300,2000.00\n",
+        ],
+        ids=["sobreposicao", "lacuna", "minimo_maior"],
+    )
+    def test_faixas_invalidas(self, tmp_path, conteudo):
+        """Deve rejeitar faixas sobrepostas, com lacunas ou invertidas."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, conteudo)
+
+        with pytest.raises(FaixasScoreInvalidasError):
+            TabelaFaixasScore(path).limite_maximo(100)
+
+    def test_recarrega_quando_arquivo_muda(self, tmp_path):
+        """Deve recarregar a tabela quando o arquivo é alterado."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, FAIXAS, mtime_ns=1_000_000_000)
+        tabela = TabelaFaixasScore(path)
+        assert tabela.limite_maximo(800) == 20000.0
+
+        _escrever(path, "0,499,1000.00\n500,1000,30000.00\n", mtime_ns=2_000_000_000)
+
+        assert tabela.limite_maximo(800) == 30000.0
+
+    def test_recarga_invalida_mantem_tabela_anterior(self, tmp_path, caplog):
+        """Deve manter a última tabela válida se a recarga encontrar erros."""
+        path = tmp_path / "score_limite.csv"
+        _escrever(path, FAIXAS, mtime_ns=1_000_000_000)
+        tabela = TabelaFaixasScore(path)
+        assert tabela.limite_maximo(800) == 20000.0
+
+        _escrever(path, "0,299,500.00\n250,1000,2000.00\n", mtime_ns=2_000_000_000)
+        with caplog.at_level(logging.ERROR):
+            assert tabela.limite_maximo(800) == 20000.0
+
+        assert "inválida" in caplog.text
@@ -0,0 +1,85 @@
+"""Testes unitários para o recálculo de scores da carteira."""
+
+from app.services import ClienteService
+from app.services.recalculo_carteira import main, recalcular_carteira
+
+PERFIS = (
+    "cpf,renda_mensal,tipo_emprego,despesas_mensais,num_dependentes,dividas_atuais\n"
+    "987.654.321-00,10000.00,CLT,2000.00,0,0\n"
+    "12345678901,10000.00,formal,2000.00,0,0\n"
+    "11122233344,10000.00,FORMAL,2000.00,0,0\n"
+    "98765432100,10000.00,estagiario,2000.00,0,0\n"
+    "98765432100,0,FORMAL,2000.00,0,0\n"
+)
+
+
+class TestRecalcularCarteira:
+    """Testes para recalcular_carteira."""
+
+    def test_atualiza_apenas_scores_que_nao_pioram(
+        self, tmp_path, temp_csv_clientes, temp_csv_score_limite
+    ):
+        """Deve atualizar quem melhora e manter quem teria score ou limite menor."""
+        perfis = tmp_path / "perfis.csv"
+        perfis.write_text(PERFIS, encoding="utf-8")
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+
+        resultado = recalcular_carteira(perfis, service)
+
+        assert resultado["lidos"] == 5
+        assert resultado["atualizados"] == 1
+        assert resultado["mantidos"] == 1
+        assert resultado["nao_encontrados"] == 1
+        assert resultado["invalidos"] == 2
+        assert service.buscar_por_cpf("98765432100").score == 649
+        assert service.buscar_por_cpf("12345678901").score == 750
+
+    def test_nao_reduz_score_alterado_apos_a_leitura(
+        self, tmp_path, temp_csv_clientes, temp_csv_score_limite
+    ):
+        """Um score aumentado entre a leitura do snapshot e a escrita deve ser mantido."""
+        perfis = tmp_path / "perfis.csv"
+        perfis.write_text(PERFIS, encoding="utf-8")
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        snapshot_colunar = service.snapshot_colunar
+
+        def snapshot_e_aumento():
+            snapshot = snapshot_colunar()
+            service.atualizar_score("98765432100", 700)
+            return snapshot
+
+        service.snapshot_colunar = snapshot_e_aumento
+        resultado = recalcular_carteira(perfis, service)
+
+        assert resultado["atualizados"] == 0
+        assert service.buscar_por_cpf("98765432100").score == 700
+
+    def test_processa_em_lotes_com_progresso(
+        self, tmp_path, temp_csv_clientes, temp_csv_score_limite
+    ):
+        """Deve ler os perfis em lotes e informar o progresso a cada lote."""
+        perfis = tmp_path / "perfis.csv"
+        perfis.write_text(PERFIS, encoding="utf-8")
+        progresso = []
+
+        resultado = recalcular_carteira(
+            perfis,
+            ClienteService(temp_csv_clientes, temp_csv_score_limite),
+            tamanho_lote=2,
+            progresso=lambda lidos, segundos: progresso.append(lidos),
+        )
+
+        assert progresso == [2, 4, 5]
+        assert resultado["atualizados"] == 1
+
+    def test_cli(self, tmp_path, temp_csv_clientes, temp_csv_score_limite, capsys):
+        """Deve recalcular pela linha de comando e exibir o resumo."""
+        perfis = tmp_path / "perfis.csv"
+        perfis.write_text(PERFIS, encoding="utf-8")
+
+        main(
+            [str(perfis), "--clientes", temp_csv_clientes, "--score-limite", temp_csv_score_limite]
+        )
+
+        assert "atualizados: 1" in capsys.readouterr().out
+        assert ClienteService(temp_csv_clientes).buscar_por_cpf("98765432100").score == 649
@@ -0,0 +1,118 @@
+"""Testes unitários para os provedores de câmbio e o transporte de replay."""
+
+import time
+
+import httpx
+import pytest
+
+from app.services.cache_cotacoes import CacheCotacoes
+from app.services.cambio_service import CambioAPIIndisponivelError, CambioService
+from app.services.disjuntor import Disjuntor
+from app.services.provedores_cambio import SerpApiProvedor, obter_provedor_cambio
+from app.services.replay_cambio import TransporteReplay
+
+GRAVACOES = {
+    "1 USD to BRL": {"answer_box": {"result": "5,43 Real brasileiro"}},
+    "1 EUR to BRL": {"knowledge_graph": {"description": "6,32 Real brasileiro"}},
+}
+
+
+def _service(transporte: TransporteReplay, provedor=None) -> CambioService:
+    return CambioService(
+        cache=CacheCotacoes(ttl=0, janela_stale=0),
+        cliente=httpx.Client(transport=transporte),
+        cliente_async=httpx.AsyncClient(transport=transporte),
+        disjuntor=Disjuntor(),
+        provedor=provedor,
+    )
+
+
+class TestProvedoresCambio:
+    """Testes para a seleção do provedor de câmbio."""
+
+    def test_provedor_padrao_e_url_configuravel(self):
+        """Deve usar a SerpAPI por padrão e aceitar outra URL."""
+        assert isinstance(obter_provedor_cambio(), SerpApiProvedor)
+        assert SerpApiProvedor("http://localhost:9000/search.json").url == (
+            "http://localhost:9000/search.json"
+        )
+
+    def test_provedor_desconhecido(self):
+        """Deve rejeitar um provedor não cadastrado."""
+        with pytest.raises(ValueError, match="desconhecido"):
+            obter_provedor_cambio("inexistente")
+
+    def test_service_consulta_url_do_provedor(self):
+        """Deve enviar a consulta para a URL do provedor configurado."""
+        urls = []
+
+        def responder(request):
+            urls.append(request.url.host)
+            return httpx.Response(200, json=GRAVACOES["1 USD to BRL"])
+
+        service = _service(
+            httpx.MockTransport(responder), SerpApiProvedor("http://replay.local/search.json")
+        )
+
+        assert service.obter_cotacao_sync("USD", "BRL").valor == 5.43
+        assert urls == ["replay.local"]
+
+
+class TestTransporteReplay:
+    """Testes para o transporte que reproduz respostas gravadas."""
+
+    def test_reproduz_gravacoes(self):
+        """Deve responder cada consulta com a resposta gravada."""
+        transporte = TransporteReplay(GRAVACOES)
+        service = _service(transporte)
+
+        assert service.obter_cotacao_sync("USD", "BRL").valor == 5.43
+        assert service.obter_cotacao_sync("EUR", "BRL").valor == 6.32
+        assert transporte.requisicoes == 2
+
+    def test_consulta_sem_gravacao(self):
+        """Deve falhar com 404 quando não há gravação para a consulta."""
+        with httpx.Client(transport=TransporteReplay(GRAVACOES)) as cliente:
+            response = cliente.get("http://replay.local/search.json", params={"q": "1 XYZ to BRL"})
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("erro", ["503", "timeout"])
+    def test_injecao_de_erros(self, erro):
+        """Deve simular a API fora do ar com a taxa de erro configurada."""
+        service = _service(TransporteReplay(GRAVACOES, taxa_erro=1.0, erro=erro))
+
+        with pytest.raises(CambioAPIIndisponivelError):
+            service.obter_cotacao_sync("USD", "BRL")
+
+    @pytest.mark.parametrize("corpo", [[{"answer_box": {"result": "5,43"}}], "5,43", None])
+    def test_resposta_que_nao_e_objeto(self, corpo):
+        """Um corpo JSON que não é objeto deve resultar em API indisponível."""
+        service = _service(TransporteReplay({"1 USD to BRL": corpo}))
+
+        with pytest.raises(CambioAPIIndisponivelError):
+            service.obter_cotacao_sync("USD", "BRL")
+
+    def test_taxa_de_erro_parcial_reprodutivel(self):
+        """Com a mesma semente, deve falhar nas mesmas requisições."""
+
+        def falhas(semente):
+            transporte = TransporteReplay(GRAVACOES, taxa_erro=0.3, semente=semente)
+            with httpx.Client(transport=transporte) as cliente:
+                return [
+                    cliente.get("http://r/", params={"q": "1 USD to BRL"}).status_code
+                    for _ in range(50)
+                ]
+
+        resultado = falhas(7)
+        assert resultado == falhas(7)
+        assert 0 < resultado.count(503) < 50
+
+    @pytest.mark.asyncio
+    async def test_latencia_no_caminho_assincrono(self):
+        """Deve aplicar a latência também no cliente assíncrono."""
+        service = _service(TransporteReplay(GRAVACOES, latencia=0.05))
+        inicio = time.perf_counter()
+
+        assert (await service.obter_cotacao("USD", "BRL")).valor == 5.43
+        assert time.perf_counter() - inicio >= 0.05
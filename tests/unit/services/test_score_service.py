@@ -1,5 +1,7 @@
 """Testes unitários para ScoreService."""
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from app.services import ScoreService
@@ -219,3 +221,78 @@ class TestScoreServiceCalcularScore:
         )
 
         assert score_3_deps == score_5_deps
+
+
+class TestScoreServiceCalcularScoresBatch:
+    """Testes para o método calcular_scores_batch."""
+
+    def test_igual_ao_calculo_individual(self):
+        """Deve retornar os mesmos scores que calcular_score, linha a linha."""
+        service = ScoreService()
+        rng = np.random.default_rng(42)
+        n = 2000
+        dados = {
+            "renda_mensal": rng.uniform(0, 50000, n).round(2),
+            "tipo_emprego": np.array(
+                [TipoEmprego.FORMAL, TipoEmprego.AUTONOMO, TipoEmprego.DESEMPREGADO],
+                dtype=object,
+            )[rng.integers(0, 3, n)],
+            "despesas_fixas": rng.uniform(0, 20000, n).round(2),
+            "num_dependentes": rng.integers(0, 6, n),
+            "tem_dividas": rng.integers(0, 2, n).astype(bool),
+        }
+
+        scores = service.calcular_scores_batch(dados)
+
+        esperado = [
+            service.calcular_score(
+                renda_mensal=float(dados["renda_mensal"][i]),
+                tipo_emprego=dados["tipo_emprego"][i],
+                despesas_fixas=float(dados["despesas_fixas"][i]),
+                num_dependentes=int(dados["num_dependentes"][i]),
+                tem_dividas=bool(dados["tem_dividas"][i]),
+            )
+            for i in range(n)
+        ]
+        assert scores.tolist() == esperado
+
+    def test_lista_de_enums(self):
+        """Deve aceitar listas simples de TipoEmprego, sem array de objetos."""
+        service = ScoreService()
+        tipos = [TipoEmprego.FORMAL, TipoEmprego.AUTONOMO, TipoEmprego.DESEMPREGADO]
+        dados = {
+            "renda_mensal": [5000.0, 5000.0, 5000.0],
+            "tipo_emprego": tipos,
+            "despesas_fixas": [1000.0, 1000.0, 1000.0],
+            "num_dependentes": [0, 1, 3],
+            "tem_dividas": [False, True, False],
+        }
+
+        scores = service.calcular_scores_batch(dados)
+
+        esperado = [
+            service.calcular_score(
+                renda_mensal=5000.0,
+                tipo_emprego=tipos[i],
+                despesas_fixas=1000.0,
+                num_dependentes=dados["num_dependentes"][i],
+                tem_dividas=dados["tem_dividas"][i],
+            )
+            for i in range(3)
+        ]
+        assert scores.tolist() == esperado
+
+    def test_aceita_dataframe_com_textos(self):
+        """Deve aceitar um DataFrame com o tipo de emprego como texto."""
+        service = ScoreService()
+        dados = pd.DataFrame(
+            {
+                "renda_mensal": [10000.0, 1000.0],
+                "tipo_emprego": ["formal", "desempregado"],
+                "despesas_fixas": [2000.0, 2000.0],
+                "num_dependentes": [0, 3],
+                "tem_dividas": [False, True],
+            }
+        )
+
+        assert service.calcular_scores_batch(dados).tolist() == [649, 0]
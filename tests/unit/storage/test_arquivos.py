@@ -0,0 +1,90 @@
+"""Testes unitários para travas e escrita atômica de arquivos."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.services import ClienteService
+from app.storage.arquivos import TravaArquivo, escrita_atomica
+
+
+class TestEscritaAtomica:
+    """Testes para escrita_atomica."""
+
+    def test_substitui_conteudo(self, tmp_path):
+        """Deve substituir o arquivo pelo novo conteúdo."""
+        destino = tmp_path / "dados.csv"
+        destino.write_text("antigo\n", encoding="utf-8")
+
+        with escrita_atomica(destino, "w", encoding="utf-8") as f:
+            f.write("novo\n")
+
+        assert destino.read_text(encoding="utf-8") == "novo\n"
+        assert list(tmp_path.iterdir()) == [destino]
+
+    def test_erro_preserva_original(self, tmp_path):
+        """Deve manter o arquivo original e remover o temporário em caso de erro."""
+        destino = tmp_path / "dados.csv"
+        destino.write_text("antigo\n", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            with escrita_atomica(destino, "w", encoding="utf-8") as f:
+                f.write("parcial")
+                raise RuntimeError("falha no meio da escrita")
+
+        assert destino.read_text(encoding="utf-8") == "antigo\n"
+        assert list(tmp_path.iterdir()) == [destino]
+
+
+class TestTravaArquivo:
+    """Testes para TravaArquivo."""
+
+    def test_exclusiva_entre_threads(self, tmp_path):
+        """Deve serializar escritores de threads diferentes."""
+        trava = TravaArquivo(tmp_path / "dados.lock")
+        dentro = []
+        sobreposicoes = []
+
+        def escritor():
+            for _ in range(50):
+                with trava.exclusiva():
+                    dentro.append(1)
+                    if len(dentro) > 1:
+                        sobreposicoes.append(True)
+                    dentro.pop()
+
+        threads = [threading.Thread(target=escritor) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sobreposicoes == []
+
+
+class TestClienteServiceConcorrente:
+    """Testes de escrita concorrente na base de clientes."""
+
+    def test_escritas_concorrentes_nao_se_perdem(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve preservar inclusões e atualizações feitas em paralelo."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+
+        def incluir(inicio):
+            for i in range(inicio, inicio + 10):
+                service.adicionar_cliente(f"{i:011d}", f"Cliente {i}", "1990-01-01", 500)
+
+        def atualizar():
+            for score in range(600, 620):
+                service.atualizar_score("12345678901", score)
+
+        threads = [threading.Thread(target=incluir, args=(n * 10,)) for n in range(4)]
+        threads.append(threading.Thread(target=atualizar))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        linhas = Path(temp_csv_clientes).read_text(encoding="utf-8").splitlines()
+        assert len(linhas) == 1 + 2 + 40
+        assert service.buscar_por_cpf("12345678901").score == 619
@@ -0,0 +1,111 @@
+"""Testes unitários para o snapshot colunar de clientes."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+from app.services import ClienteService
+from app.storage.indice_clientes import obter_indice_clientes
+
+
+class TestSnapshotColunar:
+    """Testes para filtros, agregados e invalidação do snapshot colunar."""
+
+    def test_filtrar_por_score_e_limite(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve retornar apenas os clientes dentro das faixas, ordenados por CPF."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+
+        assert [c.cpf for c in service.filtrar()] == ["12345678901", "98765432100"]
+        assert [c.cpf for c in service.filtrar(score_min=500)] == ["12345678901"]
+        assert [c.cpf for c in service.filtrar(limite_max=5000)] == ["98765432100"]
+        assert service.filtrar(score_min=800, limite_max=1000) == []
+
+    def test_materializa_cliente_completo(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve reconstruir todos os campos do cliente a partir das colunas."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        cliente = service.filtrar(score_min=700)[0]
+
+        assert cliente.nome == "João Silva"
+        assert cliente.data_nascimento == date(1990, 1, 1)
+        assert cliente.score == 750
+        assert cliente.limite_atual == 15000.00
+
+    def test_iterar_com_cursor_e_prefixo(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve retomar a varredura após o cursor e filtrar pelo prefixo do nome."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+
+        assert [c.cpf for c in service.iterar()] == ["12345678901", "98765432100"]
+        assert [c.cpf for c in service.iterar(after_cpf="123.456.789-01")] == ["98765432100"]
+        assert [c.cpf for c in service.iterar(after_cpf="99999999999")] == []
+        assert [c.cpf for c in service.iterar(nome_prefixo="maria")] == ["98765432100"]
+        assert [c.cpf for c in service.iterar(score_max=500, nome_prefixo="jo")] == []
+
+    def test_cursor_com_caracteres_nao_ascii(self, temp_csv_clientes, temp_csv_score_limite):
+        """Caracteres que não são dígitos ASCII no cursor devem ser ignorados."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+
+        assert [c.cpf for c in service.iterar(after_cpf="ç")] == ["12345678901", "98765432100"]
+        assert [c.cpf for c in service.iterar(after_cpf="123456789ç01")] == ["98765432100"]
+
+    def test_estatisticas(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve calcular agregados vetorizados da carteira."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        estatisticas = service.estatisticas()
+
+        assert estatisticas["total"] == 2
+        assert estatisticas["score_medio"] == 600.0
+        assert estatisticas["limite_total"] == 17000.00
+        assert service.estatisticas(score_min=1000) == {"total": 0}
+
+    def test_snapshot_reconstruido_apos_escrita(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve refletir atualizações e inclusões feitas depois do snapshot."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        primeiro = service.snapshot_colunar()
+        assert service.snapshot_colunar() is primeiro
+
+        service.atualizar_score("98765432100", 900)
+        service.adicionar_cliente("11122233344", "Pedro Oliveira", "1995-06-20", 300)
+
+        assert [c.cpf for c in service.filtrar(score_min=850)] == ["98765432100"]
+        assert len(service.snapshot_colunar()) == 3
+
+    def test_journal_aplicado_sem_reconstruir(self, temp_csv_clientes, temp_csv_score_limite):
+        """Atualizações no journal não devem republicar o snapshot; a compactação sim."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        publicado = Path(temp_csv_clientes).with_suffix(".colunar") / "atual.json"
+        service.snapshot_colunar()
+        diretorio = json.loads(publicado.read_text())["diretorio"]
+
+        service.atualizar_score("98765432100", 900)
+        assert [c.cpf for c in service.filtrar(score_min=850)] == ["98765432100"]
+        service.atualizar_limite("12345678901", 30000.0)
+        service.atualizar_score("98765432100", 200)
+        snapshot = service.snapshot_colunar()
+        assert snapshot is service.snapshot_colunar()
+        assert service.estatisticas()["score_minimo"] == 200
+        assert service.estatisticas()["limite_total"] == 32000.0
+        assert json.loads(publicado.read_text())["diretorio"] == diretorio
+
+        obter_indice_clientes(temp_csv_clientes).compactar()
+        assert service.estatisticas()["limite_total"] == 32000.0
+        assert json.loads(publicado.read_text())["diretorio"] != diretorio
+
+    def test_ignora_invalidos(self, temp_csv_score_limite, tmp_path):
+        """Deve ignorar linhas inválidas, como listar_todos."""
+        arquivo = tmp_path / "clientes.csv"
+        arquivo.write_text(
+            "cpf,nome,data_nascimento,score,limite_atual\n"
+            "12345678901,João Silva,1990-01-01,750,15000.00\n"
+            "123,CPF Inválido,1990-01-01,750,15000.00\n",
+            encoding="utf-8",
+        )
+        service = ClienteService(str(arquivo), temp_csv_score_limite)
+
+        assert len(service.snapshot_colunar()) == 1
+
+    def test_arquivo_inexistente(self, temp_csv_score_limite):
+        """Deve retornar snapshot vazio quando o arquivo não existe."""
+        service = ClienteService("/caminho/inexistente.csv", temp_csv_score_limite)
+
+        assert len(service.snapshot_colunar()) == 0
+        assert service.filtrar() == []
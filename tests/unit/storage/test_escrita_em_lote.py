@@ -0,0 +1,78 @@
+"""Testes unitários para o escritor em lote de CSV."""
+
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from app.storage.escrita_em_lote import EscritorEmLote
+
+CABECALHO = ["cpf_cliente", "valor"]
+
+
+class TestEscritorEmLote:
+    """Testes para EscritorEmLote."""
+
+    def test_grava_linhas_concorrentes_em_lotes(self, tmp_path):
+        """Deve gravar todas as linhas, com um único cabeçalho e em menos escritas."""
+        arquivo = tmp_path / "lote.csv"
+        escritor = EscritorEmLote(arquivo, CABECALHO, tamanho_lote=100, intervalo_ms=50)
+
+        with patch.object(escritor, "_gravar_lote", wraps=escritor._gravar_lote) as gravar_lote:
+            with ThreadPoolExecutor(max_workers=20) as executor:
+                list(executor.map(lambda i: escritor.gravar([f"{i:011d}", i]), range(100)))
+
+        with open(arquivo, encoding="utf-8", newline="") as f:
+            linhas = list(csv.reader(f))
+        assert linhas[0] == CABECALHO
+        assert sorted(int(valor) for _, valor in linhas[1:]) == list(range(100))
+        assert gravar_lote.call_count < 100
+
+    def test_confirma_apos_gravacao(self, tmp_path):
+        """Deve resolver o Future somente depois que a linha está no arquivo."""
+        arquivo = tmp_path / "lote.csv"
+        escritor = EscritorEmLote(arquivo, CABECALHO, intervalo_ms=0, fsync=False)
+
+        escritor.enviar(["12345678901", 1]).result(timeout=5)
+
+        assert arquivo.read_text(encoding="utf-8").splitlines()[-1] == "12345678901,1"
+
+    def test_fsync_por_lote(self, tmp_path):
+        """Deve sincronizar o arquivo em disco uma vez por lote quando configurado."""
+        escritor = EscritorEmLote(tmp_path / "lote.csv", CABECALHO, intervalo_ms=0, fsync=True)
+
+        with patch("app.storage.escrita_em_lote.os.fsync") as fsync:
+            escritor.gravar(["12345678901", 1])
+
+        fsync.assert_called_once()
+
+    def test_propaga_erro_de_gravacao(self, tmp_path):
+        """Deve repassar a quem enviou o erro que impediu a gravação do lote."""
+        escritor = EscritorEmLote(tmp_path / "inexistente" / "lote.csv", CABECALHO, intervalo_ms=0)
+
+        with pytest.raises(FileNotFoundError):
+            escritor.gravar(["12345678901", 1])
+
+    def test_atualiza_cabecalho_antigo(self, tmp_path):
+        """Deve acrescentar colunas novas ao cabeçalho de um arquivo existente."""
+        arquivo = tmp_path / "lote.csv"
+        arquivo.write_text("cpf_cliente\r\n12345678901\r\n", encoding="utf-8")
+        escritor = EscritorEmLote(arquivo, CABECALHO, intervalo_ms=0, fsync=False)
+
+        escritor.gravar(["98765432100", 2])
+
+        assert arquivo.read_text(encoding="utf-8").splitlines() == [
+            "cpf_cliente,valor",
+            "12345678901",
+            "98765432100,2",
+        ]
+
+    def test_cabecalho_incompativel(self, tmp_path):
+        """Deve recusar gravar em um arquivo com cabeçalho de outro formato."""
+        arquivo = tmp_path / "lote.csv"
+        arquivo.write_text("outro,formato\r\n", encoding="utf-8")
+        escritor = EscritorEmLote(arquivo, CABECALHO, intervalo_ms=0, fsync=False)
+
+        with pytest.raises(ValueError):
+            escritor.gravar(["98765432100", 2])
@@ -0,0 +1,66 @@
+"""Testes unitários para o histórico de cotações."""
+
+from datetime import datetime, timedelta
+
+from app.models import Cotacao
+from app.storage import HistoricoCotacoes, obter_historico_cotacoes
+
+INICIO = datetime(2025, 3, 10, 9, 0)
+
+
+def _serie(moeda: str, valores: list[float]) -> list[Cotacao]:
+    return [
+        Cotacao(
+            moeda_origem=moeda,
+            moeda_destino="BRL",
+            valor=valor,
+            data_consulta=INICIO + timedelta(minutes=i),
+        )
+        for i, valor in enumerate(valores)
+    ]
+
+
+class TestHistoricoCotacoes:
+    """Testes para HistoricoCotacoes."""
+
+    def test_ultimas_em_ordem_cronologica(self, tmp_path):
+        """Deve retornar as últimas N cotações do par, da mais antiga para a mais recente."""
+        historico = HistoricoCotacoes(tmp_path / "cotacoes.db")
+        historico.registrar(_serie("USD", [5.0, 5.1, 5.2, 5.3]) + _serie("EUR", [6.0]))
+
+        ultimas = historico.ultimas("usd", n=2)
+
+        assert [c.valor for c in ultimas] == [5.2, 5.3]
+        assert ultimas[-1].data_consulta == INICIO + timedelta(minutes=3)
+        assert historico.ultimas("GBP") == []
+
+    def test_resumo_da_janela(self, tmp_path):
+        """Deve calcular mínimo, máximo e média apenas dentro da janela."""
+        historico = HistoricoCotacoes(tmp_path / "cotacoes.db")
+        historico.registrar(_serie("USD", [4.0, 5.0, 6.0, 7.0, 100.0]))
+
+        resumo = historico.resumo(
+            "USD", inicio=INICIO + timedelta(minutes=1), fim=INICIO + timedelta(minutes=4)
+        )
+
+        assert resumo == {"quantidade": 3, "minimo": 5.0, "maximo": 7.0, "media": 6.0}
+        assert historico.resumo("USD")["quantidade"] == 5
+
+    def test_resumo_sem_cotacoes(self, tmp_path):
+        """Deve retornar valores vazios quando não há cotações na janela."""
+        historico = HistoricoCotacoes(tmp_path / "cotacoes.db")
+
+        assert historico.resumo("USD") == {
+            "quantidade": 0,
+            "minimo": None,
+            "maximo": None,
+            "media": None,
+        }
+
+    def test_persistencia_e_registro_compartilhado(self, tmp_path):
+        """Deve manter as cotações no arquivo e compartilhar o histórico por caminho."""
+        path = tmp_path / "cotacoes.db"
+        obter_historico_cotacoes(path).registrar(_serie("USD", [5.0]))
+
+        assert obter_historico_cotacoes(str(path)) is obter_historico_cotacoes(path)
+        assert [c.valor for c in HistoricoCotacoes(path).ultimas("USD")] == [5.0]
@@ -0,0 +1,80 @@
+"""Testes unitários para o índice de clientes por CPF."""
+
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from app.storage import obter_indice_clientes
+from app.storage.indice_clientes import IndiceClientes
+
+
+class TestIndiceClientes:
+    """Testes para IndiceClientes."""
+
+    def test_busca_nao_relê_arquivo(self, temp_csv_clientes):
+        """Deve responder buscas repetidas sem reabrir o CSV."""
+        indice = obter_indice_clientes(temp_csv_clientes)
+        assert indice.obter("12345678901")["nome"] == "João Silva"
+
+        with patch("builtins.open", side_effect=AssertionError("arquivo relido")):
+            assert indice.obter("98765432100")["nome"] == "Maria Santos"
+            assert indice.obter("99999999999") is None
+
+    def test_recarrega_quando_arquivo_muda(self, temp_csv_clientes):
+        """Deve recarregar o índice quando o arquivo é alterado externamente."""
+        indice = obter_indice_clientes(temp_csv_clientes)
+        assert indice.obter("11122233344") is None
+
+        with open(temp_csv_clientes, "a", encoding="utf-8") as f:
+            f.write("11122233344,Pedro Oliveira,1995-06-20,800,15000.00\n")
+
+        assert indice.obter("11122233344")["nome"] == "Pedro Oliveira"
+
+    def test_journal_novo_lido_sob_trava_compartilhada(self, temp_csv_clientes):
+        """Entradas novas do journal só devem ser lidas fora de uma compactação."""
+        indice = obter_indice_clientes(temp_csv_clientes)
+        assert indice.obter("12345678901")["score"] == "750"
+        # Outro processo grava no journal e em seguida inicia uma compactação.
+        outro = IndiceClientes(Path(temp_csv_clientes).resolve())
+        outro.atualizar_campo("12345678901", "score", "900")
+
+        resultado = []
+        with outro.trava.exclusiva():
+            leitor = threading.Thread(
+                target=lambda: resultado.append(indice.obter("12345678901")["score"])
+            )
+            leitor.start()
+            leitor.join(0.2)
+            assert leitor.is_alive()
+        leitor.join(5)
+
+        assert resultado == ["900"]
+
+    def test_indice_compartilhado_por_arquivo(self, temp_csv_clientes):
+        """Deve retornar a mesma instância para o mesmo arquivo."""
+        relativo = os.path.relpath(temp_csv_clientes)
+        assert obter_indice_clientes(temp_csv_clientes) is obter_indice_clientes(relativo)
+
+    def test_arquivo_inexistente(self, tmp_path):
+        """Deve tratar arquivo inexistente como base vazia."""
+        indice = obter_indice_clientes(tmp_path / "inexistente.csv")
+
+        assert indice.obter("12345678901") is None
+        assert indice.linhas() == []
+
+    def test_atualizar_em_lote_grava_um_snapshot(self, temp_csv_clientes):
+        """Deve aplicar as atualizações e o journal pendente em um único snapshot."""
+        indice = obter_indice_clientes(temp_csv_clientes)
+        indice.atualizar_campo("12345678901", "limite_atual", "20000.00")
+
+        atualizados = indice.atualizar_em_lote(
+            "score", {"12345678901": "800", "98765432100": "500", "99999999999": "900"}
+        )
+
+        assert atualizados == 2
+        assert indice.journal.tamanho() == 0
+        with open(temp_csv_clientes, encoding="utf-8") as f:
+            conteudo = f.read()
+        assert "12345678901,João Silva,1990-01-01,800,20000.00" in conteudo
+        assert "98765432100,Maria Santos,1985-05-15,500,2000.00" in conteudo
@@ -0,0 +1,82 @@
+"""Testes unitários para o índice de solicitações por CPF e data/hora."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from app.models import SolicitacaoCredito, StatusSolicitacao
+from app.services import SolicitacaoService
+from app.storage import solicitacoes_csv
+from app.storage.indice_solicitacoes import obter_indice_solicitacoes
+from app.storage.solicitacoes_csv import CsvSolicitacaoStorage
+
+
+class TestIndiceSolicitacoes:
+    """Testes para IndiceSolicitacoes."""
+
+    def test_listar_periodo(self, temp_csv_solicitacoes):
+        """Deve retornar as solicitações do intervalo [desde, ate)."""
+        service = SolicitacaoService(temp_csv_solicitacoes)
+
+        solicitacoes = service.listar_periodo(
+            desde=datetime(2026, 1, 18, 11, 0), ate=datetime(2026, 1, 18, 12, 0)
+        )
+        assert [s.status_pedido for s in solicitacoes] == [StatusSolicitacao.REJEITADO]
+        assert len(service.listar_periodo(desde=datetime(2026, 1, 18, 10, 30))) == 2
+        assert len(service.listar_periodo()) == 3
+        assert service.listar_periodo(desde=datetime(2027, 1, 1)) == []
+
+    def test_listar_periodo_por_cpf(self, temp_csv_solicitacoes):
+        """Deve combinar o filtro de CPF com o intervalo."""
+        service = SolicitacaoService(temp_csv_solicitacoes)
+
+        solicitacoes = service.listar_periodo(
+            ate=datetime(2026, 1, 18, 11, 0), cpf="123.456.789-01"
+        )
+        assert [s.status_pedido for s in solicitacoes] == [StatusSolicitacao.APROVADO]
+
+    def test_indexa_apenas_linhas_novas(self, temp_csv_solicitacoes):
+        """Deve indexar incrementalmente as solicitações anexadas depois da carga."""
+        storage = CsvSolicitacaoStorage(temp_csv_solicitacoes)
+        assert len(storage.listar_por_cpf("11122233344")) == 0
+
+        storage.anexar(
+            SolicitacaoCredito(
+                cpf_cliente="11122233344",
+                data_hora_solicitacao=datetime(2026, 1, 18, 9, 0),
+                limite_atual=1000.0,
+                novo_limite_solicitado=3000.0,
+                status_pedido=StatusSolicitacao.APROVADO,
+            )
+        )
+
+        assert [s.novo_limite_solicitado for s in storage.listar_por_cpf("11122233344")] == [
+            3000.0
+        ]
+        # Registrada fora de ordem, deve aparecer primeiro na ordem cronológica.
+        assert storage.listar_periodo()[0].cpf_cliente == "11122233344"
+
+    def test_le_apenas_linhas_selecionadas(self, temp_csv_solicitacoes):
+        """Não deve reconverter o arquivo inteiro para consultar um CPF."""
+        storage = CsvSolicitacaoStorage(temp_csv_solicitacoes)
+        storage.listar_por_cpf("12345678901")
+
+        with patch.object(
+            solicitacoes_csv,
+            "linha_para_solicitacao",
+            wraps=solicitacoes_csv.linha_para_solicitacao,
+        ) as conversao:
+            assert len(storage.listar_por_cpf("98765432100")) == 1
+        assert conversao.call_count == 1
+
+    def test_reconstroi_quando_arquivo_substituido(self, temp_csv_solicitacoes):
+        """Deve reconstruir o índice quando o arquivo é truncado ou trocado."""
+        indice = obter_indice_solicitacoes(temp_csv_solicitacoes)
+        assert len(indice.linhas_por_cpf("12345678901")) == 2
+
+        with open(temp_csv_solicitacoes, "w", encoding="utf-8", newline="") as f:
+            f.write(
+                "cpf_cliente,data_hora_solicitacao,limite_atual,"
+                "novo_limite_solicitado,status_pedido\n"
+            )
+
+        assert indice.linhas_por_cpf("12345678901") == []
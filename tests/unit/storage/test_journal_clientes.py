@@ -0,0 +1,68 @@
+"""Testes unitários para o journal de atualizações de clientes."""
+
+import time
+from pathlib import Path
+
+from app.config import settings
+from app.services import ClienteService
+from app.storage import obter_indice_clientes
+
+
+class TestJournalClientes:
+    """Testes para atualizações via journal e compactação."""
+
+    def test_atualizacao_nao_reescreve_snapshot(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve gravar a atualização no journal sem alterar o CSV."""
+        original = Path(temp_csv_clientes).read_text(encoding="utf-8")
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+
+        assert service.atualizar_score("12345678901", 900) is True
+        assert service.atualizar_limite("12345678901", 30000.0) is True
+
+        assert Path(temp_csv_clientes).read_text(encoding="utf-8") == original
+        cliente = service.buscar_por_cpf("12345678901")
+        assert cliente.score == 900
+        assert cliente.limite_atual == 30000.0
+
+    def test_journal_aplicado_apos_recarga(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve reaplicar o journal quando o snapshot é recarregado."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        service.atualizar_score("98765432100", 600)
+
+        indice = obter_indice_clientes(temp_csv_clientes)
+        indice._carregar(indice._assinatura_arquivo())
+
+        assert indice.obter("98765432100")["score"] == "600"
+
+    def test_compactar_consolida_snapshot(self, temp_csv_clientes, temp_csv_score_limite):
+        """Deve gravar o journal no CSV e esvaziá-lo na compactação."""
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        service.atualizar_score("12345678901", 900)
+
+        indice = obter_indice_clientes(temp_csv_clientes)
+        indice.compactar()
+
+        assert indice.journal.tamanho() == 0
+        assert "12345678901,João Silva,1990-01-01,900,15000.00" in Path(
+            temp_csv_clientes
+        ).read_text(encoding="utf-8")
+        assert service.buscar_por_cpf("12345678901").score == 900
+
+    def test_compactacao_em_background(self, temp_csv_clientes, temp_csv_score_limite, monkeypatch):
+        """Deve disparar a compactação quando o journal atinge o limite."""
+        monkeypatch.setattr(settings, "clientes_journal_max_entradas", 2)
+        service = ClienteService(temp_csv_clientes, temp_csv_score_limite)
+        indice = obter_indice_clientes(temp_csv_clientes)
+
+        chamadas = []
+        monkeypatch.setattr(indice, "compactar", lambda: chamadas.append(True))
+
+        service.atualizar_score("12345678901", 800)
+        assert chamadas == []
+        service.atualizar_score("12345678901", 810)
+
+        for _ in range(100):
+            if chamadas:
+                break
+            time.sleep(0.01)
+        assert chamadas == [True]
@@ -0,0 +1,112 @@
+"""Testes unitários para o particionamento por período das solicitações."""
+
+import gzip
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from app.models import StatusSolicitacao
+from app.services import SolicitacaoService
+from app.storage.migrar_sqlite import migrar
+from app.storage.particoes_solicitacoes import ParticoesSolicitacoes
+
+
+class TestParticoesSolicitacoes:
+    """Testes para ParticoesSolicitacoes."""
+
+    def test_rotacionar_gera_particao_e_resumo(self, temp_csv_solicitacoes):
+        """Deve mover o período encerrado para uma partição comprimida com resumo."""
+        particoes = ParticoesSolicitacoes(temp_csv_solicitacoes)
+
+        assert particoes.rotacionar(datetime(2026, 2, 1)) == ["2026-01"]
+
+        principal = Path(temp_csv_solicitacoes).read_text(encoding="utf-8").splitlines()
+        assert len(principal) == 1
+        with gzip.open(particoes.diretorio / "2026-01.csv.gz", "rt", encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == 4
+
+        resumo = particoes.resumos()[0]
+        assert resumo["total"] == 3
+        assert resumo["por_status"] == {"aprovado": 1, "rejeitado": 1, "pendente": 1}
+        assert resumo["soma_novo_limite_solicitado"] == 65000.0
+        assert resumo["cpfs_distintos"] == 2
+        assert resumo["inicio"] == "2026-01-18T10:00:00"
+
+    def test_periodo_aberto_nao_rotaciona(self, temp_csv_solicitacoes):
+        """Não deve alterar nada quando todas as linhas são do período corrente."""
+        particoes = ParticoesSolicitacoes(temp_csv_solicitacoes)
+
+        assert particoes.rotacionar(datetime(2026, 1, 20)) == []
+        assert not particoes.existem()
+
+    def test_consultas_combinam_particoes_e_arquivo_principal(self, temp_csv_solicitacoes):
+        """Deve consultar partições encerradas e o período aberto de forma transparente."""
+        ParticoesSolicitacoes(temp_csv_solicitacoes).rotacionar(datetime(2026, 2, 1))
+        with open(temp_csv_solicitacoes, "a", encoding="utf-8", newline="") as f:
+            f.write("12345678901,2026-02-03T09:00:00,10000.0,15000.0,aprovado\n")
+
+        service = SolicitacaoService(temp_csv_solicitacoes)
+        assert len(service.listar_todas()) == 4
+        assert [s.status_pedido for s in service.listar_por_cpf("12345678901")] == [
+            StatusSolicitacao.APROVADO,
+            StatusSolicitacao.REJEITADO,
+            StatusSolicitacao.APROVADO,
+        ]
+        periodo = service.listar_periodo(desde=datetime(2026, 1, 18, 11), cpf="12345678901")
+        assert [s.novo_limite_solicitado for s in periodo] == [50000.0, 15000.0]
+
+    def test_intervalo_pula_particoes(self, temp_csv_solicitacoes):
+        """Não deve abrir partições cujo resumo está fora do intervalo consultado."""
+        ParticoesSolicitacoes(temp_csv_solicitacoes).rotacionar(datetime(2026, 2, 1))
+        service = SolicitacaoService(temp_csv_solicitacoes)
+
+        with patch.object(ParticoesSolicitacoes, "linhas") as linhas:
+            assert service.listar_periodo(desde=datetime(2026, 2, 1)) == []
+        linhas.assert_not_called()
+
+    def test_cpf_pula_particoes_sem_o_cpf(self, temp_csv_solicitacoes):
+        """Não deve abrir partições que não contêm o CPF consultado."""
+        with open(temp_csv_solicitacoes, "a", encoding="utf-8", newline="") as f:
+            f.write("11122233344,2025-12-10T09:00:00,1000.0,2000.0,aprovado\n")
+        ParticoesSolicitacoes(temp_csv_solicitacoes).rotacionar(datetime(2026, 2, 1))
+        service = SolicitacaoService(temp_csv_solicitacoes)
+
+        abertas = []
+        linhas = ParticoesSolicitacoes.linhas
+
+        def registrar(self, chave, filtro=None):
+            abertas.append(chave)
+            return linhas(self, chave, filtro)
+
+        with patch.object(ParticoesSolicitacoes, "linhas", registrar):
+            assert len(service.listar_por_cpf("11122233344")) == 1
+            assert len(service.listar_por_cpf("12345678901")) == 2
+            assert service.listar_por_cpf("00000000000") == []
+        assert abertas == ["2025-12", "2026-01"]
+
+    def test_cpfs_de_particao_sem_arquivo_de_cpfs(self, temp_csv_solicitacoes):
+        """Partições antigas, sem o arquivo de CPFs, devem continuar consultáveis."""
+        particoes = ParticoesSolicitacoes(temp_csv_solicitacoes)
+        particoes.rotacionar(datetime(2026, 2, 1))
+        (particoes.diretorio / "2026-01.cpfs").unlink()
+
+        assert "12345678901" in ParticoesSolicitacoes(temp_csv_solicitacoes).cpfs("2026-01")
+
+    def test_rotacao_repetida_nao_duplica(self, temp_csv_solicitacoes):
+        """Deve acrescentar linhas tardias à partição existente sem duplicar as antigas."""
+        particoes = ParticoesSolicitacoes(temp_csv_solicitacoes)
+        particoes.rotacionar(datetime(2026, 2, 1))
+        with open(temp_csv_solicitacoes, "a", encoding="utf-8", newline="") as f:
+            f.write("98765432100,2026-01-31T23:00:00,2000.0,3000.0,aprovado\n")
+
+        assert particoes.rotacionar(datetime(2026, 2, 1)) == ["2026-01"]
+        assert particoes.resumos()[0]["total"] == 4
+
+    def test_migracao_inclui_particoes(self, tmp_path, temp_csv_solicitacoes):
+        """Deve migrar para o SQLite também as partições encerradas."""
+        ParticoesSolicitacoes(temp_csv_solicitacoes).rotacionar(datetime(2026, 2, 1))
+
+        assert migrar(tmp_path / "inexistente.csv", temp_csv_solicitacoes, tmp_path / "p.db") == (
+            0,
+            3,
+        )
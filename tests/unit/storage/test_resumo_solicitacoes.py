@@ -0,0 +1,123 @@
+"""Testes unitários para os agregados diários de solicitações."""
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+from app.models import SolicitacaoCredito, StatusSolicitacao
+from app.services import SolicitacaoService
+from app.storage.particoes_solicitacoes import ParticoesSolicitacoes
+from app.storage.resumo_solicitacoes import ResumoSolicitacoes
+from app.storage.solicitacoes_csv import CsvSolicitacaoStorage
+
+
+class TestResumoSolicitacoes:
+    """Testes para ResumoSolicitacoes e os agregados mantidos pelo storage CSV."""
+
+    def test_totais_por_periodo(self):
+        """Deve somar apenas os dias do período, com as datas inclusivas."""
+        resumo = ResumoSolicitacoes()
+        resumo.adicionar("2026-01-18T10:00:00", "aprovado", 750, 5000.0, 10000.0)
+        resumo.adicionar("2026-01-19T10:00:00", "rejeitado", 450, 2000.0, 50000.0)
+        resumo.adicionar("2026-01-20T10:00:00", "aprovado", None, 500.0, 600.0)
+
+        totais = resumo.recortar(date(2026, 1, 18), date(2026, 1, 19)).totais()
+
+        assert totais["total"] == 2
+        assert totais["por_status"] == {"aprovado": 1, "rejeitado": 1}
+        assert totais["por_score"] == {750: {"aprovado": 1}, 450: {"rejeitado": 1}}
+        assert totais["novo_limite_solicitado"]["10000-20000"] == 1
+        assert totais["aumento"][">=5"] == 1
+        assert totais["media_limite_atual"] == 3500.0
+
+    def test_combinar_nao_altera_origem(self):
+        """Deve somar os contadores sem modificar o resumo de origem."""
+        origem = ResumoSolicitacoes()
+        origem.adicionar("2026-01-18T10:00:00", "aprovado", 750, 5000.0, 10000.0)
+        destino = ResumoSolicitacoes()
+        destino.combinar(origem)
+        destino.combinar(origem)
+
+        assert destino.totais()["total"] == 2
+        assert origem.totais()["total"] == 1
+
+    def test_agregados_incrementais(self, temp_csv_solicitacoes):
+        """Deve agregar apenas as linhas registradas desde a última consulta."""
+        storage = CsvSolicitacaoStorage(temp_csv_solicitacoes)
+        assert storage.resumo().totais()["total"] == 3
+
+        def anexar(data_hora: datetime) -> None:
+            storage.anexar(
+                SolicitacaoCredito(
+                    cpf_cliente="11122233344",
+                    data_hora_solicitacao=data_hora,
+                    limite_atual=1000.0,
+                    novo_limite_solicitado=3000.0,
+                    status_pedido=StatusSolicitacao.APROVADO,
+                    score=800,
+                )
+            )
+
+        with patch.object(ParticoesSolicitacoes, "agendar_rotacao"):
+            # A primeira gravação acrescenta a coluna score ao cabeçalho antigo.
+            anexar(datetime(2026, 1, 19, 9, 0))
+            assert storage.resumo().totais()["total"] == 4
+            anexar(datetime(2026, 1, 19, 10, 0))
+
+        original = ResumoSolicitacoes.adicionar_linha
+        agregadas = []
+
+        def contar(resumo, row):
+            agregadas.append(row)
+            original(resumo, row)
+
+        with patch.object(ResumoSolicitacoes, "adicionar_linha", contar):
+            totais = storage.resumo(desde=date(2026, 1, 19)).totais()
+
+        assert len(agregadas) == 1
+        assert totais["total"] == 2
+        assert totais["por_score"] == {800: {"aprovado": 2}}
+
+    def test_agregados_com_particoes(self, temp_csv_solicitacoes):
+        """Deve combinar os agregados das partições encerradas com o período aberto."""
+        ParticoesSolicitacoes(temp_csv_solicitacoes).rotacionar(datetime(2026, 2, 1))
+        with open(temp_csv_solicitacoes, "a", encoding="utf-8", newline="") as f:
+            f.write("12345678901,2026-02-03T09:00:00,10000.0,15000.0,aprovado,780\n")
+
+        storage = CsvSolicitacaoStorage(temp_csv_solicitacoes)
+
+        assert storage.resumo().totais()["por_status"] == {
+            "aprovado": 2,
+            "rejeitado": 1,
+            "pendente": 1,
+        }
+        assert storage.resumo(desde=date(2026, 2, 1)).totais()["total"] == 1
+
+
+class TestSolicitacaoServiceEstatisticas:
+    """Testes para SolicitacaoService.estatisticas."""
+
+    def test_taxa_aprovacao_por_faixa(self, tmp_path, temp_csv_score_limite):
+        """Deve calcular a taxa de aprovação por faixa de score da tabela score_limite."""
+        arquivo = tmp_path / "solicitacoes.csv"
+        arquivo.write_text(
+            "cpf_cliente,data_hora_solicitacao,limite_atual,novo_limite_solicitado,"
+            "status_pedido,score\n"
+            "12345678901,2026-01-18T10:00:00,5000.0,10000.0,aprovado,\n"
+            "98765432100,2026-01-18T12:00:00,2000.0,5000.0,pendente,450\n"
+            "11122233344,2026-01-19T09:00:00,5000.0,10000.0,aprovado,750\n"
+            "11122233344,2026-01-19T10:00:00,5000.0,90000.0,rejeitado,760\n",
+            encoding="utf-8",
+        )
+        service = SolicitacaoService(arquivo, score_limite_path=temp_csv_score_limite)
+
+        estatisticas = service.estatisticas()
+        faixas = {f["faixa"]: f for f in estatisticas["por_faixa_score"]}
+
+        assert estatisticas["total"] == 4
+        assert estatisticas["taxa_aprovacao"] == 2 / 3
+        assert faixas["700-849"]["aprovados"] == 1
+        assert faixas["700-849"]["taxa_aprovacao"] == 0.5
+        assert faixas["300-499"]["total"] == 1
+        assert faixas["300-499"]["taxa_aprovacao"] is None
+        assert faixas["sem score"]["total"] == 1
+        assert service.estatisticas(desde=date(2026, 1, 19))["total"] == 2
@@ -0,0 +1,203 @@
+"""Testes unitários para o backend SQLite e a migração a partir dos CSVs."""
+
+import sqlite3
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.config import settings
+from app.models import SolicitacaoCredito, StatusSolicitacao
+from app.services import ClienteService, CreditoService, SolicitacaoService
+from app.storage import obter_banco_sqlite, obter_storage_clientes
+from app.storage.base import SolicitacaoStorage
+from app.storage.migrar_sqlite import MigracaoError, migrar
+from app.storage.sqlite import BancoSqlite, SqliteClienteStorage, SqliteSolicitacaoStorage
+
+
+@pytest.fixture
+def banco(tmp_path):
+    return obter_banco_sqlite(tmp_path / "banking.db")
+
+
+class TestSqliteClienteStorage:
+    """Testes do ClienteService sobre o backend SQLite."""
+
+    def test_adicionar_buscar_e_atualizar(self, banco, temp_csv_score_limite):
+        """Deve suportar o ciclo completo de operações de cliente."""
+        service = ClienteService(
+            score_limite_path=temp_csv_score_limite, storage=SqliteClienteStorage(banco)
+        )
+
+        assert service.adicionar_cliente("111.222.333-44", "Pedro", "20/06/1995", 800) is True
+        assert service.adicionar_cliente("11122233344", "Pedro", "1995-06-20", 800) is False
+        assert service.atualizar_score("11122233344", 870) is True
+        assert service.atualizar_limite("11122233344", 40000.0) is True
+        assert service.atualizar_score("99999999999", 870) is False
+
+        cliente = service.buscar_por_cpf("11122233344")
+        assert cliente.score == 870
+        assert cliente.limite_atual == 40000.0
+        assert [c.cpf for c in service.listar_todos()] == ["11122233344"]
+
+    def test_atualizar_scores_em_lote(self, banco, temp_csv_score_limite):
+        """Deve atualizar vários scores em uma transação."""
+        service = ClienteService(
+            score_limite_path=temp_csv_score_limite, storage=SqliteClienteStorage(banco)
+        )
+        service.adicionar_cliente("11122233344", "Pedro", "1995-06-20", 800)
+        service.adicionar_cliente("55566677788", "Ana", "1990-01-01", 500)
+
+        assert service.atualizar_scores({"11122233344": 850, "99999999999": 900}) == 1
+        assert service.buscar_por_cpf("11122233344").score == 850
+        assert service.buscar_por_cpf("55566677788").score == 500
+
+    def test_atualizar_scores_apenas_maiores(self, banco, temp_csv_score_limite):
+        """Com apenas_maiores, nenhum score deve ser reduzido."""
+        service = ClienteService(
+            score_limite_path=temp_csv_score_limite, storage=SqliteClienteStorage(banco)
+        )
+        service.adicionar_cliente("11122233344", "Pedro", "1995-06-20", 800)
+        service.adicionar_cliente("55566677788", "Ana", "1990-01-01", 500)
+
+        atualizados = service.atualizar_scores(
+            {"11122233344": 750, "55566677788": 600}, apenas_maiores=True
+        )
+
+        assert atualizados == 1
+        assert service.buscar_por_cpf("11122233344").score == 800
+        assert service.buscar_por_cpf("55566677788").score == 600
+
+    def test_backend_configurado(self, tmp_path, monkeypatch):
+        """Deve usar SQLite quando configurado em settings."""
+        monkeypatch.setattr(settings, "storage_backend", "sqlite")
+        monkeypatch.setattr(settings, "sqlite_path", str(tmp_path / "config.db"))
+
+        assert isinstance(obter_storage_clientes(tmp_path / "clientes.csv"), SqliteClienteStorage)
+
+
+class TestSqliteSolicitacaoStorage:
+    """Testes das solicitações sobre o backend SQLite."""
+
+    def test_registrar_e_listar(self, banco, temp_csv_score_limite):
+        """Deve registrar solicitações e listá-las por CPF."""
+        storage = SqliteSolicitacaoStorage(banco)
+        credito = CreditoService(score_limite_path=temp_csv_score_limite, storage=storage)
+        credito.registrar_solicitacao("12345678901", 5000.0, 10000.0, 750)
+        credito.registrar_solicitacao("98765432100", 2000.0, 50000.0, 450)
+
+        service = SolicitacaoService(storage=storage)
+        assert len(service.listar_todas()) == 2
+        assert [s.novo_limite_solicitado for s in service.listar_por_cpf("123.456.789-01")] == [
+            10000.0
+        ]
+
+    def test_listar_periodo(self, tmp_path, temp_csv_solicitacoes):
+        """Deve filtrar por intervalo e CPF no banco."""
+        destino = tmp_path / "periodo.db"
+        migrar(tmp_path / "inexistente.csv", temp_csv_solicitacoes, destino)
+        service = SolicitacaoService(storage=SqliteSolicitacaoStorage(obter_banco_sqlite(destino)))
+
+        assert len(service.listar_periodo(desde=datetime(2026, 1, 18, 10, 30))) == 2
+        assert len(service.listar_periodo(ate=datetime(2026, 1, 18, 11), cpf="12345678901")) == 1
+        assert len(service.listar_periodo()) == 3
+
+    def test_resumo_e_score(self, banco, temp_csv_score_limite):
+        """Deve gravar o score da solicitação e agregá-lo por dia no banco."""
+        storage = SqliteSolicitacaoStorage(banco)
+        credito = CreditoService(score_limite_path=temp_csv_score_limite, storage=storage)
+        credito.registrar_solicitacao("12345678901", 5000.0, 10000.0, 750)
+        credito.registrar_solicitacao("98765432100", 2000.0, 50000.0, 450)
+
+        assert storage.listar()[0].score == 750
+        totais = storage.resumo(desde=date.today(), ate=date.today()).totais()
+        assert totais["por_score"] == {750: {"aprovado": 1}, 450: {"rejeitado": 1}}
+
+    def test_resumo_do_agregado_igual_ao_das_linhas(self, banco):
+        """O agregado diário deve coincidir com a agregação linha a linha."""
+        storage = SqliteSolicitacaoStorage(banco)
+        for dia, limite, novo, status, score in [
+            (17, 5000.0, 10000.0, StatusSolicitacao.APROVADO, 750),
+            (17, 5000.0, 10000.0, StatusSolicitacao.APROVADO, 750),
+            (17, 0.0, 1500.0, StatusSolicitacao.PENDENTE, None),
+            (18, 2000.0, 50000.0, StatusSolicitacao.REJEITADO, 450),
+            (19, 120000.0, 130000.0, StatusSolicitacao.APROVADO, 900),
+        ]:
+            storage.anexar(
+                SolicitacaoCredito(
+                    cpf_cliente="12345678901",
+                    data_hora_solicitacao=datetime(2026, 1, dia, 10, 30),
+                    limite_atual=limite,
+                    novo_limite_solicitado=novo,
+                    status_pedido=status,
+                    score=score,
+                )
+            )
+
+        for desde, ate in [(None, None), (date(2026, 1, 17), date(2026, 1, 18))]:
+            esperado = SolicitacaoStorage.resumo(storage, desde, ate).totais()
+            assert storage.resumo(desde, ate).totais() == esperado
+        assert storage.resumo(date(2026, 1, 18), date(2026, 1, 18)).totais()["total"] == 1
+
+    def test_agregado_preenchido_em_banco_existente(self, tmp_path):
+        """Um banco criado antes do agregado deve tê-lo preenchido ao ser aberto."""
+        path = tmp_path / "antigo.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE solicitacoes (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "cpf_cliente TEXT NOT NULL, data_hora_solicitacao TEXT NOT NULL, "
+                "limite_atual REAL NOT NULL, novo_limite_solicitado REAL NOT NULL, "
+                "status_pedido TEXT NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO solicitacoes (cpf_cliente, data_hora_solicitacao, limite_atual, "
+                "novo_limite_solicitado, status_pedido) "
+                "VALUES ('12345678901', '2026-01-17T10:30:00', 5000.0, 10000.0, 'aprovado')"
+            )
+        conn.close()
+
+        totais = SqliteSolicitacaoStorage(BancoSqlite(path)).resumo().totais()
+
+        assert totais["total"] == 1
+        assert totais["por_status"] == {"aprovado": 1}
+        assert totais["por_score"] == {None: {"aprovado": 1}}
+        assert totais["aumento"]["2-3"] == 1
+
+
+class TestMigracaoSqlite:
+    """Testes para a migração CSV -> SQLite."""
+
+    def test_migrar_csvs(self, tmp_path, temp_csv_clientes, temp_csv_solicitacoes):
+        """Deve copiar clientes e solicitações para o banco."""
+        destino = tmp_path / "migrado.db"
+        assert migrar(temp_csv_clientes, temp_csv_solicitacoes, destino) == (2, 3)
+
+        banco = obter_banco_sqlite(destino)
+        assert SqliteClienteStorage(banco).obter("12345678901")["nome"] == "João Silva"
+        assert len(SqliteSolicitacaoStorage(banco).listar_por_cpf("12345678901")) == 2
+
+    def test_migrar_destino_com_dados(self, tmp_path, temp_csv_clientes, temp_csv_solicitacoes):
+        """Deve recusar destino com dados, a menos que substituir seja pedido."""
+        destino = tmp_path / "migrado.db"
+        migrar(temp_csv_clientes, temp_csv_solicitacoes, destino)
+
+        with pytest.raises(MigracaoError):
+            migrar(temp_csv_clientes, temp_csv_solicitacoes, destino)
+        assert migrar(temp_csv_clientes, temp_csv_solicitacoes, destino, substituir=True) == (2, 3)
+
+    def test_migrar_conta_so_clientes_inseridos(
+        self, tmp_path, temp_csv_clientes, temp_csv_solicitacoes
+    ):
+        """CPFs repetidos, ignorados na inserção, não devem entrar na contagem."""
+        linha = {
+            "cpf": "12345678901",
+            "nome": "João Silva",
+            "data_nascimento": "1990-01-01",
+            "score": "750",
+            "limite_atual": "15000.00",
+        }
+        with patch("app.storage.migrar_sqlite.IndiceClientes") as indice:
+            indice.return_value.linhas.return_value = [linha, dict(linha)]
+            total = migrar(temp_csv_clientes, temp_csv_solicitacoes, tmp_path / "migrado.db")
+
+        assert total == (1, 3)
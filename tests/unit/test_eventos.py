@@ -0,0 +1,94 @@
+"""Testes unitários para o log de eventos estruturados."""
+
+import logging
+
+from app.config import settings
+from app.eventos import TAMANHO_MAXIMO_VALOR, Evento, RegistroEventos, obter_eventos
+
+
+class ValorCaro:
+    """Valor que conta quantas vezes foi convertido em texto."""
+
+    def __init__(self):
+        self.conversoes = 0
+
+    def __str__(self) -> str:
+        self.conversoes += 1
+        return "caro"
+
+
+class TestEvento:
+    """Testes para a formatação dos eventos."""
+
+    def test_formata_chave_valor(self):
+        """Deve formatar o evento como nome seguido de chave=valor."""
+        evento = Evento("score.calculado", {"score": 649, "renda": 10000.0, "emprego": "formal"})
+
+        assert str(evento) == "score.calculado score=649 renda=10000.00 emprego=formal"
+
+    def test_textos_com_espacos_e_longos(self):
+        """Deve pôr entre aspas textos com espaços e truncar textos longos."""
+        evento = Evento("turno", {"mensagem": "ola mundo", "resposta": "x" * 500})
+
+        texto = str(evento)
+        assert 'mensagem="ola mundo"' in texto
+        assert f"resposta={'x' * TAMANHO_MAXIMO_VALOR}..." in texto
+
+
+class TestRegistroEventos:
+    """Testes para RegistroEventos."""
+
+    def test_nivel_desabilitado_nao_formata(self, caplog):
+        """Não deve formatar nada quando o nível está desabilitado."""
+        eventos = RegistroEventos("teste_desabilitado", nivel="WARNING")
+        valor = ValorCaro()
+
+        eventos.info("evento", valor=valor)
+
+        assert caplog.records == []
+        assert valor.conversoes == 0
+
+    def test_registro_com_campos_estruturados(self, caplog):
+        """Deve expor nome e campos do evento no registro de log."""
+        eventos = RegistroEventos("teste_campos")
+
+        with caplog.at_level(logging.INFO, logger="app.eventos.teste_campos"):
+            eventos.info("tool.aumento_aprovado", novo_limite=8000.0)
+
+        registro = caplog.records[0]
+        assert registro.evento == "tool.aumento_aprovado"
+        assert registro.campos == {"novo_limite": 8000.0}
+        assert registro.getMessage() == "tool.aumento_aprovado novo_limite=8000.00"
+        assert registro.funcName == "test_registro_com_campos_estruturados"
+
+    def test_amostragem_nao_descarta_avisos(self, caplog):
+        """Deve amostrar eventos INFO/DEBUG, mas sempre registrar avisos e erros."""
+        eventos = RegistroEventos("teste_amostragem", amostragem=0.0)
+
+        with caplog.at_level(logging.DEBUG, logger="app.eventos.teste_amostragem"):
+            eventos.info("descartado")
+            eventos.warning("mantido")
+
+        assert [r.evento for r in caplog.records] == ["mantido"]
+
+    def test_configuracao_por_subsistema(self, monkeypatch):
+        """Deve aplicar nível e amostragem configurados para o subsistema."""
+        monkeypatch.setattr(settings, "log_niveis", {"teste_config": "error"})
+        monkeypatch.setattr(settings, "log_amostragem", {"teste_config": 0.5})
+
+        eventos = obter_eventos("teste_config")
+
+        assert eventos is obter_eventos("teste_config")
+        assert eventos.logger.level == logging.ERROR
+        assert eventos.amostragem == 0.5
+        assert not eventos.habilitado(logging.WARNING)
+
+    def test_nivel_invalido_usa_padrao(self, monkeypatch, caplog):
+        """Um nível inválido em LOG_NIVEIS deve ser ignorado com um aviso."""
+        monkeypatch.setattr(settings, "log_niveis", {"teste_nivel_invalido": "verboso"})
+
+        with caplog.at_level(logging.WARNING, logger="app.eventos"):
+            eventos = obter_eventos("teste_nivel_invalido")
+
+        assert eventos.logger.level == logging.NOTSET
+        assert "teste_nivel_invalido" in caplog.text